@@ -4,6 +4,15 @@ cdef extern from "libretro.h":
 	ctypedef void* const_void_pointer "const void*"
 	ctypedef short int16_t "int16_t"
 	ctypedef int16_t* const_int16_t_pointer "const int16_t*"
+
+	enum:
+		RETRO_DEVICE_MASK
+		RETRO_DEVICE_NONE
+		RETRO_DEVICE_JOYPAD
+		RETRO_DEVICE_MOUSE
+		RETRO_DEVICE_KEYBOARD
+		RETRO_DEVICE_LIGHTGUN
+
 	cdef struct retro_message:
 		const_char_pointer msg
 		unsigned frames
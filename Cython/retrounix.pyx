@@ -22,26 +22,211 @@ cdef extern from "libretro.h":
 cdef extern from "unconst.cpp":
 	void *unconst_void_pointer(const_void_pointer test)
 	void *unconst_int16_t_pointer(const_int16_t_pointer test)
+cdef extern from "threadlocal.cpp" nogil:
+	void *get_active_context()
+	void set_active_context(void *context)
 cdef extern from "numpy/arrayobject.h":
 	cdef object PyArray_SimpleNewFromData(int nd, npy_intp *dims,
                                            int typenum, void *data)
+	ctypedef struct PyTypeObject
+	cdef object PyArray_New(PyTypeObject *subtype, int nd, npy_intp *dims, int typenum,
+							npy_intp *strides, void *data, int itemsize,
+							int flags, void *obj)
+cdef extern from "string.h" nogil:
+	void *memcpy(void *dest, const_void_pointer src, size_t n)
+	void *memset(void *dest, int c, size_t n)
+	size_t strlen(const_char_pointer s)
+	int strcmp(const_char_pointer a, const_char_pointer b)
+	char *strchr(const_char_pointer s, int c)
+cdef extern from "time.h" nogil:
+	ctypedef long time_t
+	ctypedef int clockid_t
+	cdef struct timespec:
+		time_t tv_sec
+		long tv_nsec
+	enum:
+		CLOCK_MONOTONIC
+	int clock_gettime(clockid_t clock, timespec *ts)
+cdef extern from "stdlib.h" nogil:
+	void *malloc(size_t size)
+	void *realloc(void *ptr, size_t size)
+	void free(void *ptr)
+
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE, PyBUF_WRITABLE
+
+import numpy
 
 from libcpp cimport bool
 
+from retro.exceptions import RetroException
+
+cdef int get_buffer(data, Py_buffer *view, int flags) except -1:
+	"""
+	Like PyObject_GetBuffer(), but also accepts objects which only have the
+	old buffer interface, such as mmap on Python 2, through a numpy array
+	sharing their memory.
+	"""
+	try:
+		return PyObject_GetBuffer(data, view, flags)
+	except TypeError:
+		pass
+	return PyObject_GetBuffer(numpy.frombuffer(data, numpy.uint8), view, flags)
+
+cdef class CoreDef
+
+# A core option (a "variable" in libretro API version 1). The strings belong
+# to the context that holds the option.
+cdef struct core_option:
+	char *key
+	# The core's "Description; first|second|..." string, or NULL until the
+	# core declares the option.
+	char *description
+	# The selected value, or NULL if there is none.
+	char *value
+	# Whether the value was selected from Python, rather than being the
+	# core's default.
+	bint selected
+
+# Per-core callback state. The trampolines below are shared by every loaded
+# library, so whichever CoreDef is currently calling into its core selects its
+# own context first and the trampolines dispatch through it. The selected
+# context is per thread, so different cores can run on different threads.
+cdef struct callback_context:
+	void *owner
+	# Whether each callback has a Python function to call, so the trampolines
+	# can tell without taking the GIL.
+	bint has_environment
+	bint has_video_refresh
+	bint has_audio_sample
+	bint has_audio_sample_batch
+	bint has_input_poll
+	bint has_input_state
+	# Video capture ring, see CoreDef.retro_set_video_capture(). Frames are
+	# copied here instead of being passed to the video refresh callback.
+	char *capture_frames
+	unsigned *capture_sizes
+	size_t capture_slots
+	size_t capture_slot_size
+	size_t capture_row_size
+	unsigned capture_max_height
+	unsigned long long capture_count
+	# Set while frames are being skipped; video is dropped without being
+	# captured or passed to Python.
+	bint video_skip
+	# Audio accumulator, see CoreDef.retro_set_audio_accumulate(). Samples
+	# from both audio callbacks are appended here as interleaved stereo
+	# frames instead of being passed to Python one by one.
+	bint audio_accumulate
+	int16_t *audio_buffer
+	size_t audio_frames
+	size_t audio_capacity
+	size_t audio_flush_frames
+	# Latched input, see CoreDef.retro_set_input_table(). Input queries are
+	# answered from this table instead of the input state callback.
+	int16_t *input_table
+	size_t input_frames
+	size_t input_ports
+	size_t input_slots
+	size_t input_frame
+	size_t input_next
+	bint input_advance
+	# Profile ring, see CoreDef.retro_set_profile(). While a frame is being
+	# profiled, profile_row points at its row and the trampolines add to it;
+	# otherwise it is NULL, and checking it is all profiling costs.
+	double *profile
+	size_t profile_slots
+	unsigned long long profile_count
+	double profile_epoch
+	double *profile_row
+	# Environment state, see callenvironment(). These commands are answered
+	# from here without calling Python.
+	core_option *options
+	size_t option_count
+	size_t option_capacity
+	# All the options as "key1=value1;key2=value2", for GET_VARIABLE with a
+	# NULL key. Built when first asked for after a change.
+	char *options_string
+	bint overscan
+	bint can_dupe
+	# A bitmask of the pixel formats the core may switch to, and the one in
+	# use.
+	unsigned pixel_formats
+	unsigned pixel_format
+
+cdef inline callback_context *active_context() nogil:
+	return <callback_context *>get_active_context()
+
+# The fields of each entry in a latched input table.
+cdef enum:
+	INPUT_BUTTONS = 0
+	INPUT_X = 1
+	INPUT_Y = 2
+	INPUT_FIELDS = 3
+
+# The fields of each row of a profile ring. Each callback has its time
+# followed by its number of calls.
+cdef enum:
+	PROFILE_START = 0
+	PROFILE_TOTAL = 1
+	PROFILE_CORE = 2
+	PROFILE_ENVIRONMENT = 3
+	PROFILE_VIDEO = 5
+	PROFILE_AUDIO = 7
+	PROFILE_INPUT_POLL = 9
+	PROFILE_INPUT_STATE = 11
+	PROFILE_AUDIO_FRAMES = 13
+	PROFILE_BYTES = 14
+	PROFILE_FIELDS = 15
+
+cdef inline double profile_clock() nogil:
+	cdef timespec ts
+	clock_gettime(CLOCK_MONOTONIC, &ts)
+	return ts.tv_sec + ts.tv_nsec*1e-9
+
+cdef inline void profile_callback(callback_context *ctx, size_t field, double start) nogil:
+	"""
+	Count a call of the callback whose fields start at "field", which
+	started at "start".
+	"""
+	if ctx.profile_row != NULL:
+		ctx.profile_row[field] += profile_clock() - start
+		ctx.profile_row[field + 1] += 1
 
-global environment_func
-global video_refresh_func
-global audio_sample_func
-global audio_sample_batch_func
-global input_poll_func
-global input_state_func
+cdef inline void profile_add(callback_context *ctx, size_t field, double value) nogil:
+	"""
+	Add "value" to a field of the frame being profiled, if there still is
+	one once the callback has returned.
+	"""
+	if ctx.profile_row != NULL:
+		ctx.profile_row[field] += value
 
-environment_func=None
-video_refresh_func=None
-audio_sample_func=None
-audio_sample_batch_func=None
-input_poll_func=None
-input_state_func=None
+cdef double profile_begin(callback_context *ctx) nogil:
+	"""
+	Start profiling a frame in the next row of the ring, and return the time.
+	"""
+	cdef double *row = ctx.profile + (ctx.profile_count % ctx.profile_slots)*PROFILE_FIELDS
+	cdef double start
+	memset(row, 0, PROFILE_FIELDS*sizeof(double))
+	ctx.profile_row = row
+	start = profile_clock()
+	row[PROFILE_START] = start - ctx.profile_epoch
+	return start
+
+cdef void profile_end(callback_context *ctx, double start) nogil:
+	"""
+	Finish profiling the frame begun at "start", if one is being profiled.
+	"""
+	cdef double *row = ctx.profile_row
+	if row == NULL:
+		# The frame wasn't profiled, or profiling was turned off (or on)
+		# during it.
+		return
+	ctx.profile_row = NULL
+	row[PROFILE_TOTAL] = profile_clock() - start
+	row[PROFILE_CORE] = (row[PROFILE_TOTAL] - row[PROFILE_ENVIRONMENT]
+						 - row[PROFILE_VIDEO] - row[PROFILE_AUDIO]
+						 - row[PROFILE_INPUT_POLL] - row[PROFILE_INPUT_STATE])
+	ctx.profile_count += 1
 
 cdef class void_pointer_wrapper:
 	cdef void *_ptr
@@ -78,75 +263,533 @@ cdef class data_array:
 		numpyarray = PyArray_SimpleNewFromData(1, &size, dtype, self._ptr)
 		return numpyarray
 
-ENVIRONMENT_SET_ROTATION  = 1
-ENVIRONMENT_GET_OVERSCAN  = 2
-ENVIRONMENT_GET_CAN_DUPE  = 3
-ENVIRONMENT_GET_VARIABLE  = 4
-ENVIRONMENT_SET_VARIABLES = 5
-ENVIRONMENT_SET_MESSAGE   = 6
+ENVIRONMENT_SET_ROTATION     = 1
+ENVIRONMENT_GET_OVERSCAN     = 2
+ENVIRONMENT_GET_CAN_DUPE     = 3
+ENVIRONMENT_GET_VARIABLE     = 4
+ENVIRONMENT_SET_VARIABLES    = 5
+ENVIRONMENT_SET_MESSAGE      = 6
+ENVIRONMENT_SHUTDOWN         = 7
+ENVIRONMENT_SET_PIXEL_FORMAT = 10
+
+# The same, and the pixel formats, for use without the GIL. SET_PIXEL_FORMAT
+# and the pixel formats came after the version of libretro.h we build
+# against.
+cdef enum:
+	ENV_GET_OVERSCAN = 2
+	ENV_GET_CAN_DUPE = 3
+	ENV_GET_VARIABLE = 4
+	ENV_SET_VARIABLES = 5
+	ENV_SET_PIXEL_FORMAT = 10
+	FORMAT_0RGB1555 = 0
+	FORMAT_XRGB8888 = 1
+	FORMAT_RGB565 = 2
+	FORMAT_COUNT = 3
+
+cdef inline size_t bytes_per_pixel(callback_context *ctx) nogil:
+	return 4 if ctx.pixel_format == FORMAT_XRGB8888 else 2
+
+cdef char *copy_string(const_char_pointer string, size_t length) nogil:
+	"""
+	Return a malloc()ed, NUL-terminated copy of the first "length" bytes of
+	"string", or NULL if out of memory.
+	"""
+	cdef char *copy = <char *>malloc(length + 1)
+	if copy != NULL:
+		memcpy(copy, string, length)
+		copy[length] = 0
+	return copy
+
+cdef core_option *find_option(callback_context *ctx, const_char_pointer key) nogil:
+	cdef size_t i
+	for i in range(ctx.option_count):
+		if strcmp(ctx.options[i].key, key) == 0:
+			return &ctx.options[i]
+	return NULL
+
+cdef core_option *add_option(callback_context *ctx, const_char_pointer key) nogil:
+	"""
+	Return the option called "key", adding it if there isn't one yet.
+	Returns NULL if out of memory.
+	"""
+	cdef core_option *option = find_option(ctx, key)
+	cdef core_option *options
+	cdef size_t capacity
+	cdef char *copy
+	if option != NULL:
+		return option
+	if ctx.option_count == ctx.option_capacity:
+		capacity = ctx.option_capacity*2 if ctx.option_capacity else 16
+		options = <core_option *>realloc(ctx.options, capacity*sizeof(core_option))
+		if options == NULL:
+			return NULL
+		ctx.options = options
+		ctx.option_capacity = capacity
+	copy = copy_string(key, strlen(key))
+	if copy == NULL:
+		return NULL
+	option = &ctx.options[ctx.option_count]
+	option.key = copy
+	option.description = NULL
+	option.value = NULL
+	option.selected = False
+	ctx.option_count += 1
+	return option
+
+cdef void options_changed(callback_context *ctx) nogil:
+	free(ctx.options_string)
+	ctx.options_string = NULL
+
+cdef void set_default_value(core_option *option) nogil:
+	"""
+	Set the option's value to its first choice, from a description like
+	"Description; first|second|...", or NULL if it has none.
+	"""
+	cdef const_char_pointer choices = NULL
+	cdef const_char_pointer end
+	free(option.value)
+	option.value = NULL
+	option.selected = False
+	if option.description != NULL:
+		choices = strchr(option.description, ord(';'))
+	if choices == NULL:
+		return
+	choices += 1
+	while choices[0] == ord(' '):
+		choices += 1
+	end = strchr(choices, ord('|'))
+	option.value = copy_string(choices, <size_t>(end - choices) if end != NULL else strlen(choices))
+
+cdef bool set_variables(callback_context *ctx, cretro.retro_variable *variables) nogil:
+	cdef core_option *option
+	while variables.key != NULL:
+		option = add_option(ctx, variables.key)
+		if option == NULL:
+			return False
+		free(option.description)
+		option.description = NULL
+		if variables.value != NULL:
+			option.description = copy_string(variables.value, strlen(variables.value))
+		if not option.selected:
+			set_default_value(option)
+		variables += 1
+	options_changed(ctx)
+	return True
+
+cdef char *join_options(callback_context *ctx) nogil:
+	"""
+	Return a malloc()ed "key1=value1;key2=value2" string of the options
+	that have values, or NULL if out of memory.
+	"""
+	cdef size_t i
+	cdef size_t length = 0
+	cdef size_t size
+	cdef char *joined
+	cdef char *end
+	cdef core_option *option
+	for i in range(ctx.option_count):
+		option = &ctx.options[i]
+		if option.value != NULL:
+			length += strlen(option.key) + strlen(option.value) + 2
+	joined = <char *>malloc(length + 1)
+	if joined == NULL:
+		return NULL
+	end = joined
+	for i in range(ctx.option_count):
+		option = &ctx.options[i]
+		if option.value == NULL:
+			continue
+		if end != joined:
+			end[0] = ord(';')
+			end += 1
+		size = strlen(option.key)
+		memcpy(end, option.key, size)
+		end[size] = ord('=')
+		end += size + 1
+		size = strlen(option.value)
+		memcpy(end, option.value, size)
+		end += size
+	end[0] = 0
+	return joined
+
+cdef bool get_variable(callback_context *ctx, cretro.retro_variable *variable) nogil:
+	cdef core_option *option
+	if variable.key == NULL:
+		if ctx.options_string == NULL:
+			ctx.options_string = join_options(ctx)
+		variable.value = ctx.options_string
+		return ctx.options_string != NULL
+	option = find_option(ctx, variable.key)
+	if option == NULL or option.value == NULL:
+		variable.value = NULL
+		return False
+	variable.value = option.value
+	return True
 
-cdef bool callenvironment(unsigned cmd, void *data):
-	global environment_func
+cdef void free_options(callback_context *ctx) nogil:
+	cdef size_t i
+	for i in range(ctx.option_count):
+		free(ctx.options[i].key)
+		free(ctx.options[i].description)
+		free(ctx.options[i].value)
+	free(ctx.options)
+	ctx.options = NULL
+	ctx.option_count = 0
+	ctx.option_capacity = 0
+	options_changed(ctx)
+
+# Each trampoline checks whether the frame is being profiled, and if so
+# times the function doing its work.
+
+cdef bool callenvironment(unsigned cmd, void *data) nogil:
+	cdef callback_context *ctx = active_context()
+	cdef double start
+	cdef bool result
+	if ctx == NULL:
+		return False
+	if ctx.profile_row != NULL:
+		start = profile_clock()
+		result = environment(ctx, cmd, data)
+		profile_callback(ctx, PROFILE_ENVIRONMENT, start)
+		return result
+	return environment(ctx, cmd, data)
+
+cdef bool environment(callback_context *ctx, unsigned cmd, void *data) nogil:
+	cdef unsigned pixel_format
+	# Commands which only need state the context holds are answered here, so
+	# cores that check them every frame cost no trip into Python.
+	if cmd == ENV_GET_VARIABLE:
+		return get_variable(ctx, <cretro.retro_variable *>data)
+	elif cmd == ENV_SET_VARIABLES:
+		return set_variables(ctx, <cretro.retro_variable *>data)
+	elif cmd == ENV_GET_OVERSCAN:
+		(<bool *>data)[0] = ctx.overscan
+		return True
+	elif cmd == ENV_GET_CAN_DUPE:
+		(<bool *>data)[0] = ctx.can_dupe
+		return True
+	elif cmd == ENV_SET_PIXEL_FORMAT:
+		pixel_format = (<unsigned *>data)[0]
+		if pixel_format >= FORMAT_COUNT or not ctx.pixel_formats & (1 << pixel_format):
+			return False
+		ctx.pixel_format = pixel_format
+		return True
+	if not ctx.has_environment:
+		return False
+	with gil:
+		return callenvironment_python(ctx, cmd, data)
+
+cdef bool callenvironment_python(callback_context *ctx, unsigned cmd, void *data):
 	cdef void_pointer_wrapper datawrapper
-	if environment_func:
-		if cmd == ENVIRONMENT_SET_ROTATION:
-			return environment_func(cmd, deref(<unsigned *>data))
-
-		elif cmd == ENVIRONMENT_GET_OVERSCAN:
-			return environment_func(cmd, deref(<bint *>data))
-
-		elif cmd == ENVIRONMENT_GET_CAN_DUPE:
-			return environment_func(cmd, deref(<bint *>data))
-
-		elif cmd == ENVIRONMENT_GET_VARIABLE:
-			var = retro_variable(deref(<cretro.retro_variable*>data).key,
-								  deref(<cretro.retro_variable*>data).value)
-			return environment_func(cmd, var)
-
-		elif cmd == ENVIRONMENT_SET_VARIABLES:
-			var = retro_variable(deref(<cretro.retro_variable*>data).key,
-								  deref(<cretro.retro_variable*>data).value)
-			return environment_func(cmd, var)
-
-		elif cmd == ENVIRONMENT_SET_MESSAGE:
-			msg = retro_variable(deref(<cretro.retro_message*>data).msg,
-								  deref(<cretro.retro_variable*>data).frames)
-			return environment_func(cmd, msg)
-
-		datawrapper = void_pointer_wrapper()
-		datawrapper._ptr = data
-		return environment_func(cmd, datawrapper)
-
-cdef void callvideorefresh(const_void_pointer data, unsigned width, unsigned height, size_t pitch):
-	global video_refresh_func
-	cdef data_array datawrapper
-	if video_refresh_func:
-		datawrapper = data_array("ushort",height*width)
-		datawrapper._ptr = unconst_void_pointer(data)
-		video_refresh_func(datawrapper.get_numpy(),width,height,pitch)
-
-cdef void callaudiosample(int16_t left, int16_t right):
-	global audio_sample_func
-	if audio_sample_func:
-		audio_sample_func(left,right)
-
-cdef size_t callaudiosamplebatch(const_int16_t_pointer data, size_t frames):
-	global audio_sample_batch_func
-	cdef data_array datawrapper
+	cdef cretro.retro_message *message
+	environment_func = (<CoreDef>ctx.owner).environment_func
+	if cmd == ENVIRONMENT_SET_ROTATION:
+		return environment_func(cmd, deref(<unsigned *>data))
+
+	elif cmd == ENVIRONMENT_SET_MESSAGE:
+		message = <cretro.retro_message *>data
+		return environment_func(cmd, retro_message(message.msg, message.frames))
+
+	elif cmd == ENVIRONMENT_SHUTDOWN:
+		return environment_func(cmd, None)
+
+	datawrapper = void_pointer_wrapper()
+	datawrapper._ptr = data
+	return environment_func(cmd, datawrapper)
+
+cdef size_t capture_frame(callback_context *ctx, const_void_pointer data, unsigned width, unsigned height, size_t pitch) nogil:
+	"""
+	Copy the frame into the next slot of the capture ring, and return the
+	number of bytes copied.
+	"""
+	cdef size_t slot = ctx.capture_count % ctx.capture_slots
+	cdef size_t previous
+	cdef char *dest = ctx.capture_frames + slot*ctx.capture_slot_size
+	cdef size_t bpp = bytes_per_pixel(ctx)
+	cdef unsigned y
+	if data == NULL:
+		# A duped frame; repeat the last one so every slot is a whole frame.
+		if ctx.capture_count == 0:
+			ctx.capture_sizes[2*slot] = 0
+			ctx.capture_sizes[2*slot+1] = 0
+		else:
+			previous = (ctx.capture_count - 1) % ctx.capture_slots
+			memcpy(dest, ctx.capture_frames + previous*ctx.capture_slot_size, ctx.capture_slot_size)
+			ctx.capture_sizes[2*slot] = ctx.capture_sizes[2*previous]
+			ctx.capture_sizes[2*slot+1] = ctx.capture_sizes[2*previous+1]
+		ctx.capture_count += 1
+		return ctx.capture_slot_size
+	else:
+		if width*bpp > ctx.capture_row_size:
+			width = ctx.capture_row_size // bpp
+		if height > ctx.capture_max_height:
+			height = ctx.capture_max_height
+		for y in range(height):
+			memcpy(dest + y*ctx.capture_row_size, <const_char_pointer>data + y*pitch, width*bpp)
+		ctx.capture_sizes[2*slot] = width
+		ctx.capture_sizes[2*slot+1] = height
+	ctx.capture_count += 1
+	return height*width*bpp
+
+cdef void callvideorefresh(const_void_pointer data, unsigned width, unsigned height, size_t pitch) nogil:
+	cdef callback_context *ctx = active_context()
+	cdef double start
+	if ctx == NULL or ctx.video_skip:
+		return
+	if ctx.profile_row != NULL:
+		start = profile_clock()
+		profile_add(ctx, PROFILE_BYTES, video_refresh(ctx, data, width, height, pitch))
+		profile_callback(ctx, PROFILE_VIDEO, start)
+		return
+	video_refresh(ctx, data, width, height, pitch)
+
+cdef size_t video_refresh(callback_context *ctx, const_void_pointer data, unsigned width, unsigned height, size_t pitch) nogil:
+	"""
+	Capture the frame or pass it to Python, and return the number of bytes
+	copied.
+	"""
+	if ctx.capture_frames != NULL:
+		return capture_frame(ctx, data, width, height, pitch)
+	if ctx.has_video_refresh:
+		with gil:
+			return callvideorefresh_python(ctx, data, width, height, pitch)
+	return 0
+
+cdef size_t callvideorefresh_python(callback_context *ctx, const_void_pointer data, unsigned width, unsigned height, size_t pitch):
+	cdef CoreDef core = <CoreDef>ctx.owner
+	cdef size_t copied = 0
+	if core.video_refresh_func:
+		frame = core._video_frame(data,width,height,pitch)
+		if core.video_copy and data != NULL:
+			# The copy's rows are packed, whatever the core's pitch.
+			pitch = width*bytes_per_pixel(ctx)
+			copied = height*pitch
+		core.video_refresh_func(frame, width, height, pitch)
+	return copied
+
+cdef bint accumulate_audio(callback_context *ctx, const_int16_t_pointer data, size_t frames) nogil:
+	"""
+	Append the given stereo frames to the context's audio buffer, growing it
+	if necessary. Returns false if the buffer could not be grown.
+	"""
+	cdef size_t capacity
+	cdef int16_t *grown
+	if ctx.audio_frames + frames > ctx.audio_capacity:
+		capacity = ctx.audio_capacity*2
+		if capacity < ctx.audio_frames + frames:
+			capacity = ctx.audio_frames + frames
+		if capacity < 4096:
+			capacity = 4096
+		grown = <int16_t *>realloc(ctx.audio_buffer, capacity*2*sizeof(int16_t))
+		if grown == NULL:
+			return False
+		ctx.audio_buffer = grown
+		ctx.audio_capacity = capacity
+	memcpy(ctx.audio_buffer + 2*ctx.audio_frames, data, frames*2*sizeof(int16_t))
+	ctx.audio_frames += frames
+	return True
+
+cdef inline bint audio_flush_due(callback_context *ctx) nogil:
+	return (ctx.has_audio_sample_batch and ctx.audio_flush_frames
+			and ctx.audio_frames >= ctx.audio_flush_frames)
+
+cdef void callaudiosample(int16_t left, int16_t right) nogil:
+	cdef callback_context *ctx = active_context()
+	cdef double start
+	if ctx == NULL:
+		return
+	if ctx.profile_row != NULL:
+		start = profile_clock()
+		profile_add(ctx, PROFILE_BYTES, audio_sample(ctx, left, right))
+		profile_add(ctx, PROFILE_AUDIO_FRAMES, 1)
+		profile_callback(ctx, PROFILE_AUDIO, start)
+		return
+	audio_sample(ctx, left, right)
+
+cdef size_t audio_sample(callback_context *ctx, int16_t left, int16_t right) nogil:
+	"""
+	Accumulate the sample or pass it to Python, and return the number of
+	bytes copied.
+	"""
+	cdef int16_t frame[2]
+	if ctx.audio_accumulate:
+		frame[0] = left
+		frame[1] = right
+		accumulate_audio(ctx, frame, 1)
+		if audio_flush_due(ctx):
+			with gil:
+				(<CoreDef>ctx.owner)._flush_audio()
+		return sizeof(frame)
+	if ctx.has_audio_sample:
+		with gil:
+			audio_sample_func = (<CoreDef>ctx.owner).audio_sample_func
+			if audio_sample_func:
+				audio_sample_func(left,right)
+	return 0
+
+cdef size_t callaudiosamplebatch(const_int16_t_pointer data, size_t frames) nogil:
+	cdef callback_context *ctx = active_context()
+	cdef double start
+	if ctx == NULL:
+		return frames
+	if ctx.profile_row != NULL:
+		start = profile_clock()
+		profile_add(ctx, PROFILE_BYTES, audio_sample_batch(ctx, data, frames))
+		profile_add(ctx, PROFILE_AUDIO_FRAMES, frames)
+		profile_callback(ctx, PROFILE_AUDIO, start)
+		return frames
+	audio_sample_batch(ctx, data, frames)
+	return frames
+
+cdef size_t audio_sample_batch(callback_context *ctx, const_int16_t_pointer data, size_t frames) nogil:
+	"""
+	Accumulate the samples or pass them to Python, and return the number of
+	bytes copied.
+	"""
+	if ctx.audio_accumulate:
+		accumulate_audio(ctx, data, frames)
+		if audio_flush_due(ctx):
+			with gil:
+				(<CoreDef>ctx.owner)._flush_audio()
+		return frames*2*sizeof(int16_t)
+	if ctx.has_audio_sample_batch:
+		with gil:
+			callaudiosamplebatch_python(ctx, data, frames)
+	return 0
+
+cdef void callaudiosamplebatch_python(callback_context *ctx, const_int16_t_pointer data, size_t frames):
+	cdef npy_intp dims[2]
+	audio_sample_batch_func = (<CoreDef>ctx.owner).audio_sample_batch_func
 	if audio_sample_batch_func:
-		datawrapper = data_array("ushort",frames)
-		datawrapper._ptr = unconst_int16_t_pointer(data)
-		return audio_sample_batch_func(datawrapper.get_numpy(),frames)
-
-cdef void callinputpoll():
-	global input_poll_func
-	if input_poll_func:
-		input_poll_func()
-cdef int16_t callinputstate(unsigned port, unsigned device, unsigned index, unsigned id):
-	global input_state_func
+		dims[0] = frames
+		dims[1] = 2
+		audio_sample_batch_func(PyArray_SimpleNewFromData(2, dims, NPY_SHORT,
+								unconst_int16_t_pointer(data)), frames)
+
+cdef int16_t lookup_input(callback_context *ctx, unsigned port, unsigned device, unsigned index, unsigned id) nogil:
+	cdef int16_t *entry
+	if ctx.input_frame >= ctx.input_frames or port >= ctx.input_ports or index >= ctx.input_slots:
+		return 0
+	entry = ctx.input_table + ((ctx.input_frame*ctx.input_ports + port)*ctx.input_slots + index)*INPUT_FIELDS
+	device &= cretro.RETRO_DEVICE_MASK
+	if device == cretro.RETRO_DEVICE_MOUSE or device == cretro.RETRO_DEVICE_LIGHTGUN:
+		# The X and Y axes come first, the rest of the ids are buttons.
+		if id == 0:
+			return entry[INPUT_X]
+		elif id == 1:
+			return entry[INPUT_Y]
+	elif device != cretro.RETRO_DEVICE_JOYPAD:
+		return 0
+	if id >= 16:
+		return 0
+	return (<unsigned short>entry[INPUT_BUTTONS] >> id) & 1
+
+cdef void callinputpoll() nogil:
+	cdef callback_context *ctx = active_context()
+	cdef double start
+	if ctx == NULL:
+		return
+	if ctx.profile_row != NULL:
+		start = profile_clock()
+		input_poll(ctx)
+		profile_callback(ctx, PROFILE_INPUT_POLL, start)
+		return
+	input_poll(ctx)
+
+cdef void input_poll(callback_context *ctx) nogil:
+	if ctx.input_table != NULL and ctx.input_advance:
+		ctx.input_frame = ctx.input_next
+		ctx.input_next += 1
+	if ctx.has_input_poll:
+		with gil:
+			input_poll_func = (<CoreDef>ctx.owner).input_poll_func
+			if input_poll_func:
+				input_poll_func()
+
+cdef int16_t callinputstate(unsigned port, unsigned device, unsigned index, unsigned id) nogil:
+	cdef callback_context *ctx = active_context()
+	cdef double start
+	cdef int16_t result
+	if ctx == NULL:
+		return 0
+	if ctx.profile_row != NULL:
+		start = profile_clock()
+		result = input_state(ctx, port, device, index, id)
+		profile_callback(ctx, PROFILE_INPUT_STATE, start)
+		return result
+	return input_state(ctx, port, device, index, id)
+
+cdef int16_t input_state(callback_context *ctx, unsigned port, unsigned device, unsigned index, unsigned id) nogil:
+	if ctx.input_table != NULL:
+		return lookup_input(ctx, port, device, index, id)
+	if ctx.has_input_state:
+		with gil:
+			return callinputstate_python(ctx, port, device, index, id)
+	return 0
+
+cdef int16_t callinputstate_python(callback_context *ctx, unsigned port, unsigned device, unsigned index, unsigned id):
+	input_state_func = (<CoreDef>ctx.owner).input_state_func
 	if input_state_func:
 		return input_state_func(port,device,index,id)
+	return 0
 	
+def lut_convert(ndarray frame, ndarray lut, ndarray out):
+	"""
+	Look every pixel of a 16-bit frame up in a table of 65536 entries.
+
+	"frame" is a uint16 array of shape (height, width) whose rows may be
+	strided, and "lut" a C-contiguous uint8 array of shape (65536, size).
+	"out" is a C-contiguous uint8 array of height * width * channels bytes,
+	which receives the first "channels" bytes of each pixel's entry.
+	"""
+	cdef size_t size, channels, height, width, pitch, x, y, c
+	cdef char *src
+	cdef unsigned char *dst
+	cdef unsigned char *table
+	cdef unsigned short *row
+	if frame.ndim != 2 or frame.descr.itemsize != 2 or frame.strides[1] != 2:
+		raise ValueError("frame must be a 16-bit array of shape (height, width) "
+						 "with contiguous rows")
+	if (lut.dtype != numpy.uint8 or not lut.flags.c_contiguous
+				or lut.shape[0] != 65536):
+		raise ValueError("lut must be a C-contiguous uint8 array of 65536 entries")
+	size = lut.size // 65536
+	height = frame.shape[0]
+	width = frame.shape[1]
+	pitch = frame.strides[0]
+	if out.dtype != numpy.uint8 or not out.flags.c_contiguous:
+		raise ValueError("out must be a C-contiguous uint8 array")
+	if height * width == 0:
+		return out
+	if (out.size % (height * width) != 0
+				or <size_t>out.size // (height * width) > size):
+		raise ValueError("out must have up to %d bytes per pixel" % size)
+	channels = out.size // (height * width)
+	src = frame.data
+	dst = <unsigned char *>out.data
+	table = <unsigned char *>lut.data
+	with nogil:
+		for y in range(height):
+			row = <unsigned short *>(src + y*pitch)
+			if channels == 4 and size == 4:
+				for x in range(width):
+					memcpy(dst + x*4, table + row[x]*4, 4)
+			elif channels == 3 and size == 4:
+				# Copy whole entries, each overwriting the spare byte of the
+				# one before it.
+				for x in range(width - 1):
+					memcpy(dst + x*3, table + row[x]*4, 4)
+				memcpy(dst + (width - 1)*3, table + row[width - 1]*4, 3)
+			elif channels == 1:
+				for x in range(width):
+					dst[x] = table[row[x]*size]
+			else:
+				for x in range(width):
+					for c in range(channels):
+						dst[x*channels + c] = table[row[x]*size + c]
+			dst += width*channels
+	return out
+
 class retro_message(object):
 	def __init__(self,msg,frames):
 		self.msg = msg
@@ -195,13 +838,106 @@ class retro_game_info(object):
 #cdef object get_pyclass_from_struct(instruct, tuple parameters, classtype):
 	
 
+# Every entry point a libretro implementation has to export. They are all
+# looked up once when the library is loaded, so calling into the core costs
+# no more than an indirect call.
+cdef struct retro_core_funcs:
+	void (*retro_set_environment)(cretro.retro_environment_t)
+	void (*retro_set_video_refresh)(cretro.retro_video_refresh_t)
+	void (*retro_set_audio_sample)(cretro.retro_audio_sample_t)
+	void (*retro_set_audio_sample_batch)(cretro.retro_audio_sample_batch_t)
+	void (*retro_set_input_poll)(cretro.retro_input_poll_t)
+	void (*retro_set_input_state)(cretro.retro_input_state_t)
+	void (*retro_init)()
+	void (*retro_deinit)()
+	unsigned (*retro_api_version)()
+	void (*retro_get_system_info)(cretro.retro_system_info*)
+	void (*retro_get_system_av_info)(cretro.retro_system_av_info*)
+	void (*retro_set_controller_port_device)(unsigned, unsigned)
+	void (*retro_reset)()
+	# Safe to call without the GIL: the trampolines take it back to call
+	# into Python.
+	void (*retro_run)() nogil
+	size_t (*retro_serialize_size)()
+	bool (*retro_serialize)(void*, size_t)
+	bool (*retro_unserialize)(const_void_pointer, size_t)
+	void (*retro_cheat_reset)()
+	void (*retro_cheat_set)(unsigned, bool, const_char_pointer)
+	bool (*retro_load_game)(const_retro_game_info*)
+	bool (*retro_load_game_special)(unsigned, const_retro_game_info*, size_t)
+	void (*retro_unload_game)()
+	unsigned (*retro_get_region)()
+	void* (*retro_get_memory_data)(unsigned)
+	size_t (*retro_get_memory_size)(unsigned)
+
 cdef class CoreDef:
 	cdef void *_ptr
+	cdef retro_core_funcs funcs
+	# Python-level copies of the information structures. System info is
+	# static, AV info only changes when a game is loaded.
+	cdef object _system_info
+	cdef object _av_info
+	# Can't grow while a game is loaded, so only needs asking once per game.
+	cdef object _serialize_size
+	cdef callback_context ctx
+	cdef object environment_func
+	cdef object video_refresh_func
+	cdef object audio_sample_func
+	cdef object audio_sample_batch_func
+	cdef object input_poll_func
+	cdef object input_state_func
+	# The array last handed to the video refresh callback, and the frame it
+	# describes, so it can be handed out again while the frame doesn't move.
+	cdef object _frame_view
+	cdef const_void_pointer _frame_data
+	cdef unsigned _frame_width
+	cdef unsigned _frame_height
+	cdef size_t _frame_pitch
+	cdef bint video_copy
+	# Keep the capture arrays alive while the context points into them.
+	cdef object _capture_frames
+	cdef object _capture_sizes
+	cdef object _input_table
+	cdef object _profile
 	
 	def __cinit__(self,libname):
-
-
+		self.ctx.owner = <void *>self
+		self.ctx.can_dupe = True
+		self.ctx.pixel_formats = 1 << FORMAT_0RGB1555
 		self._ptr = cdl.dlopen(libname,1)
+		if self._ptr == NULL:
+			raise RetroException("Could not load library %r: %s" % (libname, cdl.dlerror()))
+
+		missing = []
+		self.funcs.retro_set_environment = <void (*)(cretro.retro_environment_t)>self._resolve("retro_set_environment", missing)
+		self.funcs.retro_set_video_refresh = <void (*)(cretro.retro_video_refresh_t)>self._resolve("retro_set_video_refresh", missing)
+		self.funcs.retro_set_audio_sample = <void (*)(cretro.retro_audio_sample_t)>self._resolve("retro_set_audio_sample", missing)
+		self.funcs.retro_set_audio_sample_batch = <void (*)(cretro.retro_audio_sample_batch_t)>self._resolve("retro_set_audio_sample_batch", missing)
+		self.funcs.retro_set_input_poll = <void (*)(cretro.retro_input_poll_t)>self._resolve("retro_set_input_poll", missing)
+		self.funcs.retro_set_input_state = <void (*)(cretro.retro_input_state_t)>self._resolve("retro_set_input_state", missing)
+		self.funcs.retro_init = <void (*)()>self._resolve("retro_init", missing)
+		self.funcs.retro_deinit = <void (*)()>self._resolve("retro_deinit", missing)
+		self.funcs.retro_api_version = <unsigned (*)()>self._resolve("retro_api_version", missing)
+		self.funcs.retro_get_system_info = <void (*)(cretro.retro_system_info*)>self._resolve("retro_get_system_info", missing)
+		self.funcs.retro_get_system_av_info = <void (*)(cretro.retro_system_av_info*)>self._resolve("retro_get_system_av_info", missing)
+		self.funcs.retro_set_controller_port_device = <void (*)(unsigned, unsigned)>self._resolve("retro_set_controller_port_device", missing)
+		self.funcs.retro_reset = <void (*)()>self._resolve("retro_reset", missing)
+		self.funcs.retro_run = <void (*)() nogil>self._resolve("retro_run", missing)
+		self.funcs.retro_serialize_size = <size_t (*)()>self._resolve("retro_serialize_size", missing)
+		self.funcs.retro_serialize = <bool (*)(void*,size_t)>self._resolve("retro_serialize", missing)
+		self.funcs.retro_unserialize = <bool (*)(const_void_pointer,size_t)>self._resolve("retro_unserialize", missing)
+		self.funcs.retro_cheat_reset = <void (*)()>self._resolve("retro_cheat_reset", missing)
+		self.funcs.retro_cheat_set = <void (*)(unsigned,bool,const_char_pointer)>self._resolve("retro_cheat_set", missing)
+		self.funcs.retro_load_game = <bool (*)(const_retro_game_info*)>self._resolve("retro_load_game", missing)
+		self.funcs.retro_load_game_special = <bool (*)(unsigned,const_retro_game_info*, size_t)>self._resolve("retro_load_game_special", missing)
+		self.funcs.retro_unload_game = <void (*)()>self._resolve("retro_unload_game", missing)
+		self.funcs.retro_get_region = <unsigned (*)()>self._resolve("retro_get_region", missing)
+		self.funcs.retro_get_memory_data = <void* (*)(unsigned)>self._resolve("retro_get_memory_data", missing)
+		self.funcs.retro_get_memory_size = <size_t (*)(unsigned)>self._resolve("retro_get_memory_size", missing)
+		if missing:
+			cdl.dlclose(self._ptr)
+			self._ptr = NULL
+			raise RetroException("Library %r is missing required symbols: %s" % (libname, ", ".join(missing)))
 
 		self.cretro_set_environment(callenvironment)
 		self.cretro_set_video_refresh(callvideorefresh)
@@ -210,89 +946,261 @@ cdef class CoreDef:
 		self.cretro_set_input_poll(callinputpoll)
 		self.cretro_set_input_state(callinputstate)
 
+	def __dealloc__(self):
+		if active_context() == &self.ctx:
+			set_active_context(NULL)
+		if self._ptr != NULL:
+			cdl.dlclose(self._ptr)
+		free(self.ctx.audio_buffer)
+		free_options(&self.ctx)
+
+	cdef object _audio_array(self):
+		"""
+		Return a (frames, 2) int16 view of the accumulated audio.
+		"""
+		cdef npy_intp dims[2]
+		dims[0] = self.ctx.audio_frames
+		dims[1] = 2
+		return PyArray_SimpleNewFromData(2, dims, NPY_SHORT, self.ctx.audio_buffer)
+
+	cdef void _flush_audio(self):
+		"""
+		Hand the accumulated audio to the audio batch callback, if there is
+		one, and empty the buffer.
+		"""
+		if self.audio_sample_batch_func and self.ctx.audio_frames:
+			self.audio_sample_batch_func(self._audio_array(), self.ctx.audio_frames)
+			self.ctx.audio_frames = 0
+
+	cdef void _flush_audio_timed(self):
+		"""
+		_flush_audio(), counting its time as audio callback time if the frame
+		is being profiled.
+		"""
+		cdef double start
+		if self.ctx.profile_row == NULL:
+			self._flush_audio()
+			return
+		start = profile_clock()
+		self._flush_audio()
+		if self.ctx.profile_row != NULL:
+			self.ctx.profile_row[PROFILE_AUDIO] += profile_clock() - start
+
+	cdef callback_context *_select(self):
+		"""
+		Make this core's callbacks the ones the trampolines dispatch to,
+		returning the previously active context so it can be restored.
+		"""
+		cdef callback_context *previous = active_context()
+		set_active_context(&self.ctx)
+		return previous
+
+	cdef void _restore(self, callback_context *previous):
+		set_active_context(previous)
+
+	cdef object _video_frame(self, const_void_pointer data, unsigned width, unsigned height, size_t pitch):
+		"""
+		Return a (height, width) array of the pixels in the given frame,
+		uint32 for the XRGB8888 pixel format and uint16 otherwise.
+
+		Normally this is a read-only view straight onto the core's buffer,
+		with a row stride of "pitch" bytes. In copy mode it is an array of our
+		own that the frame is copied into instead. Either way the same array
+		is reused for as long as the frame's location and size don't change,
+		and None is returned for duped frames.
+		"""
+		cdef npy_intp dims[2]
+		cdef npy_intp strides[2]
+		cdef ndarray frame
+		cdef unsigned y
+		cdef size_t bpp = bytes_per_pixel(&self.ctx)
+		if data == NULL:
+			return None
+		if self.video_copy:
+			frame = self._frame_view
+			if (frame is None or frame.shape[0] != height
+						or frame.shape[1] != width or frame.itemsize != bpp):
+				frame = numpy.empty((height, width), numpy.uint32 if bpp == 4 else numpy.uint16)
+				self._frame_view = frame
+				self._frame_data = NULL
+			for y in range(height):
+				memcpy(frame.data + y*width*bpp, <const_char_pointer>data + y*pitch, width*bpp)
+			return frame
+		if (self._frame_view is None or data != self._frame_data
+					or width != self._frame_width
+					or height != self._frame_height
+					or pitch != self._frame_pitch
+					or self._frame_view.itemsize != bpp):
+			dims[0] = height
+			dims[1] = width
+			strides[0] = pitch
+			strides[1] = bpp
+			self._frame_view = PyArray_New(<PyTypeObject *>ndarray, 2, dims,
+										   NPY_UINT if bpp == 4 else NPY_USHORT,
+										   strides, unconst_void_pointer(data),
+										   0, 0, NULL)
+			self._frame_data = data
+			self._frame_width = width
+			self._frame_height = height
+			self._frame_pitch = pitch
+		return self._frame_view
+
+	cdef void *_resolve(self, const_char_pointer name, list missing):
+		cdef void *symbol = cdl.dlsym(self._ptr, name)
+		if symbol == NULL:
+			missing.append(name)
+		return symbol
 
 	cdef void cretro_set_environment(self,cretro.retro_environment_t function):
-		func = <void (*)(cretro.retro_environment_t)>cdl.dlsym(self._ptr, "retro_set_environment")
-		func(function)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_set_environment(function)
+		self._restore(previous)
 	cdef void cretro_set_video_refresh(self,cretro.retro_video_refresh_t function):
-		func = <void (*)(cretro.retro_video_refresh_t)>cdl.dlsym(self._ptr, "retro_set_video_refresh")
-		func(function)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_set_video_refresh(function)
+		self._restore(previous)
 	cdef void cretro_set_audio_sample(self,cretro.retro_audio_sample_t function):
-		func = <void (*)(cretro.retro_audio_sample_t)>cdl.dlsym(self._ptr, "retro_set_audio_sample")
-		func(function)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_set_audio_sample(function)
+		self._restore(previous)
 	cdef void cretro_set_audio_sample_batch(self,cretro.retro_audio_sample_batch_t function):
-		func = <void (*)(cretro.retro_audio_sample_batch_t)>cdl.dlsym(self._ptr, "retro_set_audio_sample_batch")
-		func(function)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_set_audio_sample_batch(function)
+		self._restore(previous)
 	cdef void cretro_set_input_poll(self,cretro.retro_input_poll_t function):
-		func = <void (*)(cretro.retro_input_poll_t)>cdl.dlsym(self._ptr, "retro_set_input_poll")
-		func(function)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_set_input_poll(function)
+		self._restore(previous)
 	cdef void cretro_set_input_state(self,cretro.retro_input_state_t function):
-		func = <void (*)(cretro.retro_input_state_t)>cdl.dlsym(self._ptr, "retro_set_input_state")
-		func(function)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_set_input_state(function)
+		self._restore(previous)
 	cdef void cretro_init(self):
-		func = <void (*)()>cdl.dlsym(self._ptr, "retro_init")
-		func()
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_init()
+		self._restore(previous)
 	cdef void cretro_deinit(self):
-		func = <void (*)()>cdl.dlsym(self._ptr, "retro_deinit")
-		func()
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_deinit()
+		self._restore(previous)
 	cdef unsigned cretro_api_version(self):
-		func = <unsigned (*)()>cdl.dlsym(self._ptr, "retro_api_version")
-		return func()
+		return self.funcs.retro_api_version()
 	cdef void cretro_get_system_info(self, cretro.retro_system_info *info):
-		func = <void (*)(cretro.retro_system_info*)>cdl.dlsym(self._ptr, "retro_get_system_info")
-		func(info)
+		self.funcs.retro_get_system_info(info)
 	cdef void cretro_get_system_av_info(self, cretro.retro_system_av_info *info):
-		func = <void (*)(cretro.retro_system_av_info*)>cdl.dlsym(self._ptr, "retro_get_system_av_info")
-		func(info)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_get_system_av_info(info)
+		self._restore(previous)
 	cdef void cretro_set_controller_port_device(self,unsigned port, unsigned device):
-		func = <void (*)(unsigned, unsigned)>cdl.dlsym(self._ptr, "retro_set_controller_port_device")
-		func(port,device)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_set_controller_port_device(port,device)
+		self._restore(previous)
 	cdef cretro_reset(self):
-		func = <void (*)()>cdl.dlsym(self._ptr, "retro_reset")
-		func()
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_reset()
+		self._restore(previous)
 	cdef cretro_run(self):
-		func = <void (*)()>cdl.dlsym(self._ptr, "retro_run")
-		func()
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_run()
+		self._restore(previous)
 	cdef size_t cretro_serialize_size(self):
-		func = <size_t (*)()>cdl.dlsym(self._ptr, "retro_serialize_size")
-		return func()
+		return self.funcs.retro_serialize_size()
 	cdef bool cretro_serialize(self, void *data, size_t size):
-		func = <bool (*)(void*,size_t)>cdl.dlsym(self._ptr, "retro_serialize")
-		return func(data,size)
+		cdef callback_context *previous = self._select()
+		cdef bool result = self.funcs.retro_serialize(data,size)
+		self._restore(previous)
+		return result
 	cdef bool cretro_unserialize(self,const_void_pointer data, size_t size):
-		func = <bool (*)(const_void_pointer,size_t)>cdl.dlsym(self._ptr, "retro_unserialize")
-		return func(data,size)
+		cdef callback_context *previous = self._select()
+		cdef bool result = self.funcs.retro_unserialize(data,size)
+		self._restore(previous)
+		return result
 	cdef void cretro_cheat_reset(self):
-		func = <void (*)()>cdl.dlsym(self._ptr, "retro_cheat_reset")
-		func()
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_cheat_reset()
+		self._restore(previous)
 	cdef void cretro_cheat_set(self,unsigned index, bool enabled, const_char_pointer code):
-		func = <void (*)(unsigned,bool,const_char_pointer)>cdl.dlsym(self._ptr, "retro_cheat_set")
-		func(index, enabled, code)
+		cdef callback_context *previous = self._select()
+		self.funcs.retro_cheat_set(index, enabled, code)
+		self._restore(previous)
 	cdef bool cretro_load_game(self,const_retro_game_info *game):
-		func = <bool (*)(const_retro_game_info*)>cdl.dlsym(self._ptr, "retro_load_game")
-		return func(game)
+		cdef callback_context *previous = self._select()
+		self._av_info = None
+		self._serialize_size = None
+		# Cores that want another pixel format ask for it while loading.
+		self.ctx.pixel_format = FORMAT_0RGB1555
+		result = self.funcs.retro_load_game(game)
+		self._restore(previous)
+		return result
 	cdef bool cretro_load_game_special(self, unsigned game_type, const_retro_game_info *info, size_t num_info):
-		func = <bool (*)(unsigned,const_retro_game_info*, size_t)>cdl.dlsym(self._ptr, "retro_load_game_special")
-		return func(game_type,info,num_info)
+		cdef callback_context *previous = self._select()
+		self._av_info = None
+		self._serialize_size = None
+		self.ctx.pixel_format = FORMAT_0RGB1555
+		result = self.funcs.retro_load_game_special(game_type,info,num_info)
+		self._restore(previous)
+		return result
 	cdef void cretro_unload_game(self):
-		func = <void (*)()>cdl.dlsym(self._ptr, "retro_unload_game")
-		func()
+		cdef callback_context *previous = self._select()
+		self._av_info = None
+		self._serialize_size = None
+		self.funcs.retro_unload_game()
+		self._restore(previous)
 	cdef unsigned cretro_get_region(self):
-		func = <unsigned (*)()>cdl.dlsym(self._ptr, "retro_get_region")
-		return func()
+		return self.funcs.retro_get_region()
 	cdef data_array cretro_get_memory_data(self,unsigned id):
 		cdef data_array datawrapper
 		size = self.cretro_get_memory_size(id)
 		datawrapper = data_array("uchar",size)
-		func = <void* (*)(unsigned)>cdl.dlsym(self._ptr, "retro_get_memory_data")
-		datawrapper._ptr = func(id)
+		datawrapper._ptr = self.funcs.retro_get_memory_data(id)
 		return datawrapper
 	cdef size_t cretro_get_memory_size(self,unsigned id):
-		func = <size_t (*)(unsigned)>cdl.dlsym(self._ptr, "retro_get_memory_size")
-		return func(id)
+		return self.funcs.retro_get_memory_size(id)
 
 	def retro_get_memory_data(self,id):
-		return self.cretro_get_memory_data(id).get_numpy()
+		"""
+		Return a writable uint8 view of the given memory region, or None if
+		the game doesn't have one.
+		"""
+		datawrapper = self.cretro_get_memory_data(id)
+		if datawrapper._ptr == NULL or datawrapper.length == 0:
+			return None
+		return datawrapper.get_numpy()
+
+	def retro_read_memory(self, unsigned id, buffer, size_t offset=0):
+		"""
+		Copy the given memory region, starting "offset" bytes in, into
+		"buffer", which may be any writable contiguous buffer. Fills the
+		whole buffer.
+		"""
+		cdef Py_buffer view
+		cdef char *data = <char *>self.funcs.retro_get_memory_data(id)
+		cdef size_t size = self.cretro_get_memory_size(id)
+		get_buffer(buffer, &view, PyBUF_SIMPLE | PyBUF_WRITABLE)
+		try:
+			if data == NULL or offset > size or <size_t>view.len > size - offset:
+				raise IndexError("Reading %d bytes at %d is outside memory type %d of %d bytes"
+								 % (view.len, offset, id, size))
+			memcpy(view.buf, data + offset, view.len)
+		finally:
+			PyBuffer_Release(&view)
+
+	def retro_write_memory(self, unsigned id, buffer, size_t offset=0):
+		"""
+		Copy all of "buffer", which may be any contiguous buffer, into the
+		given memory region, starting "offset" bytes in.
+		"""
+		cdef Py_buffer view
+		cdef char *data = <char *>self.funcs.retro_get_memory_data(id)
+		cdef size_t size = self.cretro_get_memory_size(id)
+		get_buffer(buffer, &view, PyBUF_SIMPLE)
+		try:
+			if data == NULL or offset > size or <size_t>view.len > size - offset:
+				raise IndexError("Writing %d bytes at %d is outside memory type %d of %d bytes"
+								 % (view.len, offset, id, size))
+			memcpy(data + offset, view.buf, view.len)
+		finally:
+			PyBuffer_Release(&view)
 
 	def retro_get_memory_size(self,id):
 		return self.cretro_get_memory_size(id)
@@ -317,14 +1225,48 @@ cdef class CoreDef:
 	def retro_cheat_set(self, index, enabled, code):
 		self.cretro_cheat_set(index,enabled,<const_char_pointer>code)
 
-	def retro_serialize(self,data, size):
-		return self.cretro_serialize(<void *>data,size)
+	def retro_serialize(self, data, size=None):
+		"""
+		Serialize into "data", which may be any writable contiguous buffer
+		(bytearray, numpy array, mmap, ...). Writes at most "size" bytes, or
+		the whole buffer if not given.
 
-	def retro_unserialize(self,data,size):
-		return self.cretro_unserialize(<const_void_pointer>data,size)
+		Raises ValueError if the buffer is smaller than a state.
+		"""
+		cdef Py_buffer view
+		cdef bool result
+		get_buffer(data, &view, PyBUF_SIMPLE | PyBUF_WRITABLE)
+		try:
+			if <size_t>view.len < self.retro_serialize_size():
+				raise ValueError("States need %d bytes, but the buffer holds %d"
+								 % (self.retro_serialize_size(), view.len))
+			if size is None or size > view.len:
+				size = view.len
+			result = self.cretro_serialize(view.buf, size)
+		finally:
+			PyBuffer_Release(&view)
+		return result
+
+	def retro_unserialize(self, data, size=None):
+		"""
+		Unserialize from "data", which may be any contiguous buffer. Reads at
+		most "size" bytes, or the whole buffer if not given.
+		"""
+		cdef Py_buffer view
+		cdef bool result
+		get_buffer(data, &view, PyBUF_SIMPLE)
+		try:
+			if size is None or size > view.len:
+				size = view.len
+			result = self.cretro_unserialize(view.buf, size)
+		finally:
+			PyBuffer_Release(&view)
+		return result
 
 	def retro_serialize_size(self):
-		return self.cretro_serialize_size()
+		if self._serialize_size is None:
+			self._serialize_size = self.cretro_serialize_size()
+		return self._serialize_size
 
 	def retro_reset(self):
 		self.cretro_reset()
@@ -337,25 +1279,123 @@ cdef class CoreDef:
 
 	def retro_get_system_info(self):
 		cdef cretro.retro_system_info info
-		self.cretro_get_system_info(&info)
-		return retro_system_info(info.library_name,info.library_version,
-						   info.valid_extensions, info.need_fullpath,
-						   info.block_extract)
+		if self._system_info is None:
+			self.cretro_get_system_info(&info)
+			self._system_info = retro_system_info(info.library_name,info.library_version,
+							   info.valid_extensions, info.need_fullpath,
+							   info.block_extract)
+		return self._system_info
 
 	def retro_get_system_av_info(self):
 		cdef cretro.retro_system_av_info info
-		self.cretro_get_system_av_info(&info)
-		geometry = retro_game_geometry(info.geometry.base_width,
-								 info.geometry.base_height,
-								 info.geometry.max_width,
-								 info.geometry.max_height,
-								 info.geometry.aspect_ratio)
-		timing = retro_system_timing(info.timing.fps,
-							   info.timing.sample_rate)
-		return retro_system_av_info(geometry,timing)
+		if self._av_info is None:
+			self.cretro_get_system_av_info(&info)
+			geometry = retro_game_geometry(info.geometry.base_width,
+									 info.geometry.base_height,
+									 info.geometry.max_width,
+									 info.geometry.max_height,
+									 info.geometry.aspect_ratio)
+			timing = retro_system_timing(info.timing.fps,
+								   info.timing.sample_rate)
+			self._av_info = retro_system_av_info(geometry,timing)
+		return self._av_info
 
 	def retro_run(self):
+		cdef double start = 0
+		if self.ctx.profile != NULL:
+			start = profile_begin(&self.ctx)
 		self.cretro_run()
+		if self.ctx.audio_accumulate:
+			self._flush_audio_timed()
+		profile_end(&self.ctx, start)
+
+	cdef bint _callbacks_native(self):
+		"""
+		Return whether running a frame would call no Python code at all.
+		"""
+		cdef callback_context *ctx = &self.ctx
+		if ctx.has_environment or ctx.has_input_poll:
+			return False
+		if ctx.has_video_refresh and ctx.capture_frames == NULL:
+			return False
+		if ctx.has_input_state and ctx.input_table == NULL:
+			return False
+		if ctx.audio_accumulate:
+			return not (ctx.has_audio_sample_batch and ctx.audio_flush_frames)
+		return not (ctx.has_audio_sample or ctx.has_audio_sample_batch)
+
+	def retro_run_frames(self, unsigned frames):
+		"""
+		Run the given number of frames in a loop in C, without the GIL.
+
+		The GIL is only taken back to call Python callbacks. If there are none
+		(video is captured or has no callback, audio is accumulated without
+		flush_frames or has no callbacks, input comes from a table or has no
+		callbacks, and there is no environment callback) all of the frames run
+		without it, and accumulated audio is handed to the audio batch
+		callback once, after the last frame. Otherwise it is handed over
+		after every frame, as by retro_run().
+		"""
+		cdef unsigned i
+		cdef double start = 0
+		cdef callback_context *previous = self._select()
+		# Callbacks may turn profiling on or off, so check before every frame.
+		try:
+			if self._callbacks_native():
+				with nogil:
+					for i in range(frames):
+						if self.ctx.profile != NULL:
+							start = profile_begin(&self.ctx)
+						self.funcs.retro_run()
+						profile_end(&self.ctx, start)
+			else:
+				for i in range(frames):
+					if self.ctx.profile != NULL:
+						start = profile_begin(&self.ctx)
+					with nogil:
+						self.funcs.retro_run()
+					if self.ctx.audio_accumulate:
+						self._flush_audio_timed()
+					profile_end(&self.ctx, start)
+		finally:
+			self._restore(previous)
+		if self.ctx.audio_accumulate:
+			self._flush_audio()
+
+	def retro_set_profile(self, ndarray profile):
+		"""
+		Record how each frame run by retro_run() or retro_run_frames() spends
+		its time in the given array, or stop if it is None.
+
+		"profile" must be a C-contiguous float64 array of shape
+		(slots, 15). Frame n goes to row n % slots, which holds: the time the
+		frame started, in seconds since profiling started; the time spent in
+		the frame, and the part of it spent in the core itself; the time spent
+		in, and the number of calls of, the environment, video refresh, audio
+		(both kinds), input poll and input state callbacks; the number of audio
+		frames produced; and the number of bytes copied by the wrapper.
+		"""
+		self.ctx.profile_row = NULL
+		if profile is None:
+			self.ctx.profile = NULL
+			self._profile = None
+			return
+		if (profile.ndim != 2 or profile.dtype != numpy.float64
+					or not profile.flags.c_contiguous or not profile.flags.writeable
+					or profile.shape[0] == 0 or profile.shape[1] != PROFILE_FIELDS):
+			raise ValueError("profile must be a writable C-contiguous float64 array "
+							 "of shape (slots, %d)" % PROFILE_FIELDS)
+		self._profile = profile
+		self.ctx.profile = <double *>profile.data
+		self.ctx.profile_slots = profile.shape[0]
+		self.ctx.profile_count = 0
+		self.ctx.profile_epoch = profile_clock()
+
+	def retro_get_profile_count(self):
+		"""
+		Return how many frames have been profiled since profiling started.
+		"""
+		return self.ctx.profile_count
 
 	def retro_init(self):
 		self.cretro_init()
@@ -364,27 +1404,192 @@ cdef class CoreDef:
 		self.cretro_deinit()
 
 	def retro_set_environment(self, function):
-		global environment_func
-		environment_func = function	
+		self.environment_func = function
+		self.ctx.has_environment = function is not None
+
+	def retro_set_variable(self, key, value):
+		"""
+		Select "value" for the core option "key", or the core's default if
+		"value" is None. The core sees it the next time it asks.
+		"""
+		cdef core_option *option = add_option(&self.ctx, <const_char_pointer>key)
+		if option == NULL:
+			raise MemoryError()
+		if value is None:
+			set_default_value(option)
+		else:
+			free(option.value)
+			option.value = copy_string(<const_char_pointer>value, len(value))
+			if option.value == NULL:
+				raise MemoryError()
+			option.selected = True
+		options_changed(&self.ctx)
+
+	def retro_get_variables(self):
+		"""
+		Return a list of (key, description, value) tuples, one for each core
+		option, in the order they were declared or selected. "description"
+		is None for options the core hasn't declared, and "value" for options
+		without one.
+		"""
+		cdef size_t i
+		cdef core_option *option
+		variables = []
+		for i in range(self.ctx.option_count):
+			option = &self.ctx.options[i]
+			variables.append((option.key,
+							  option.description if option.description != NULL else None,
+							  option.value if option.value != NULL else None))
+		return variables
+
+	def retro_set_overscan(self, enabled):
+		self.ctx.overscan = enabled
+
+	def retro_set_can_dupe(self, enabled):
+		self.ctx.can_dupe = enabled
+
+	def retro_set_pixel_formats(self, formats):
+		"""
+		Let the core switch to any of the given pixel formats. 0RGB1555 is
+		always allowed, as it's the default.
+		"""
+		cdef unsigned mask = 1 << FORMAT_0RGB1555
+		for pixel_format in formats:
+			if not 0 <= pixel_format < FORMAT_COUNT:
+				raise ValueError("Unknown pixel format %r" % (pixel_format,))
+			mask |= 1 << pixel_format
+		self.ctx.pixel_formats = mask
+
+	def retro_get_pixel_format(self):
+		return self.ctx.pixel_format
 
-	def retro_set_video_refresh(self, function):
-		global video_refresh_func
-		video_refresh_func = function	
+	def retro_set_video_capture(self, ndarray frames, ndarray sizes):
+		"""
+		Copy every frame into the given arrays instead of calling the video
+		refresh callback, or go back to the callback if both are None.
+
+		"frames" must be a C-contiguous array of shape
+		(slots, max_height, max_width), uint32 for the XRGB8888 pixel format
+		and uint16 otherwise, and "sizes" a C-contiguous uint32 array of shape
+		(slots, 2). Frame n goes to slot n % slots, top-left aligned,
+		and its width and height to sizes[n % slots].
+		"""
+		if frames is None and sizes is None:
+			self.ctx.capture_frames = NULL
+			self.ctx.capture_sizes = NULL
+			self._capture_frames = None
+			self._capture_sizes = None
+			return
+		if (frames is None or frames.ndim != 3
+					or frames.dtype not in (numpy.uint16, numpy.uint32)
+					or not frames.flags.c_contiguous or not frames.flags.writeable
+					or frames.shape[0] == 0):
+			raise ValueError("frames must be a writable C-contiguous uint16 or uint32 "
+							 "array of shape (slots, max_height, max_width)")
+		if (sizes is None or sizes.ndim != 2 or sizes.dtype != numpy.uint32
+					or not sizes.flags.c_contiguous or not sizes.flags.writeable
+					or sizes.shape[0] != frames.shape[0] or sizes.shape[1] != 2):
+			raise ValueError("sizes must be a writable C-contiguous uint32 array "
+							 "of shape (slots, 2)")
+		self._capture_frames = frames
+		self._capture_sizes = sizes
+		self.ctx.capture_frames = frames.data
+		self.ctx.capture_sizes = <unsigned *>sizes.data
+		self.ctx.capture_slots = frames.shape[0]
+		self.ctx.capture_max_height = frames.shape[1]
+		self.ctx.capture_row_size = frames.shape[2]*frames.itemsize
+		self.ctx.capture_slot_size = frames.shape[1]*self.ctx.capture_row_size
+		self.ctx.capture_count = 0
+
+	def retro_get_video_capture_count(self):
+		"""
+		Return how many frames have been captured since capturing started.
+		"""
+		return self.ctx.capture_count
+
+	def retro_set_video_refresh(self, function, copy=False):
+		self.video_refresh_func = function
+		self.ctx.has_video_refresh = function is not None
+		self.video_copy = copy
+		self._frame_view = None
+
+	def retro_set_video_skip(self, skip):
+		"""
+		Drop every frame, without capturing it or calling the video refresh
+		callback, while "skip" is true.
+		"""
+		self.ctx.video_skip = skip
 
 	def retro_set_audio_sample(self, function):
-		global audio_sample_func
-		audio_sample_func = function	
+		self.audio_sample_func = function
+		self.ctx.has_audio_sample = function is not None
 
 	def retro_set_audio_sample_batch(self, function):
-		global audio_sample_batch_func
-		audio_sample_batch_func = function	
+		self.audio_sample_batch_func = function
+		self.ctx.has_audio_sample_batch = function is not None
+
+	def retro_set_audio_accumulate(self, enabled, flush_frames=0):
+		"""
+		Collect audio from both audio callbacks in a C buffer instead of
+		calling Python for every sample.
+
+		The audio is handed to the audio batch callback, if one is set, after
+		every retro_run() and whenever "flush_frames" frames have built up (if
+		non-zero). Otherwise it accumulates until retro_drain_audio().
+		"""
+		self.ctx.audio_accumulate = enabled
+		self.ctx.audio_flush_frames = flush_frames
+		self.ctx.audio_frames = 0
+
+	def retro_drain_audio(self):
+		"""
+		Return a (frames, 2) int16 copy of the accumulated audio and empty the
+		buffer.
+		"""
+		audio = self._audio_array().copy()
+		self.ctx.audio_frames = 0
+		return audio
 
 	def retro_set_input_poll(self, function):
-		global input_poll_func
-		input_poll_func = function	
+		self.input_poll_func = function
+		self.ctx.has_input_poll = function is not None
 
 	def retro_set_input_state(self, function):
-		global input_state_func
-		input_state_func = function	
+		self.input_state_func = function
+		self.ctx.has_input_state = function is not None
+
+	def retro_set_input_table(self, ndarray table, advance=False):
+		"""
+		Answer input queries from the given table instead of calling the input
+		state callback, or go back to the callback if the table is None.
+
+		"table" must be a C-contiguous int16 array of shape
+		(frames, ports, slots, 3). Each entry holds a bitmask of pressed
+		buttons followed by the X and Y axes. Queries are answered from the
+		first frame, unless "advance" is true, in which case every input poll
+		moves on to the next frame. Past the last frame, everything reads as 0.
+		"""
+		if table is None:
+			self.ctx.input_table = NULL
+			self._input_table = None
+			return
+		if (table.ndim != 4 or table.dtype != numpy.int16
+					or not table.flags.c_contiguous or table.shape[3] != INPUT_FIELDS):
+			raise ValueError("table must be a C-contiguous int16 array of shape "
+							 "(frames, ports, slots, %d)" % INPUT_FIELDS)
+		self._input_table = table
+		self.ctx.input_table = <int16_t *>table.data
+		self.ctx.input_frames = table.shape[0]
+		self.ctx.input_ports = table.shape[1]
+		self.ctx.input_slots = table.shape[2]
+		self.ctx.input_frame = 0
+		self.ctx.input_next = 0
+		self.ctx.input_advance = advance
+
+	def retro_get_input_frame(self):
+		"""
+		Return the frame of the input table that queries are answered from.
+		"""
+		return self.ctx.input_frame
 		
 
@@ -28,6 +28,7 @@ cdef extern from "numpy/arrayobject.h":
 from libcpp cimport bool
 
 
+# The Python callbacks, or None to do nothing (or report no input).
 global environment_func
 global video_refresh_func
 global audio_sample_func
@@ -80,6 +81,8 @@ cdef class data_array:
 cdef bool callenvironment(unsigned cmd, void *data):
 	global environment_func
 	cdef void_pointer_wrapper datawrapper
+	if environment_func is None:
+		return False
 	datawrapper = void_pointer_wrapper()
 	datawrapper._ptr = data
 	return environment_func(cmd, datawrapper)
@@ -87,26 +90,34 @@ cdef bool callenvironment(unsigned cmd, void *data):
 cdef void callvideorefresh(const_void_pointer data, unsigned width, unsigned height, size_t pitch):
 	global video_refresh_func
 	cdef data_array datawrapper
+	if video_refresh_func is None:
+		return
 	datawrapper = data_array("ushort",height*width)
 	datawrapper._ptr = unconst_void_pointer(data)
 	video_refresh_func(datawrapper,width,height)
 
 cdef void callaudiosample(int16_t left, int16_t right):
 	global audio_sample_func
-	audio_sample_func(left,right)
+	if audio_sample_func is not None:
+		audio_sample_func(left,right)
 
 cdef size_t callaudiosamplebatch(const_int16_t_pointer data, size_t frames):
 	global audio_sample_batch_func
 	cdef data_array datawrapper
+	if audio_sample_batch_func is None:
+		return frames
 	datawrapper = data_array("ushort",frames)
 	datawrapper._ptr = unconst_int16_t_pointer(data)
 	return audio_sample_batch_func(datawrapper,frames)
 
 cdef void callinputpoll():
 	global input_poll_func
-	input_poll_func()
+	if input_poll_func is not None:
+		input_poll_func()
 cdef int16_t callinputstate(unsigned port, unsigned device, unsigned index, unsigned id):
 	global input_state_func
+	if input_state_func is None:
+		return 0
 	return input_state_func(port,device,index,id)
 	
 class retro_message(object):
@@ -330,9 +341,11 @@ cdef class CoreDef:
 		global environment_func
 		environment_func = function	
 
-	def retro_set_video_refresh(self, function):
+	def retro_set_video_refresh(self, function, copy=False):
 		global video_refresh_func
-		video_refresh_func = function	
+		if copy:
+			raise NotImplementedError("This wrapper can't copy video frames")
+		video_refresh_func = function
 
 	def retro_set_audio_sample(self, function):
 		global audio_sample_func
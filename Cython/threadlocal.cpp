@@ -0,0 +1,3 @@
+static __thread void *active_context = 0;
+void *get_active_context(){ return active_context; }
+void set_active_context(void *context){ active_context = context; }
@@ -1,54 +1,162 @@
 """
-Pygame output for SNES Audio.
+Pygame output for libretro Audio.
 """
 
-import pygame, numpy, struct
+import pygame, pygame.sndarray, numpy
 
-SNES_OUTPUT_FREQUENCY = 32040 # Hz
 
-sndstruct = struct.Struct('<hh')
-sndlog = ''
+class AudioSink(object):
+	"""
+	Plays the audio of an EmulatedSystem through a pygame mixer channel.
+
+	Audio from the core is collected in a preallocated ring buffer, and
+	played in chunks of "chunk_frames" frames. Each chunk is copied into the
+	next of a small pool of Sounds, which is queued on the channel, so a
+	Sound is never overwritten while it is playing.
 
-def set_audio_sample_cb(core, callback=pygame.mixer.Sound.play):
+	"underruns" counts the times the channel ran dry before the next chunk was
+	ready, and "overruns" the frames dropped because the ring buffer was full.
 	"""
-	Sets the callback that will handle updated audio samples.
+	def __init__(self, core, callback=None, chunk_frames=512, pool_size=4,
+			ring_frames=None):
+		"""
+		Start playing the audio of the given EmulatedSystem, which must have a
+		game loaded.
 
-	Unlike core.EmulatedSNES.set_audio_sample_cb, the callback passed to this
-	function should accept only one parameter:
+		The mixer is (re)initialized at the game's sample rate. If
+		"callback" is given, it is called with each chunk's Sound instead of
+		queueing it on the channel.
 
-		"snd" is an instance of pygame.mixer.Sound containing the last 512
-		samples.
+		The ring buffer holds "ring_frames" frames, by default a quarter of a
+		second.
+		"""
+		av_info = core._lib.retro_get_system_av_info()
+		self.sample_rate = int(round(av_info.timing.sample_rate))
 
-	If no callback function is provided, the default implementation of
-	snd.play() is used.
-	"""
+		mixer = pygame.mixer.get_init()
+		if mixer is not None and mixer != (self.sample_rate, -16, 2):
+			pygame.mixer.quit()
+			mixer = None
+		if mixer is None:
+			pygame.mixer.init(
+				frequency=self.sample_rate,
+				size=-16, channels=2, buffer=chunk_frames
+			)
+
+		if ring_frames is None:
+			ring_frames = max(self.sample_rate // 4, chunk_frames * 2)
+		self.ring = numpy.zeros((ring_frames, 2), numpy.int16)
+		# Frames ever written to, and read from, the ring.
+		self._written = 0
+		self._read = 0
+
+		self.chunk_frames = chunk_frames
+		# pool_size must be at least 3: one Sound playing, one queued and one
+		# being filled.
+		self.sounds = [
+				pygame.sndarray.make_sound(
+					numpy.zeros((chunk_frames, 2), numpy.int16)
+				)
+				for _ in range(max(pool_size, 3))
+			]
+		self._samples = [pygame.sndarray.samples(snd) for snd in self.sounds]
+		self._next_sound = 0
+
+		self.callback = callback
+		self.channel = None if callback is not None else pygame.mixer.Channel(0)
+		self._started = False
+		self._stalled = False
+
+		self.underruns = 0
+		self.overruns = 0
+
+		self._core = core
+		core.set_audio_sample_batch_cb(self._batch)
+		core.set_audio_accumulate(True)
+
+	@property
+	def buffered(self):
+		"""
+		The number of frames waiting in the ring buffer.
+		"""
+		return self._written - self._read
+
+	def write(self, data):
+		"""
+		Add a (frames, 2) int16 array of audio to the ring buffer.
+		"""
+		size = len(self.ring)
+		frames = min(len(data), size - self.buffered)
+		if frames < len(data):
+			self.overruns += len(data) - frames
 
-	# init pygame sound.  snes freq is 32000, 16bit unsigned stereo.
-	pygame.mixer.init(
-		frequency=SNES_OUTPUT_FREQUENCY,
-		size=16, channels=2, buffer=512
-	)
+		start = self._written % size
+		first = min(frames, size - start)
+		self.ring[start:start + first] = data[:first]
+		self.ring[:frames - first] = data[first:frames]
+		self._written += frames
 
-	snd = pygame.sndarray.make_sound(
-			numpy.zeros( (512, 2), dtype='int16', order='C' )
-		)
-	sndbuf = snd.get_buffer()
+	def _fill(self, samples):
+		size = len(self.ring)
+		start = self._read % size
+		first = min(self.chunk_frames, size - start)
+		samples[:first] = self.ring[start:start + first]
+		samples[first:] = self.ring[:self.chunk_frames - first]
+		self._read += self.chunk_frames
 
-	def wrapper(left, right):
-		global sndlog, sndstruct
-		sndlog += sndstruct.pack(left, right)
+	def pump(self):
+		"""
+		Hand as many chunks as the channel will take to it.
+		"""
+		if self.channel is not None and self._started:
+			if not self.channel.get_busy() and not self._stalled:
+				self.underruns += 1
+				self._stalled = True
 
-		if len(sndlog) >= 512*2*2: # 512 stereo samples of 16-bits each
-			# this try-except block works around a bug in pygame 1.9.1 on 64-bit hosts.
-			# http://archives.seul.org/pygame/users/Apr-2011/msg00069.html
-			# https://bitbucket.org/pygame/pygame/issue/109/bufferproxy-indexerror-exception-thrown
-			try:
-				sndbuf.write(sndlog, 0)
-				callback(snd)
-			except IndexError:
-				pass
+		while self.buffered >= self.chunk_frames:
+			if self.channel is not None and self.channel.get_queue() is not None:
+				return
 
-			sndlog = ''
+			snd = self.sounds[self._next_sound]
+			self._fill(self._samples[self._next_sound])
+			self._next_sound = (self._next_sound + 1) % len(self.sounds)
 
-	core.set_audio_sample_cb(wrapper)
+			if self.callback is not None:
+				self.callback(snd)
+			elif self.channel.get_busy():
+				self.channel.queue(snd)
+			else:
+				self.channel.play(snd)
+			self._started = True
+			self._stalled = False
 
+	def _batch(self, data, frames):
+		self.write(data)
+		self.pump()
+
+	def close(self):
+		"""
+		Stop taking audio from the core, and stop playing.
+		"""
+		self._core.set_audio_accumulate(False)
+		self._core.set_audio_sample_batch_cb(None)
+		if self.channel is not None:
+			self.channel.stop()
+
+
+def set_audio_sample_cb(core, callback=None):
+	"""
+	Sets the callback that will handle updated audio samples.
+
+	Unlike core.EmulatedSystem.set_audio_sample_cb, the callback passed to this
+	function should accept only one parameter:
+
+		"snd" is an instance of pygame.mixer.Sound containing the next 512
+		samples. It is reused a few chunks later, so play it straight away.
+
+	If no callback function is provided, the chunks are queued on a mixer
+	channel, one after the other.
+
+	Returns the AudioSink playing the audio.
+	"""
+	return AudioSink(core, callback)
@@ -1,47 +1,141 @@
 """
-.wav output for SNES audio.
+.wav output for libretro audio.
 """
 import wave
-import struct
-from itertools import izip
-from tempfile import mkstemp
-import os
-import os.path
+import threading
 
-SNES_OUTPUT_FREQUENCY = 32040 # Hz
+try:
+	import queue
+except ImportError:
+	import Queue as queue
 
-# libsnes generates signed 16-bit samples, but passes them to us marked as
-# int16 values so we need to pack them as int16 values to avoid any
-# signed/unsigned conversions.
-sndstruct = struct.Struct('<hh')
+import numpy
 
+_STOP = None
 
-def set_audio_sink(core, filenameOrHandle):
+
+class WaveSink(object):
 	"""
-	Records SNES audio to the given .wav file.
+	Records the audio of an EmulatedSystem to a .wav file.
 
-	"core" should be an instance of snes.core.EmulatedSNES.
+	Audio is collected into large blocks, which a background thread writes to
+	the file, so recording costs a copy per batch of audio rather than a write
+	per sample. A fixed pool of "blocks" blocks of "block_frames" frames is
+	reused; if the writer falls behind by the whole pool, recording waits for
+	it.
 
-	"filenameOrHandle" should be either a string representing the filename
-	where audio data should be written, or a file-handle opened in "wb" mode.
+	Call close() to write out the rest of the audio and finish the file.
+	"""
+	def __init__(self, core, filenameOrHandle, block_frames=65536, blocks=8):
+		"""
+		Start recording the given EmulatedSystem, which must have a game
+		loaded, at the game's sample rate.
+		"""
+		av_info = core._lib.retro_get_system_av_info()
+		self.sample_rate = int(round(av_info.timing.sample_rate))
+
+		self.wave = wave.open(filenameOrHandle, "wb")
+		self.wave.setnchannels(2)
+		self.wave.setsampwidth(2)
+		self.wave.setframerate(self.sample_rate)
+		self.wave.setcomptype('NONE', 'not compressed')
+
+		# .wav files hold little-endian samples.
+		self._free = queue.Queue()
+		for _ in range(blocks):
+			self._free.put(numpy.empty((block_frames, 2), '<i2'))
+		self._full = queue.Queue()
+		self._block = self._free.get()
+		self._used = 0
+
+		self.frames = 0
+		self._error = None
+		self._writer = threading.Thread(target=self._write_loop)
+		self._writer.daemon = True
+		self._writer.start()
+
+		self._core = core
+		core.set_audio_sample_batch_cb(self._batch)
+		core.set_audio_accumulate(True)
+
+	def _write_loop(self):
+		while True:
+			item = self._full.get()
+			if item is _STOP:
+				return
+			block, used = item
+			try:
+				# We can safely use .writeframesraw() here because the header
+				# will be corrected once we call .close()
+				self.wave.writeframesraw(block[:used].tostring())
+			except Exception as e:
+				self._error = e
+			self._free.put(block)
 
-	Audio data will be written to the given file as a 32040Hz 16-bit stereo
-	.wav file, using the 'wave' module from the Python standard library.
+	def _check_writer(self):
+		if self._error is not None:
+			error, self._error = self._error, None
+			raise error
 
-	Returns the wave.Wave_write instance used to write the SNES audio.
+	def _submit(self):
+		"""
+		Hand the current block to the writer.
+		"""
+		self._check_writer()
+		self._full.put((self._block, self._used))
+		self._block = self._free.get()
+		self._used = 0
+
+	def write(self, data):
+		"""
+		Record a (frames, 2) int16 array of audio.
+		"""
+		size = len(self._block)
+		while len(data):
+			frames = min(len(data), size - self._used)
+			self._block[self._used:self._used + frames] = data[:frames]
+			self._used += frames
+			self.frames += frames
+			data = data[frames:]
+			if self._used == size:
+				self._submit()
+
+	def _batch(self, data, frames):
+		self.write(data)
+
+	def close(self):
+		"""
+		Stop recording, write out the rest of the audio, and finish and close
+		the file.
+		"""
+		if self._writer is None:
+			return
+		self._core.set_audio_accumulate(False)
+		self._core.set_audio_sample_batch_cb(None)
+		if self._used:
+			self._submit()
+		self._full.put(_STOP)
+		self._writer.join()
+		self._writer = None
+		self.wave.close()
+		self._check_writer()
+
+
+def set_audio_sink(core, filenameOrHandle):
 	"""
-	res = wave.open(filenameOrHandle, "wb")
-	res.setnchannels(2)
-	res.setsampwidth(2)
-	res.setframerate(SNES_OUTPUT_FREQUENCY)
-	res.setcomptype('NONE', 'not compressed')
+	Records libretro audio to the given .wav file.
 
-	def audio_sample(left, right):
-		# We can safely use .writeframesraw() here because the header will be
-		# corrected once we call .close()
-		res.writeframesraw(sndstruct.pack(left, right))
+	"core" should be an instance of retro.core.EmulatedSystem, with a game
+	loaded.
 
-	core.set_audio_sample_cb(audio_sample)
+	"filenameOrHandle" should be either a string representing the filename
+	where audio data should be written, or a file-handle opened in "wb" mode.
 
-	return res
+	Audio data will be written to the given file as a 16-bit stereo .wav
+	file at the game's sample rate, using the 'wave' module from the Python
+	standard library.
 
+	Returns the WaveSink writing the audio; call its close() method when
+	done.
+	"""
+	return WaveSink(core, filenameOrHandle)
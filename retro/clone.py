@@ -0,0 +1,204 @@
+"""
+Fork-based copies of a running EmulatedSystem.
+
+Loading a game and restoring a savestate is slow, while fork() is cheap: the
+child process shares the parent's ROM and core memory copy-on-write until
+either side writes to it. spawn_clones() forks an EmulatedSystem that already
+has a game loaded and returns a CloneHandle for each child, through which the
+parent can drive it over a pipe.
+
+Only fork from a process that has no other threads running and no open
+display or audio devices, since the children inherit those in an unusable
+state. Each clone replaces its video refresh callback with one that keeps the
+latest frame for CloneHandle.get_frame(); the other callbacks are inherited
+from the parent as they were at the time of the fork.
+
+Only available on platforms with os.fork().
+"""
+import os
+import sys
+import traceback
+from multiprocessing import Pipe
+
+import numpy
+
+from retro import exceptions as EX
+
+
+class CloneHandle(object):
+	"""
+	The parent's end of a cloned EmulatedSystem running in a child process.
+
+	Requests are answered in the order they were sent, so several clones can be
+	kept busy at once by calling submit() on each of them before collecting the
+	answers with result().
+	"""
+	def __init__(self, pid, conn):
+		self.pid = pid
+		self._conn = conn
+		self._pending = 0
+
+	def fileno(self):
+		"""
+		Return the file descriptor the clone's answers arrive on, for select().
+		"""
+		return self._conn.fileno()
+
+	def submit(self, name, *args, **kwargs):
+		"""
+		Ask the clone to call the EmulatedSystem method "name" without waiting
+		for the answer.
+		"""
+		self._conn.send((name, args, kwargs))
+		self._pending += 1
+
+	def result(self):
+		"""
+		Wait for and return the answer to the oldest outstanding request.
+
+		If the method raised an exception in the clone, it is raised here.
+		"""
+		self._pending -= 1
+		status, value = self._conn.recv()
+		if status == "error":
+			raise value
+		return value
+
+	def call(self, name, *args, **kwargs):
+		"""
+		Call the EmulatedSystem method "name" in the clone and return its result.
+		"""
+		self.submit(name, *args, **kwargs)
+		return self.result()
+
+	def run(self, frames=1):
+		"""
+		Run the clone for the given number of frames.
+		"""
+		return self.call("_clone_run", frames)
+
+	def serialize(self):
+		"""
+		Return the clone's current savestate.
+		"""
+		return self.call("serialize")
+
+	def unserialize(self, state):
+		"""
+		Restore the clone to the given savestate.
+		"""
+		return self.call("unserialize", state)
+
+	def get_frame(self):
+		"""
+		Return the clone's latest video frame as (data, width, height, pitch),
+		or None if it hasn't produced one since it was spawned.
+		"""
+		return self.call("_clone_frame")
+
+	def close(self):
+		"""
+		Stop the clone and wait for its process to exit.
+		"""
+		if self._conn is None:
+			return
+		try:
+			while self._pending:
+				self.result()
+			self._conn.send(("_clone_exit", (), {}))
+		except (EOFError, IOError):
+			pass
+		self._conn.close()
+		self._conn = None
+		os.waitpid(self.pid, 0)
+
+	def __del__(self):
+		if self._conn is not None:
+			self.close()
+
+
+def _serve(system, conn):
+	"""
+	Internal function.
+
+	Answer requests from the parent until told to exit or the pipe closes.
+	"""
+	frame = [None]
+
+	def keep_frame(data, width, height, pitch):
+		if data is not None:
+			frame[0] = (numpy.array(data), width, height, pitch)
+
+	def run(frames):
+		for _ in range(frames):
+			system.run()
+
+	system.set_video_refresh_cb(keep_frame)
+	handlers = {
+		"_clone_run": run,
+		"_clone_frame": lambda: frame[0],
+	}
+
+	while True:
+		try:
+			name, args, kwargs = conn.recv()
+		except EOFError:
+			return
+		if name == "_clone_exit":
+			return
+
+		try:
+			if name in handlers:
+				func = handlers[name]
+			elif name.startswith("_"):
+				raise EX.RetroException("Clones can't call %r" % (name,))
+			else:
+				func = getattr(system, name)
+			reply = ("ok", func(*args, **kwargs))
+		except Exception as e:
+			reply = ("error", e)
+
+		try:
+			conn.send(reply)
+		except Exception as e:
+			# Probably something that won't pickle.
+			conn.send(("error", EX.RetroException(
+					"Couldn't send result of %r: %s" % (name, e))))
+
+
+def spawn_clones(system, count):
+	"""
+	Fork "count" copies of the given EmulatedSystem and return a list of
+	CloneHandles to control them.
+
+	The system must have a game loaded. Each clone starts from the state the
+	system was in when spawn_clones() was called.
+	"""
+	system._require_game_loaded()
+
+	handles = []
+	for _ in range(count):
+		parent_conn, child_conn = Pipe()
+		sys.stdout.flush()
+		sys.stderr.flush()
+		pid = os.fork()
+		if pid == 0:
+			# The child must never return into the parent's code, nor run its
+			# cleanup handlers, so it always leaves through os._exit().
+			status = 0
+			try:
+				parent_conn.close()
+				for handle in handles:
+					handle._conn.close()
+					handle._conn = None
+				_serve(system, child_conn)
+			except:
+				traceback.print_exc()
+				status = 1
+			finally:
+				os._exit(status)
+
+		child_conn.close()
+		handles.append(CloneHandle(pid, parent_conn))
+
+	return handles
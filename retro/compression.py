@@ -0,0 +1,32 @@
+"""
+The compression codecs used for storing savestates.
+"""
+import zlib
+
+try:
+	import lzma
+except ImportError:
+	lzma = None
+
+# The codec names get_codec() understands. lzma is only available if the
+# lzma module is.
+CODECS = [None, 'zlib'] + (['lzma'] if lzma is not None else [])
+
+
+def get_codec(name, level):
+	"""
+	Return (compress, decompress) functions for the named codec.
+
+	"name" is one of CODECS, with None meaning no compression, and "level" the
+	compression level to use. compress() accepts any buffer and returns
+	a string, decompress() accepts any buffer.
+	"""
+	if name is None:
+		return (lambda data: bytes(bytearray(data))), (lambda data: data)
+	if name == 'zlib':
+		return (lambda data: zlib.compress(data, level)), zlib.decompress
+	if name == 'lzma':
+		if lzma is None:
+			raise ValueError("The lzma module is not available")
+		return (lambda data: lzma.compress(data, preset=level)), lzma.decompress
+	raise ValueError("Unknown codec %r" % (name,))
@@ -4,7 +4,8 @@ A Pythonic interface to libretro functionality.
 Each emulated console is represented by an instance of the EmulatedSystem class. For
 technical reasons, a single copy of a libretro library can only emulate a single
 system, therefore if you want to emulate multiple consoles from the same Python
-process, you will need multiple copies of libretro.
+process, you will need multiple copies of libretro. Passing private_copy=True to
+the EmulatedSystem constructor makes such a copy for you.
 
 To construct an EmulatedSystem object, you need to pass the name of the libretro
 implementation to load. Different platforms use different default libretro
@@ -19,6 +20,8 @@ Constants defined in this module:
         indexing into the list returned from EmulatedSystem.unload().
 
         VALID_MEMORY_TYPES is a list of all the valid memory type constants.
+        MEMORY_VIDEO_RAM is not in it, since it isn't saved on unload(), but
+        can be read with EmulatedSystem.memory_view() and read_memory().
 
         DEVICE_* (but not DEVICE_ID_*) constants represent the different kinds of
         controllers that can be connected to a port. These should be passed to
@@ -32,9 +35,14 @@ Constants defined in this module:
 Based on screwtape's python-snes.
 """
 
+import os
+import shutil
+import tempfile
+
 import numpy
 
 from retro import _retro_wrapper as W
+from retro import clone
 from retro import exceptions as EX
 from retro.globals import *
 
@@ -43,6 +51,23 @@ from retro.globals import *
 # twice.
 _libretro_registry = set()
 
+def _copy_library(libname):
+        """
+        Internal function.
+
+        Copies the given library to a fresh temporary file and returns its path.
+        The dynamic linker treats the copy as an unrelated library, so it gets
+        its own global state.
+        """
+        if not os.path.isfile(libname):
+                raise EX.RetroException("Library %r must be given as a path to "
+                                "be loaded as a private copy" % (libname,))
+        handle, path = tempfile.mkstemp(prefix="retro-",
+                        suffix="-" + os.path.basename(libname))
+        os.close(handle)
+        shutil.copyfile(libname, path)
+        return path
+
 def guess_library_name(tag=None):
         """
         Yield possible names of the libretro library.
@@ -92,10 +117,10 @@ class EmulatedSystem(W.LowLevelWrapper):
         # This keeps track of whether a game is loaded.
         _game_loaded = False
 
-        # This keeps track of which cheats the user wants to apply to this game.
-        _loaded_cheats = {}
+        # The path of our private copy of the library, if we made one.
+        _private_copy = None
 
-        def __init__(self, libname):
+        def __init__(self, libname, private_copy=False):
                 """
                 Construct and return a wrapper for the given libretro library.
 
@@ -103,20 +128,40 @@ class EmulatedSystem(W.LowLevelWrapper):
                 implementation to load. If you don't have a specific filename you want
                 to load, ask guess_library_name() for some likely choices.
 
+                If "private_copy" is true, the library is copied to a temporary file
+                and the copy is loaded instead, so any number of EmulatedSystems can
+                run the same libretro implementation side by side in one process.
+                "libname" must then be a path to the library file. The copy is
+                deleted again by close().
+
                 Raises LibraryInUse if the given library is already being used in the
-                current process.
+                current process and "private_copy" is false.
                 """
-                if libname in _libretro_registry:
-                        raise EX.LibraryInUse("Library %r already in use." % (libname,))
-                W.LowLevelWrapper.__init__(self, libname)
-                _libretro_registry.add(libname)
+                # This keeps track of which cheats the user wants to apply to this game.
+                self._loaded_cheats = {}
 
-                # libretro likes to segfault if you call .run without any callbacks set,
-                # so let's define some dummy ones by default.
-                self.set_video_refresh_cb(lambda *args: None)
-                self.set_audio_sample_cb(lambda *args: None)
-                self.set_input_poll_cb(lambda: None)
-                self.set_input_state_cb(lambda *args: 0)
+                if private_copy:
+                        self._private_copy = _copy_library(libname)
+                        try:
+                                W.LowLevelWrapper.__init__(self, self._private_copy)
+                        except:
+                                os.remove(self._private_copy)
+                                raise
+                else:
+                        if libname in _libretro_registry:
+                                raise EX.LibraryInUse("Library %r already in use; "
+                                                "pass private_copy=True to load another copy."
+                                                % (libname,))
+                        W.LowLevelWrapper.__init__(self, libname)
+                        _libretro_registry.add(libname)
+
+                # The wrapper always gives the core its own callbacks, which do
+                # nothing (or report no input) while no Python callback is set. With
+                # none set, run_frames() never needs the GIL.
+                self.set_video_refresh_cb(None)
+                self.set_audio_sample_cb(None)
+                self.set_input_poll_cb(None)
+                self.set_input_state_cb(None)
 
         def _reload_cheats(self):
                 """
@@ -133,12 +178,11 @@ class EmulatedSystem(W.LowLevelWrapper):
                 """
                 Internal method.
 
-                Copies data from the given libretro memory buffer into a numpy array.
+                Copies data from the given libretro memory buffer into a string.
                 """
-                mem_size = self._lib.retro_get_memory_size(mem_type)
                 mem_data = self._lib.retro_get_memory_data(mem_type)
 
-                if mem_size == 0:
+                if mem_data is None:
                         return None
 
                 return mem_data.tostring()
@@ -150,7 +194,6 @@ class EmulatedSystem(W.LowLevelWrapper):
                 Copies the given data into the libretro memory buffer of the given type.
                 """
                 mem_size = self._lib.retro_get_memory_size(mem_type)
-                mem_data = self._lib.retro_get_memory_data(mem_type)
 
                 if len(data) != mem_size:
                         raise EX.RetroException("This game requires %d bytes of "
@@ -158,7 +201,67 @@ class EmulatedSystem(W.LowLevelWrapper):
                                                 mem_size, mem_type, len(data),
                                         )
                                 )
-                mem_data.put(range(mem_size),map(ord,data))
+                self._lib.retro_write_memory(mem_type, data, 0)
+
+        def memory_view(self, mem_type):
+                """
+                Returns a writable numpy uint8 array onto the given memory of the
+                loaded game, or None if the game doesn't have that kind of memory.
+
+                "mem_type" is one of the MEMORY_* constants. The array reads and
+                writes the core's memory directly, without copying, so it always
+                shows the current contents. It is only valid until the game is
+                unloaded.
+
+                Requires that a game be loaded.
+                """
+                self._require_game_loaded()
+                return self._lib.retro_get_memory_data(mem_type)
+
+        def read_memory(self, mem_type, out=None, offset=0, size=None):
+                """
+                Copies part of the given memory of the loaded game, in one go.
+
+                "mem_type" is one of the MEMORY_* constants. "size" bytes starting
+                "offset" bytes in are copied; by default everything from "offset"
+                to the end. If "out" is given, it may be any writable, contiguous
+                object supporting the buffer protocol, and is filled and returned;
+                otherwise a new numpy uint8 array is returned. Reusing "out" saves
+                an allocation per call.
+
+                The size of "out" is the number of bytes read, so "size" can't be
+                given with it; pass a slice of "out" to read less.
+
+                Raises IndexError if the range is outside the memory, and
+                ValueError if both "out" and "size" are given.
+
+                Requires that a game be loaded.
+                """
+                self._require_game_loaded()
+                if out is not None and size is not None:
+                        raise ValueError("Give either out or size, not both")
+                if out is None:
+                        if size is None:
+                                size = max(self._lib.retro_get_memory_size(mem_type)
+                                                - offset, 0)
+                        out = numpy.empty(size, numpy.uint8)
+                self._lib.retro_read_memory(mem_type, out, offset)
+                return out
+
+        def write_memory(self, mem_type, data, offset=0):
+                """
+                Copies "data" into the given memory of the loaded game, in one go.
+
+                "mem_type" is one of the MEMORY_* constants. "data" may be any
+                contiguous object supporting the buffer protocol, such as a string,
+                bytearray or numpy array, and is written starting "offset" bytes in.
+
+                Raises IndexError if the data doesn't fit in the memory.
+
+                Requires that a game be loaded.
+                """
+                self._require_game_loaded()
+                self._lib.retro_write_memory(mem_type, data, offset)
 
         def _require_game_loaded(self):
                 """
@@ -181,36 +284,148 @@ class EmulatedSystem(W.LowLevelWrapper):
 
                 Environment callback. Gives implementations a way of performing uncommon tasks. Extensible.
 
+                The commands this wrapper can answer by itself never reach the
+                callback: ENVIRONMENT_GET_VARIABLE and ENVIRONMENT_SET_VARIABLES
+                (see set_variable()), ENVIRONMENT_GET_OVERSCAN (see set_overscan()),
+                ENVIRONMENT_GET_CAN_DUPE (see set_can_dupe()) and
+                ENVIRONMENT_SET_PIXEL_FORMAT (see set_pixel_formats()). So cores
+                which check their options every frame don't call into Python.
+
                 The callback should accept the following parameters:
 
                         "command" is an int16 that tells it what command to use, one of globals.ENVIRONMENT_*.
 
-                        "data" is an object which the implementation will create based on the value of "command"
-
-                The callback should return nothing.
+                        "data" depends on "command": the rotation for
+                        ENVIRONMENT_SET_ROTATION, a retro_message for
+                        ENVIRONMENT_SET_MESSAGE, None for ENVIRONMENT_SHUTDOWN, and
+                        an opaque wrapper around a void * for anything else.
 
-                The "data" pararmeter is currently unimplemented and just returns a wrapper around a void *
+                The callback should return True if it handled the command.
                 """
                 self._lib.retro_set_environment(callback)
 
-        def set_video_refresh_cb(self, callback):
+        def set_variable(self, key, value):
+                """
+                Selects "value" for the core option (libretro "variable") "key".
+
+                The core reads the value with ENVIRONMENT_GET_VARIABLE, which is
+                answered without calling Python. Options may be selected before
+                the core declares them; until then, and if "value" is None, the
+                core gets its default, the first of the choices it declared.
+                """
+                self._lib.retro_set_variable(key, value)
+
+        def get_variables(self):
+                """
+                Returns a list of (key, description, value) tuples, one for each
+                core option the core has declared or that was selected with
+                set_variable().
+
+                "description" is what the core declared, like
+                "Description; first|second|...", or None if it hasn't declared the
+                option. "value" is the selected value, or None if there isn't one.
+                """
+                return self._lib.retro_get_variables()
+
+        def set_overscan(self, enabled):
+                """
+                Sets whether the core should show the overscan area, rather than
+                crop it away. Off by default.
+                """
+                self._lib.retro_set_overscan(enabled)
+
+        def set_can_dupe(self, enabled):
+                """
+                Sets whether the core may repeat the previous frame by passing no
+                data to the video refresh callback. On by default.
+                """
+                self._lib.retro_set_can_dupe(enabled)
+
+        def set_pixel_formats(self, formats):
+                """
+                Lets the core switch to any of the given PIXEL_FORMAT_* constants.
+
+                By default only PIXEL_FORMAT_0RGB1555 is allowed, since that is what
+                the video outputs assume unless told otherwise. Cores choose their
+                pixel format while a game loads; the one in use is returned by
+                get_pixel_format().
+                """
+                self._lib.retro_set_pixel_formats(formats)
+
+        def get_pixel_format(self):
+                """
+                Returns the PIXEL_FORMAT_* constant of the frames the core produces.
+
+                With PIXEL_FORMAT_XRGB8888, video frames are uint32 arrays rather
+                than uint16 ones.
+                """
+                return self._lib.retro_get_pixel_format()
+
+        def set_video_refresh_cb(self, callback, copy=False):
                 """
                 Sets the callback that will handle updated video frames.
 
                 The callback should accept the following parameters:
 
-                        "data" is a pointer to the top-left of an array of pixels.
+                        "data" is a numpy array of shape (height, width) holding
+                        the frame's pixels, or None if the core is repeating the
+                        previous frame. It is uint16, or uint32 if the core uses
+                        PIXEL_FORMAT_XRGB8888 (see get_pixel_format()).
 
                         "width" is the number of pixels in each row of the frame.
 
                         "height" is the number of pixel-rows in the frame.
 
-                        "pitch" is the number of pixels from the beginning of one line to
-                        the beginning of the text.
+                        "pitch" is the number of bytes from the beginning of one line
+                        to the beginning of the next in the core's buffer.
 
-                The callback should return nothing.
+                The callback should return nothing. With None, the default, frames
+                are dropped.
+
+                By default "data" is a read-only view straight onto the core's own
+                buffer (its row stride is "pitch"), so no pixels are copied. It
+                is only valid until the callback returns, and the same array
+                object is handed out again for as long as the core keeps drawing
+                to the same buffer. Copy or convert it before the callback returns
+                if you need to keep it.
+
+                If "copy" is true, each frame is instead copied into a contiguous
+                array owned by the wrapper, and "pitch" is that of the copy. It is
+                still reused for every frame of the same size, so copy it again if
+                you need to keep it for longer than a frame. Wrappers that can't
+                copy frames raise NotImplementedError.
                 """
-                self._lib.retro_set_video_refresh(callback)
+                self._lib.retro_set_video_refresh(callback, copy)
+
+        def set_video_capture(self, frames, sizes):
+                """
+                Copies every video frame into the given arrays, instead of passing
+                it to the video refresh callback.
+
+                "frames" must be a C-contiguous numpy uint16 array of shape
+                (slots, max_height, max_width), or uint32 if the core uses
+                PIXEL_FORMAT_XRGB8888, and "sizes" a C-contiguous numpy
+                uint32 array of shape (slots, 2). The n-th frame produced is copied
+                into the top-left corner of frames[n % slots], and its width and
+                height are stored in sizes[n % slots]. No Python code runs while
+                frames are captured.
+
+                Pass None for both to stop capturing and go back to the video
+                refresh callback. retro.video.capture.FrameCapture wraps this with
+                the bookkeeping needed to read the frames back.
+                """
+                self._lib.retro_set_video_capture(frames, sizes)
+
+        def set_video_skip(self, skip):
+                """
+                Skips the video of every frame while "skip" is true.
+
+                Skipped frames are neither captured nor passed to the video refresh
+                callback, so they cost no video work on the Python side. Libretro
+                API version 1 has no way to tell the core, so it still renders
+                them.
+                """
+                self._lib.retro_set_video_skip(skip)
 
         def set_audio_sample_cb(self, callback):
                 """
@@ -222,7 +437,8 @@ class EmulatedSystem(W.LowLevelWrapper):
 
                         "right" is an int16 that specifies the right audio channel volume.
 
-                The callback should return nothing.
+                The callback should return nothing. With None, the default, the
+                samples are dropped.
                 """
                 self._lib.retro_set_audio_sample(callback)
 
@@ -232,21 +448,52 @@ class EmulatedSystem(W.LowLevelWrapper):
 
                 The callback should accept the following parameters:
 
-                        "data" is an array of int16 pairs arranged in the format [l,r,l,r,...]
+                        "data" is a numpy int16 array of shape (frames, 2), with the left
+                        channel in column 0 and the right channel in column 1. It is
+                        only valid until the callback returns.
 
-                        "frames" is the number of frames. The size of data is 2*frames
+                        "frames" is the number of frames in "data".
 
                 The callback should return nothing.
+
+                Normally this callback only receives the audio the core passes in
+                batches. When audio is accumulated (see set_audio_accumulate()) it
+                receives all of the audio instead.
                 """
                 self._lib.retro_set_audio_sample_batch(callback)
 
+        def set_audio_accumulate(self, enabled=True, flush_frames=0):
+                """
+                Collects audio into a buffer instead of calling Python per sample.
+
+                While enabled, the samples the core produces through either audio
+                callback are appended to a buffer in the wrapper, and the audio
+                sample callback is not called. If an audio batch callback is set, it
+                is called with all of the collected audio once at the end of every
+                run() and, if "flush_frames" is non-zero, whenever that many frames
+                have built up. Otherwise the audio stays in the buffer until
+                drain_audio() is called.
+                """
+                self._lib.retro_set_audio_accumulate(enabled, flush_frames)
+
+        def drain_audio(self):
+                """
+                Returns the audio collected since the last call as a numpy int16
+                array of shape (frames, 2), and empties the buffer.
+
+                Only useful when audio is accumulated without an audio batch
+                callback; see set_audio_accumulate().
+                """
+                return self._lib.retro_drain_audio()
+
         def set_input_poll_cb(self, callback):
                 """
                 Sets the callback that will check for updated input events.
 
                 The callback should accept no parameters and return nothing. It should
                 just read new input events and store them somewhere so they can be
-                returned by the input state callback.
+                returned by the input state callback. None, the default, sets no
+                callback.
                 """
                 self._lib.retro_set_input_poll(callback)
 
@@ -288,9 +535,36 @@ class EmulatedSystem(W.LowLevelWrapper):
                 constant), return 0.
 
                 You are responsible for implementing any turbo-fire features, etc.
+
+                With None, the default, every input reads as 0.
                 """
                 self._lib.retro_set_input_state(callback)
 
+        def set_input_table(self, table, advance=False):
+                """
+                Answers the core's input queries from a table, instead of calling
+                the input state callback.
+
+                "table" must be a C-contiguous numpy int16 array of shape
+                (frames, ports, slots, 3). table[frame, port, index] describes the
+                device with the given "index" on the given "port" (see
+                set_input_state_cb()) as three values: a bitmask with bit "id" set
+                for each pressed button, then the X and Y axes of a mouse or
+                light-gun. Queries for ports or indexes outside the table, or for
+                keyboards, read as 0.
+
+                If "advance" is false, queries are answered from table[0]; update it
+                whenever you like, for example from the input poll callback, which
+                is still called. If "advance" is true, the table is a schedule: each
+                input poll moves on to the next frame of the table, starting with
+                table[0] at the first poll, and everything reads as 0 once the table
+                runs out.
+
+                Pass None to go back to the input state callback.
+                retro.input.latched has helpers for building tables.
+                """
+                self._lib.retro_set_input_table(table, advance)
+
         def set_controller_port_device(self, port, device):
                 """
                 Connects the given device to the given controller port.
@@ -362,6 +636,46 @@ class EmulatedSystem(W.LowLevelWrapper):
                 self._require_game_loaded()
                 self._lib.retro_run()
 
+        def run_frames(self, frames):
+                """
+                Run the emulated console for the given number of frames.
+
+                The frames are run in a loop in C, without holding the GIL, so
+                other threads can run meanwhile; in particular, several
+                EmulatedSystems (each with its own library, see private_copy) can
+                run on different threads in parallel. The GIL is only taken back to
+                call Python callbacks.
+
+                To run without Python code at all, use native callbacks only:
+                capture video with set_video_capture() (or set no video refresh
+                callback), accumulate audio with set_audio_accumulate() without
+                "flush_frames", answer input from set_input_table(), and set the
+                input poll and environment callbacks to None. In that case audio
+                is handed to the audio batch callback once, after the last frame,
+                rather than after each one.
+
+                Requires that a game be loaded.
+                """
+                self._require_game_loaded()
+                self._lib.retro_run_frames(frames)
+
+        def set_profile(self, profile):
+                """
+                Records how each frame spends its time in the given array.
+
+                "profile" must be a C-contiguous numpy float64 array of shape
+                (slots, 15). The n-th frame run by run() or run_frames() is
+                recorded in profile[n % slots]: how long it took, how much of that
+                the core itself took, and the time spent in and calls of each
+                callback, among other things. The recording is done by the Cython
+                layer, with a monotonic clock.
+
+                Pass None to stop profiling; when off, profiling costs a single
+                check per callback. retro.instrument.FrameProfiler wraps this with
+                names for the fields, percentiles and trace export.
+                """
+                self._lib.retro_set_profile(profile)
+
         def unload(self):
                 """
                 Remove the game and return its non-volatile storage contents.
@@ -389,41 +703,79 @@ class EmulatedSystem(W.LowLevelWrapper):
                 av_info = self._lib.retro_get_system_av_info()
                 return av_info.timing.fps
 
+        def serialize_size(self):
+                """
+                Returns the number of bytes needed to hold a serialized state.
+
+                Requires that a game be loaded.
+                """
+                self._require_game_loaded()
+                return self._lib.retro_serialize_size()
+
         def serialize(self):
                 """
-                Serializes the state of the emulated console to a string.
+                Serializes the state of the emulated console to a numpy uint8 array.
 
                 This serialized data can be handed to unserialize() at a later time to
-                resume emulation from this point.
+                resume emulation from this point. To avoid allocating a new array
+                every time, use serialize_into().
 
                 Requires that a game be loaded.
                 """
-                self._require_game_loaded()
-                size = self._lib.retro_serialize_size()
-                buf = ctypes.create_string_buffer(size)
-                buf = numpy.empty(size, numpy.dtype("b"))
-                res = self._lib.retro_serialize(buf, size)
+                buf = numpy.empty(self.serialize_size(), numpy.uint8)
+                self.serialize_into(buf)
+                return buf
+
+        def serialize_into(self, buffer):
+                """
+                Serializes the state of the emulated console into the given buffer.
+
+                "buffer" may be any writable, contiguous object supporting the buffer
+                protocol, such as a bytearray, numpy array or shared memory, of at
+                least serialize_size() bytes, or ValueError is raised. Nothing is
+                copied besides what the core itself writes.
+
+                Requires that a game be loaded.
+                """
+                size = self.serialize_size()
+                res = self._lib.retro_serialize(buffer, size)
                 if not res:
                         raise EX.RetroException("problem in serialize")
-                return buf
 
         def get_save_data(self):
                 return self._memory_to_string(MEMORY_SAVE_RAM)
 
         def unserialize(self, state):
                 """
-                Restores the state of the emulated console from a string.
+                Restores the state of the emulated console from a serialized state.
+
+                "state" may be any contiguous object supporting the buffer protocol,
+                such as a string, bytearray, numpy array or mmap. It is read in
+                place, without being copied.
 
                 Note that the game's SRAM data is part of the saved state.
 
                 Requires that the same game that was loaded when serialize was
                 called, be loaded before unserialize is called.
                 """
-                res = self._lib.retro_unserialize(state,
-                                len(state))
+                res = self._lib.retro_unserialize(state)
                 if not res:
                         raise EX.RetroException("problem in unserialize")
 
+        def spawn_clones(self, count):
+                """
+                Fork "count" copies of this emulated console into child processes.
+
+                Returns a list of retro.clone.CloneHandle objects, one per child,
+                which can run frames and exchange savestates and video frames with
+                their clone. Each clone starts from the current state of this
+                console and shares its memory copy-on-write, which is far cheaper
+                than loading the game again. See retro.clone for the caveats.
+
+                Requires that a game be loaded.
+                """
+                return clone.spawn_clones(self, count)
+
         def cheat_add(self, index, code, enabled=True):
                 """
                 Stores the given cheat code at the given index in the cheat list.
@@ -523,4 +875,8 @@ class EmulatedSystem(W.LowLevelWrapper):
                 if W:
                         W.LowLevelWrapper.close(self)
                         if self._libname in _libretro_registry:
-                                _libretro_registry.remove(self._libname)
\ No newline at end of file
+                                _libretro_registry.remove(self._libname)
+                if self._private_copy is not None:
+                        # The library stays mapped, so the file itself can go.
+                        os.remove(self._private_copy)
+                        self._private_copy = None
\ No newline at end of file
@@ -44,10 +44,15 @@ DEVICE_ID_LIGHTGUN_START   = 6
 REGION_NTSC = 0
 REGION_PAL  = 1
 
+PIXEL_FORMAT_0RGB1555 = 0
+PIXEL_FORMAT_XRGB8888 = 1
+PIXEL_FORMAT_RGB565   = 2
+
 MEMORY_MASK       = 0xff
 MEMORY_SAVE_RAM   = 0
 MEMORY_RTC        = 1
 MEMORY_SYSTEM_RAM = 2
+MEMORY_VIDEO_RAM  = 3
 
 MEMORY_SNES_BSX_RAM            = ((1 << 8) | MEMORY_SAVE_RAM)
 MEMORY_SNES_BSX_PRAM           = ((2 << 8) | MEMORY_SAVE_RAM)
@@ -68,12 +73,14 @@ GAME_TYPE_BSX_SLOTTED    = 0x102
 GAME_TYPE_SUFAMI_TURBO   = 0x103
 GAME_TYPE_SUPER_GAME_BOY = 0x104
 
-ENVIRONMENT_SET_ROTATION  = 1
-ENVIRONMENT_GET_OVERSCAN  = 2
-ENVIRONMENT_GET_CAN_DUPE  = 3
-ENVIRONMENT_GET_VARIABLE  = 4
-ENVIRONMENT_SET_VARIABLES = 5
-ENVIRONMENT_SET_MESSAGE   = 6
+ENVIRONMENT_SET_ROTATION     = 1
+ENVIRONMENT_GET_OVERSCAN     = 2
+ENVIRONMENT_GET_CAN_DUPE     = 3
+ENVIRONMENT_GET_VARIABLE     = 4
+ENVIRONMENT_SET_VARIABLES    = 5
+ENVIRONMENT_SET_MESSAGE      = 6
+ENVIRONMENT_SHUTDOWN         = 7
+ENVIRONMENT_SET_PIXEL_FORMAT = 10
 
 from _retro import retro_message
 from _retro import retro_system_info
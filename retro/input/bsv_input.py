@@ -1,8 +1,11 @@
 """
 Read SNES input from a BSNES movie file (*.BSV)
 """
+import mmap
 from struct import Struct, error as StructError
 
+import numpy
+
 
 BSV_MAGIC = 'BSV1'
 HEADER_STRUCT = Struct('<4s3I')
@@ -68,6 +71,153 @@ def bsv_decode(filenameOrHandle):
 		yield 0
 
 
+class BSVMovie(object):
+	"""
+	A memory-mapped BSV file.
+
+	The header fields are available as attributes, the raw header as "header",
+	the embedded savestate as "state" and the recorded input as "records", all
+	of them numpy arrays that read straight from the file without copying it.
+
+	BSV files record the answer to every input query in order, without marking
+	where frames begin, so to start playback from an arbitrary frame, first
+	tell index_frames() how many queries the core makes per frame.
+	"""
+	def __init__(self, filename):
+		self._handle = open(filename, 'rb')
+		self._map = None
+		try:
+			self._open(filename)
+		except:
+			if self._map is not None:
+				self._map.close()
+			self._handle.close()
+			raise
+
+		# Where each frame's records start, and one past the end of the last
+		# frame. Until index_frames() is called we know nothing about frames.
+		self.frame_offsets = None
+
+	def _open(self, filename):
+		"""
+		Map the file and check its header.
+		"""
+		try:
+			self._map = mmap.mmap(self._handle.fileno(), 0,
+					access=mmap.ACCESS_READ)
+		except ValueError:
+			# An empty file can't be mapped.
+			raise CorruptFile("File %r is too short" % (filename,))
+
+		if len(self._map) < HEADER_STRUCT.size:
+			raise CorruptFile("File %r is too short" % (filename,))
+
+		(magic, self.serializerVersion, self.cartCRC, stateSize) = \
+				HEADER_STRUCT.unpack_from(self._map)
+
+		if magic not in (BSV_MAGIC, BSV_SSNES_MAGIC):
+			raise CorruptFile("File %r has bad magic %r, expected %r"
+					% (filename, magic, BSV_MAGIC))
+
+		stateStart = HEADER_STRUCT.size
+		recordStart = stateStart + stateSize
+		if recordStart > len(self._map):
+			raise CorruptFile("File %r is too short for its %d byte savestate"
+					% (filename, stateSize))
+
+		self.header = numpy.frombuffer(self._map, numpy.uint8,
+				HEADER_STRUCT.size, 0)
+		self.state = numpy.frombuffer(self._map, numpy.uint8, stateSize,
+				stateStart)
+		self.records = numpy.frombuffer(self._map, RECORD_STRUCT.format,
+				(len(self._map) - recordStart) // RECORD_STRUCT.size, recordStart)
+
+	def index_frames(self, queries_per_frame):
+		"""
+		Work out where each frame's records start.
+
+		"queries_per_frame" is either the number of input queries the core makes
+		every frame, or a sequence with the number of queries made in each
+		frame.
+
+		Returns the number of whole frames in the movie.
+		"""
+		if numpy.ndim(queries_per_frame) == 0:
+			frames = len(self.records) // queries_per_frame
+			self.frame_offsets = numpy.arange(0, (frames + 1) * queries_per_frame,
+					queries_per_frame, dtype=numpy.intp)
+		else:
+			counts = numpy.asarray(queries_per_frame, numpy.intp)
+			offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+			self.frame_offsets = offsets[offsets <= len(self.records)]
+		return len(self.frame_offsets) - 1
+
+	@property
+	def frames(self):
+		"""
+		The number of frames found by index_frames(), or 0 if it hasn't been
+		called.
+		"""
+		if self.frame_offsets is None:
+			return 0
+		return len(self.frame_offsets) - 1
+
+	def frame_records(self, frame):
+		"""
+		Return the records of the given frame.
+
+		Requires that index_frames() has been called.
+		"""
+		return self.records[self.frame_offsets[frame]:self.frame_offsets[frame+1]]
+
+	def callbacks(self, start_frame=0):
+		"""
+		Return an (input poll, input state) pair of callbacks that play the
+		movie back from the given frame.
+
+		Each input poll moves playback to the start of the next frame, so it
+		stays in step even if the core makes a different number of queries
+		than index_frames() was told about. If index_frames() hasn't been called,
+		records are played back strictly in order instead, and only from the
+		first frame; raises ValueError for any other "start_frame".
+
+		Once the recorded input runs out, every query reads as 0.
+		"""
+		if self.frame_offsets is None and start_frame != 0:
+			raise ValueError("Call index_frames() before playing back from "
+					"frame %d" % (start_frame,))
+		values = self.records.tolist()
+		offsets = None
+		if self.frame_offsets is not None:
+			offsets = self.frame_offsets.tolist()
+		position = [start_frame - 1, offsets[start_frame] if offsets else 0]
+
+		def poll():
+			position[0] += 1
+			if offsets is not None:
+				frame = position[0]
+				position[1] = offsets[frame] if frame < len(offsets) else len(values)
+
+		def state(port, device, index, id):
+			cursor = position[1]
+			position[1] = cursor + 1
+			if cursor < len(values):
+				return values[cursor]
+			return 0
+
+		return poll, state
+
+	def close(self):
+		"""
+		Unmap and close the file.
+
+		Arrays taken from this movie must not be used afterwards.
+		"""
+		self.header = self.state = self.records = None
+		self._map.close()
+		self._handle.close()
+
+
 def set_input_state_file(core, filename, restore=True, expectedCartCRC=None):
 	"""
 	Sets the BSV file containing the log of input states.
@@ -79,18 +229,32 @@ def set_input_state_file(core, filename, restore=True, expectedCartCRC=None):
 	filename to use, rather than a function.
 	"""
 
-	generator = bsv_decode(filename)
+	movie = None
+	if not isinstance(filename, basestring):
+		generator = bsv_decode(filename)
 
-	def wrapper(port, device, index, id):
-		return generator.next()
+		def wrapper(port, device, index, id):
+			return generator.next()
 
-	(serializerVersion, cartCRC, saveStateData) = generator.next()
+		(serializerVersion, cartCRC, saveStateData) = generator.next()
+
+	else:
+		movie = BSVMovie(filename)
+		cartCRC = movie.cartCRC
+		saveStateData = movie.state
+		# The callbacks keep a copy of the records, so the file can be closed
+		# once the savestate has been restored.
+		_, wrapper = movie.callbacks()
 
-	if expectedCartCRC is not None:
-		raise CartMismatch("Movie is for cart with CRC32 %r, expected %r"
-				% (cartCRC, expectedCartCRC))
+	try:
+		if expectedCartCRC is not None and cartCRC != expectedCartCRC:
+			raise CartMismatch("Movie is for cart with CRC32 %r, expected %r"
+					% (cartCRC, expectedCartCRC))
 
-	if restore:
-		core.unserialize(saveStateData)
+		if restore:
+			core.unserialize(saveStateData)
+	finally:
+		if movie is not None:
+			movie.close()
 
 	core.set_input_state_cb(wrapper)
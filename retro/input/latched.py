@@ -0,0 +1,104 @@
+"""
+Answer input queries from a table of button and axis states.
+
+Cores ask for every button of every controller, often several times per
+frame. Rather than answering each query with a Python callback, the input
+state can be latched into a table once per frame, or supplied for a whole run
+in advance, and the queries are then answered without calling Python.
+
+Each entry of a table describes one device and holds INPUT_FIELDS int16
+values: a bitmask of the pressed buttons (bit DEVICE_ID_* set for each pressed
+button) followed by the X and Y axes of a mouse or light-gun.
+"""
+import numpy
+
+INPUT_BUTTONS = 0
+INPUT_X       = 1
+INPUT_Y       = 2
+INPUT_FIELDS  = 3
+
+
+def button_mask(*ids):
+	"""
+	Return the button bitmask with the given DEVICE_ID_* buttons pressed.
+	"""
+	mask = 0
+	for id in ids:
+		mask |= 1 << id
+	# Button 15 sets the sign bit of the int16 field.
+	return numpy.int16(numpy.uint16(mask))
+
+
+def new_table(frames=1, ports=2, slots=1):
+	"""
+	Return an all-zeroes input table for the given number of frames, ports and
+	devices per port.
+	"""
+	return numpy.zeros((frames, ports, slots, INPUT_FIELDS), numpy.int16)
+
+
+class LatchedInput(object):
+	"""
+	Holds the current state of the controllers for an EmulatedSystem.
+
+	Change the state between frames, or from the input poll callback, and the
+	core reads it without any Python code running per query.
+	"""
+	def __init__(self, core, ports=2, slots=1):
+		"""
+		Start answering the input queries of the given EmulatedSystem from this
+		object. "slots" is the number of devices per port you want to be able to
+		control, which is only more than 1 for multitaps.
+		"""
+		self.table = new_table(1, ports, slots)
+		self.state = self.table[0]
+		self._core = core
+		core.set_input_table(self.table)
+
+	def set_buttons(self, port, mask, index=0):
+		"""
+		Set which buttons are pressed, as a bitmask from button_mask().
+		"""
+		self.state[port, index, INPUT_BUTTONS] = mask
+
+	def press(self, port, id, index=0):
+		"""
+		Press the given DEVICE_ID_* button.
+		"""
+		self.state[port, index, INPUT_BUTTONS] |= button_mask(id)
+
+	def release(self, port, id, index=0):
+		"""
+		Release the given DEVICE_ID_* button.
+		"""
+		self.state[port, index, INPUT_BUTTONS] &= ~button_mask(id)
+
+	def set_axes(self, port, x, y, index=0):
+		"""
+		Set the X and Y axes of a mouse or light-gun.
+		"""
+		self.state[port, index, INPUT_X] = x
+		self.state[port, index, INPUT_Y] = y
+
+	def clear(self):
+		"""
+		Release everything.
+		"""
+		self.state[...] = 0
+
+	def close(self):
+		"""
+		Go back to the input state callback.
+		"""
+		self._core.set_input_table(None)
+
+
+def set_input_schedule(core, schedule):
+	"""
+	Play back a whole run's input from the given table.
+
+	"schedule" is an input table from new_table() with one frame per input
+	poll. The core answers its queries from the next frame of the schedule at
+	every poll, and reads zeroes once it runs out.
+	"""
+	core.set_input_table(numpy.ascontiguousarray(schedule, numpy.int16), True)
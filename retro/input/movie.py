@@ -0,0 +1,322 @@
+"""
+Record and play back input in a compact, seekable movie format.
+
+A movie stores one fixed-size record per frame, holding the state of every
+recorded device in the same layout as the tables of retro.input.latched: a
+button bitmask followed by the X and Y axes, as int16 values. Frames are
+grouped into blocks of a fixed number of frames, and every block starts with
+a savestate taken just before its first frame, so playback can begin near any
+frame without replaying the whole movie.
+
+File layout (all values little-endian):
+
+	header		HEADER_STRUCT: magic, version, ports, slots, fields,
+				reserved, frames per block
+	blocks		BLOCK_STRUCT: savestate size, then the savestate, then
+				one record per frame of the block
+	index		one uint64 file offset per block
+	footer		FOOTER_STRUCT: number of frames, number of blocks, magic
+
+A frame here is one call to EmulatedSystem.run(), whether or not the core
+polled for input during it.
+"""
+import mmap
+from struct import Struct
+
+import numpy
+
+from retro.globals import DEVICE_MASK, DEVICE_JOYPAD, DEVICE_MOUSE, DEVICE_LIGHTGUN
+from retro.input.latched import (INPUT_BUTTONS, INPUT_X, INPUT_Y, INPUT_FIELDS,
+		new_table)
+
+MOVIE_MAGIC = 'RMV1'
+MOVIE_VERSION = 1
+FOOTER_MAGIC = 'RMVX'
+HEADER_STRUCT = Struct('<4sIHHHHI')
+BLOCK_STRUCT = Struct('<I')
+FOOTER_STRUCT = Struct('<QQ4s')
+
+RECORD_DTYPE = numpy.dtype('<i2')
+INDEX_DTYPE = numpy.dtype('<u8')
+
+
+class CorruptFile(Exception): pass
+
+
+class MovieRecorder(object):
+	"""
+	Records the input an EmulatedSystem reads into a movie file.
+
+	The recorder installs its own input poll and input state callbacks, which
+	pass the queries on to the given callbacks and note the answers. Call
+	run() instead of the EmulatedSystem's run(), so the recorder knows where
+	each frame ends and can take its savestates between frames.
+
+	Records are collected in memory and written a block at a time. Call
+	close() to write the index and footer; a movie without them can't be read.
+	"""
+	def __init__(self, core, filenameOrHandle, input_state_cb,
+			input_poll_cb=None, ports=2, slots=1, frames_per_block=600):
+		"""
+		Start recording the given EmulatedSystem, which must have a game
+		loaded.
+
+		"input_state_cb" and "input_poll_cb" are the callbacks that really
+		provide the input, as for EmulatedSystem.set_input_state_cb() and
+		set_input_poll_cb().
+
+		"ports" and "slots" give the number of ports, and devices per port, to
+		record. Queries for other devices are answered but not recorded.
+
+		A savestate is stored every "frames_per_block" frames.
+		"""
+		if isinstance(filenameOrHandle, basestring):
+			self._handle = open(filenameOrHandle, 'wb')
+		else:
+			self._handle = filenameOrHandle
+
+		self._core = core
+		self._input_state_cb = input_state_cb
+		self._input_poll_cb = input_poll_cb
+		self.ports = ports
+		self.slots = slots
+		self.frames_per_block = frames_per_block
+
+		self.frames = 0
+		self._offset = 0
+		self._index = []
+		self._block = new_table(frames_per_block, ports, slots)
+		self._record = None
+
+		self._write(HEADER_STRUCT.pack(MOVIE_MAGIC, MOVIE_VERSION, ports, slots,
+				INPUT_FIELDS, 0, frames_per_block))
+
+		core.set_input_poll_cb(self._poll)
+		core.set_input_state_cb(self._state)
+
+	def _write(self, data):
+		self._handle.write(data)
+		self._offset += len(data)
+
+	def _poll(self):
+		if self._input_poll_cb is not None:
+			self._input_poll_cb()
+
+	def _state(self, port, device, index, id):
+		value = self._input_state_cb(port, device, index, id)
+		record = self._record
+		if record is None or port >= self.ports or index >= self.slots:
+			return value
+
+		entry = record[port, index]
+		device &= DEVICE_MASK
+		if device in (DEVICE_MOUSE, DEVICE_LIGHTGUN) and id < 2:
+			entry[INPUT_X + id] = value
+		elif device in (DEVICE_JOYPAD, DEVICE_MOUSE, DEVICE_LIGHTGUN) and id < 16:
+			# Buttons are recorded as pressed if they read as pressed at
+			# any point during the frame.
+			if value:
+				entry[INPUT_BUTTONS] |= numpy.int16(numpy.uint16(1 << id))
+		return value
+
+	def _flush_block(self):
+		"""
+		Write out the records of the current block.
+		"""
+		used = self.frames - (len(self._index) - 1) * self.frames_per_block
+		self._write(self._block[:used].astype(RECORD_DTYPE).tostring())
+		self._block[...] = 0
+
+	def run(self):
+		"""
+		Run the EmulatedSystem for one frame, recording its input.
+		"""
+		position = self.frames % self.frames_per_block
+		if position == 0:
+			if self._index:
+				self._flush_block()
+			state = numpy.asarray(self._core.serialize(), numpy.uint8)
+			self._index.append(self._offset)
+			self._write(BLOCK_STRUCT.pack(len(state)))
+			self._write(state.tostring())
+
+		self._record = self._block[position]
+		try:
+			self._core.run()
+		finally:
+			self._record = None
+		self.frames += 1
+
+	def close(self):
+		"""
+		Finish the movie and close the file.
+		"""
+		if self._handle is None:
+			return
+		if self._index:
+			self._flush_block()
+		self._write(numpy.array(self._index, INDEX_DTYPE).tostring())
+		self._write(FOOTER_STRUCT.pack(self.frames, len(self._index),
+				FOOTER_MAGIC))
+		self._handle.close()
+		self._handle = None
+
+
+class Movie(object):
+	"""
+	A memory-mapped movie file, with random access to every frame's input.
+	"""
+	def __init__(self, filename):
+		self._handle = open(filename, 'rb')
+		self._map = None
+		try:
+			self._open(filename)
+		except:
+			if self._map is not None:
+				self._map.close()
+			self._handle.close()
+			raise
+
+	def _open(self, filename):
+		"""
+		Map the file and check its header and footer.
+		"""
+		try:
+			self._map = mmap.mmap(self._handle.fileno(), 0,
+					access=mmap.ACCESS_READ)
+		except ValueError:
+			raise CorruptFile("File %r is too short" % (filename,))
+
+		size = len(self._map)
+		if size < HEADER_STRUCT.size + FOOTER_STRUCT.size:
+			raise CorruptFile("File %r is too short" % (filename,))
+
+		(magic, version, self.ports, self.slots, fields, _,
+				self.frames_per_block) = HEADER_STRUCT.unpack_from(self._map)
+		if magic != MOVIE_MAGIC:
+			raise CorruptFile("File %r has bad magic %r, expected %r"
+					% (filename, magic, MOVIE_MAGIC))
+		if version != MOVIE_VERSION or fields != INPUT_FIELDS:
+			raise CorruptFile("File %r is movie version %d with %d fields, "
+					"expected version %d with %d" % (filename, version, fields,
+						MOVIE_VERSION, INPUT_FIELDS))
+
+		self.frames, blocks, magic = FOOTER_STRUCT.unpack_from(self._map,
+				size - FOOTER_STRUCT.size)
+		if magic != FOOTER_MAGIC:
+			raise CorruptFile("File %r has no index; was it closed properly?"
+					% (filename,))
+
+		try:
+			self.block_offsets = numpy.frombuffer(self._map, INDEX_DTYPE, blocks,
+					size - FOOTER_STRUCT.size - blocks * INDEX_DTYPE.itemsize)
+		except ValueError:
+			raise CorruptFile("File %r is too short for its index of %d blocks"
+					% (filename, blocks))
+
+		self._record_size = (self.ports * self.slots * INPUT_FIELDS *
+				RECORD_DTYPE.itemsize)
+
+	def _state_size(self, block):
+		return BLOCK_STRUCT.unpack_from(self._map, self.block_offsets[block])[0]
+
+	def block_inputs(self, block):
+		"""
+		Return the records of every frame in the given block, as an input table
+		of shape (frames, ports, slots, 3) reading straight from the file.
+		"""
+		start = (int(self.block_offsets[block]) + BLOCK_STRUCT.size +
+				self._state_size(block))
+		frames = min(self.frames_per_block,
+				self.frames - block * self.frames_per_block)
+		records = numpy.frombuffer(self._map, RECORD_DTYPE,
+				frames * self._record_size // RECORD_DTYPE.itemsize, start)
+		return records.reshape((frames, self.ports, self.slots, INPUT_FIELDS))
+
+	def inputs(self, frame):
+		"""
+		Return the record of the given frame, of shape (ports, slots, 3).
+		"""
+		if not 0 <= frame < self.frames:
+			raise IndexError("Frame %d is outside the movie" % (frame,))
+		block, position = divmod(frame, self.frames_per_block)
+		start = (int(self.block_offsets[block]) + BLOCK_STRUCT.size +
+				self._state_size(block) + position * self._record_size)
+		record = numpy.frombuffer(self._map, RECORD_DTYPE,
+				self._record_size // RECORD_DTYPE.itemsize, start)
+		return record.reshape((self.ports, self.slots, INPUT_FIELDS))
+
+	def checkpoint(self, frame):
+		"""
+		Return the savestate taken closest before the given frame, as a tuple
+		of the frame it was taken before and a uint8 array of the state.
+
+		Raises ValueError if the movie has no frames, and so no savestates.
+		"""
+		if len(self.block_offsets) == 0:
+			raise ValueError("The movie has no frames, so no savestates")
+		block = min(frame // self.frames_per_block, len(self.block_offsets) - 1)
+		start = int(self.block_offsets[block]) + BLOCK_STRUCT.size
+		state = numpy.frombuffer(self._map, numpy.uint8,
+				self._state_size(block), start)
+		return block * self.frames_per_block, state
+
+	def seek(self, core, frame):
+		"""
+		Bring the given EmulatedSystem to the start of the given frame.
+
+		Restores the closest earlier savestate, then replays the recorded
+		input up to the frame. Returns the frame reached.
+		"""
+		start, state = self.checkpoint(frame)
+		core.unserialize(state)
+		player = MoviePlayer(self, core, start)
+		try:
+			while player.frame < frame:
+				player.run()
+		finally:
+			player.close()
+		return frame
+
+	def close(self):
+		"""
+		Unmap and close the file.
+
+		Arrays taken from this movie must not be used afterwards.
+		"""
+		self.block_offsets = None
+		self._map.close()
+		self._handle.close()
+
+
+class MoviePlayer(object):
+	"""
+	Plays a movie's input into an EmulatedSystem, one frame per run().
+
+	Input queries are answered from a latched input table, so no Python code
+	runs per query.
+	"""
+	def __init__(self, movie, core, frame=0):
+		self.movie = movie
+		self.frame = frame
+		self._core = core
+		self._table = new_table(1, movie.ports, movie.slots)
+		core.set_input_table(self._table)
+
+	def run(self):
+		"""
+		Run the EmulatedSystem for one frame with the recorded input. Once the
+		movie runs out, no buttons are pressed.
+		"""
+		if self.frame < self.movie.frames:
+			self._table[0] = self.movie.inputs(self.frame)
+		else:
+			self._table[0] = 0
+		self._core.run()
+		self.frame += 1
+
+	def close(self):
+		"""
+		Go back to the input state callback.
+		"""
+		self._core.set_input_table(None)
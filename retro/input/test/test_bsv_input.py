@@ -1,8 +1,9 @@
 #!/usr/bin/python
 import unittest
 import os.path
+import tempfile
 from StringIO import StringIO
-from snes.input import bsv_input
+from retro.input import bsv_input
 
 TESTDIR = os.path.dirname(__file__)
 
@@ -84,5 +85,165 @@ class TestBSVDecode(unittest.TestCase):
 		self.assertEqual(len(saveStateData), 409233)
 
 
+class TestBSVMovie(unittest.TestCase):
+
+	def test_header(self):
+		"""
+		BSVMovie reads the header and savestate in place.
+		"""
+		movie = bsv_input.BSVMovie(os.path.join(TESTDIR, "test.bsv"))
+
+		self.assertEqual(movie.serializerVersion, 15)
+		self.assertEqual(movie.cartCRC, 0)
+		self.assertEqual(len(movie.header), 16)
+		self.assertEqual(movie.header[:4].tostring(), "BSV1")
+		self.assertEqual(len(movie.state), 383968)
+
+		movie.close()
+
+	def test_records_match_bsv_decode(self):
+		"""
+		BSVMovie decodes the same records as bsv_decode.
+		"""
+		bsvPath = os.path.join(TESTDIR,
+				"smw2yi_ssnes-0.9_bsnes-compat-082.bsv")
+		movie = bsv_input.BSVMovie(bsvPath)
+
+		generator = bsv_input.bsv_decode(bsvPath)
+		(serializerVersion, cartCRC, saveStateData) = generator.next()
+
+		self.assertEqual(movie.cartCRC, cartCRC)
+		self.assertEqual(movie.state.tostring(), saveStateData)
+		self.assertEqual(movie.records.tolist(),
+				[generator.next()[0] for _ in movie.records])
+
+		movie.close()
+
+	def test_bad_magic(self):
+		"""
+		BSVMovie rejects files that begin with a bad magic number.
+		"""
+		handle, path = tempfile.mkstemp()
+		os.write(handle, "BAD1xxxxxxxxxxxx")
+		os.close(handle)
+		try:
+			self.assertRaisesRegexp(bsv_input.CorruptFile, "bad magic 'BAD1'",
+					bsv_input.BSVMovie, path)
+		finally:
+			os.remove(path)
+
+	def test_corrupt_file_closed(self):
+		"""
+		BSVMovie closes the file again when it rejects it.
+		"""
+		opened = []
+		def tracking_open(*args):
+			opened.append(open(*args))
+			return opened[-1]
+		handle, path = tempfile.mkstemp()
+		os.close(handle)
+		bsv_input.open = tracking_open
+		try:
+			for contents in ["", "BAD1xxxxxxxxxxxx",
+					"BSV1\0\0\0\0\0\0\0\0\xff\0\0\0"]:
+				with open(path, "wb") as handle:
+					handle.write(contents)
+				self.assertRaises(bsv_input.CorruptFile, bsv_input.BSVMovie, path)
+		finally:
+			del bsv_input.open
+			os.remove(path)
+		self.assertEqual(len(opened), 3)
+		self.assertTrue(all(handle.closed for handle in opened))
+
+	def test_unindexed(self):
+		"""
+		Without an index, playback can only start from the beginning.
+		"""
+		movie = bsv_input.BSVMovie(os.path.join(TESTDIR, "test.bsv"))
+
+		poll, state = movie.callbacks()
+		poll()
+		self.assertEqual([state(0, 1, 0, 0) for _ in range(3)],
+				movie.records[:3].tolist())
+		self.assertRaises(ValueError, movie.callbacks, start_frame=5)
+
+		movie.close()
+
+	def test_seek(self):
+		"""
+		Playback can start from any frame once the frames are indexed.
+		"""
+		movie = bsv_input.BSVMovie(os.path.join(TESTDIR, "test.bsv"))
+
+		frames = movie.index_frames(12)
+		self.assertEqual(frames, len(movie.records) // 12)
+
+		poll, state = movie.callbacks(start_frame=5)
+		poll()
+		self.assertEqual([state(0, 1, 0, id) for id in range(12)],
+				movie.frame_records(5).tolist())
+
+		# Skipping queries doesn't knock playback out of step.
+		state(0, 1, 0, 0)
+		poll()
+		self.assertEqual(state(0, 1, 0, 0), movie.records[6 * 12])
+
+		movie.close()
+
+	def test_uneven_frames(self):
+		"""
+		Frames can have different numbers of records.
+		"""
+		movie = bsv_input.BSVMovie(os.path.join(TESTDIR, "test.bsv"))
+
+		movie.index_frames([1, 2, 3])
+		self.assertEqual(movie.frames, 3)
+		self.assertEqual(movie.frame_offsets.tolist(), [0, 1, 3, 6])
+
+		movie.close()
+
+
+class FakeCore(object):
+	def unserialize(self, state):
+		self.state = bytes(bytearray(state))
+
+	def set_input_state_cb(self, callback):
+		self.input_state = callback
+
+
+class TestSetInputStateFile(unittest.TestCase):
+
+	def test_file_closed(self):
+		"""
+		The movie is closed once its savestate is restored, or once it is
+		found to be for another cart, but its input still plays back.
+		"""
+		opened = []
+		def tracking_open(*args):
+			opened.append(open(*args))
+			return opened[-1]
+		bsvPath = os.path.join(TESTDIR,
+				"smw2yi_ssnes-0.9_bsnes-compat-082.bsv")
+		generator = bsv_input.bsv_decode(bsvPath)
+		(serializerVersion, cartCRC, saveStateData) = generator.next()
+
+		core = FakeCore()
+		bsv_input.open = tracking_open
+		try:
+			bsv_input.set_input_state_file(core, bsvPath,
+					expectedCartCRC=cartCRC)
+			self.assertRaises(bsv_input.CartMismatch,
+					bsv_input.set_input_state_file, FakeCore(), bsvPath,
+					expectedCartCRC=cartCRC + 1)
+		finally:
+			del bsv_input.open
+		self.assertEqual(len(opened), 2)
+		self.assertTrue(all(handle.closed for handle in opened))
+
+		self.assertEqual(core.state, saveStateData)
+		self.assertEqual([core.input_state(0, 1, 0, 0) for _ in range(20000)],
+				[generator.next()[0] for _ in range(20000)])
+
+
 if __name__ == "__main__":
 	unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/python
+import unittest
+
+from retro.globals import (MEMORY_SYSTEM_RAM, DEVICE_ID_JOYPAD_B,
+		DEVICE_ID_JOYPAD_A)
+from retro.input import latched
+from retro.test import stubcore
+
+
+class TestLatchedInput(unittest.TestCase):
+
+	def setUp(self):
+		self.system = stubcore.load()
+
+	def tearDown(self):
+		self.system.close()
+
+	def read_input(self):
+		"""
+		The joypad buttons of port 0 and the mouse axes of port 1, as the
+		stub core last read them.
+		"""
+		ram = self.system.read_memory(MEMORY_SYSTEM_RAM,
+				offset=stubcore.RAM_BUTTONS, size=6)
+		return ram.view("<i2").tolist()
+
+	def test_button_mask(self):
+		self.assertEqual(latched.button_mask(), 0)
+		self.assertEqual(latched.button_mask(DEVICE_ID_JOYPAD_B, 3), 9)
+		self.assertEqual(latched.button_mask(15), -0x8000)
+
+	def test_latched(self):
+		inputs = latched.LatchedInput(self.system)
+		inputs.press(0, DEVICE_ID_JOYPAD_A)
+		inputs.press(0, 15)
+		inputs.set_axes(1, -5, 7)
+		self.system.run()
+		self.assertEqual(self.read_input(), [-0x7f00, -5, 7])
+
+		inputs.release(0, 15)
+		inputs.set_buttons(0, latched.button_mask(DEVICE_ID_JOYPAD_B), index=0)
+		self.system.run()
+		self.assertEqual(self.read_input(), [1, -5, 7])
+
+		inputs.clear()
+		self.system.run()
+		self.assertEqual(self.read_input(), [0, 0, 0])
+
+	def test_poll(self):
+		"""
+		The input poll callback still runs, and can change the input for the
+		frame it is polling for.
+		"""
+		inputs = latched.LatchedInput(self.system)
+		polls = []
+		def poll():
+			polls.append(None)
+			inputs.set_axes(1, len(polls), 0)
+		self.system.set_input_poll_cb(poll)
+		self.system.run_frames(3)
+		self.assertEqual(self.read_input(), [0, 3, 0])
+
+	def test_close(self):
+		inputs = latched.LatchedInput(self.system)
+		inputs.set_buttons(0, 0x7fff)
+		self.system.set_input_state_cb(
+				lambda port, device, index, id: int(port == 1))
+		self.system.run()
+		self.assertEqual(self.read_input(), [0x7fff, 0, 0])
+		inputs.close()
+		self.system.run()
+		self.assertEqual(self.read_input(), [0, 1, 1])
+
+	def test_schedule(self):
+		"""
+		A schedule is played back a frame per poll, from any array of the
+		right shape, and then reads as zeroes.
+		"""
+		schedule = latched.new_table(6)
+		for n in range(6):
+			schedule[n, 0, 0, latched.INPUT_BUTTONS] = n
+			schedule[n, 1, 0, latched.INPUT_X] = -n
+		latched.set_input_schedule(self.system, schedule[::2].tolist())
+		self.system.run()
+		self.assertEqual(self.read_input(), [0, 0, 0])
+		self.system.run_frames(2)
+		self.assertEqual(self.read_input(), [4, -4, 0])
+		self.system.run()
+		self.assertEqual(self.read_input(), [0, 0, 0])
+		self.assertEqual(stubcore.frame_count(self.system), 4)
+
+
+if __name__ == "__main__":
+	unittest.main()
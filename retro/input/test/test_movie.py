@@ -0,0 +1,180 @@
+#!/usr/bin/python
+import unittest
+import os
+import tempfile
+
+import numpy
+
+from retro.globals import DEVICE_JOYPAD, DEVICE_MOUSE
+from retro.input import movie
+from retro.input.latched import INPUT_BUTTONS, INPUT_X, INPUT_Y
+
+
+class FakeCore(object):
+	"""
+	Just enough of an EmulatedSystem to record and play back a movie.
+
+	Every frame it polls, then reads the joypad on port 0 and the mouse on
+	port 1. Its state is the number of frames it has run.
+	"""
+	def __init__(self):
+		self.frame = 0
+		self.table = None
+		self.seen = []
+		self.poll = lambda: None
+
+	def set_input_poll_cb(self, callback):
+		self.poll = callback
+
+	def set_input_state_cb(self, callback):
+		self.state = callback
+
+	def set_input_table(self, table, advance=False):
+		self.table = table
+
+	def _query(self, port, device, index, id):
+		if self.table is None:
+			return self.state(port, device, index, id)
+		entry = self.table[0, port, index]
+		if device == DEVICE_MOUSE and id < 2:
+			return entry[INPUT_X + id]
+		return (int(entry[INPUT_BUTTONS]) >> id) & 1
+
+	def run(self):
+		self.poll()
+		buttons = [self._query(0, DEVICE_JOYPAD, 0, id) for id in range(12)]
+		x = self._query(1, DEVICE_MOUSE, 0, 0)
+		y = self._query(1, DEVICE_MOUSE, 0, 1)
+		self.seen.append((self.frame, buttons, x, y))
+		self.frame += 1
+
+	def serialize(self):
+		return numpy.array([self.frame], numpy.uint32).view(numpy.uint8)
+
+	def unserialize(self, state):
+		self.frame = int(numpy.frombuffer(state, numpy.uint32)[0])
+
+
+def scripted_input(core):
+	"""
+	Input that depends on the frame, so every frame's record is different.
+	"""
+	def state(port, device, index, id):
+		if port == 0:
+			return int(id == core.frame % 12)
+		return core.frame * (id + 1)
+	return state
+
+
+class TestMovie(unittest.TestCase):
+
+	def setUp(self):
+		handle, self.path = tempfile.mkstemp()
+		os.close(handle)
+
+	def tearDown(self):
+		os.remove(self.path)
+
+	def record(self, frames, frames_per_block=10):
+		core = FakeCore()
+		recorder = movie.MovieRecorder(core, self.path, scripted_input(core),
+				lambda: None, frames_per_block=frames_per_block)
+		for _ in range(frames):
+			recorder.run()
+		recorder.close()
+		return core.seen
+
+	def test_round_trip(self):
+		"""
+		Every frame's input can be read back.
+		"""
+		self.record(25)
+		m = movie.Movie(self.path)
+
+		self.assertEqual(m.frames, 25)
+		self.assertEqual(len(m.block_offsets), 3)
+		for frame in range(25):
+			record = m.inputs(frame)
+			self.assertEqual(record[0, 0, INPUT_BUTTONS], 1 << (frame % 12))
+			self.assertEqual(record[1, 0, INPUT_X], frame)
+			self.assertEqual(record[1, 0, INPUT_Y], frame * 2)
+
+		self.assertEqual(m.block_inputs(2).shape, (5, 2, 1, 3))
+		self.assertRaises(IndexError, m.inputs, 25)
+		m.close()
+
+	def test_checkpoints(self):
+		"""
+		Each block holds a savestate from just before its first frame.
+		"""
+		self.record(25)
+		m = movie.Movie(self.path)
+
+		for frame, expected in [(0, 0), (9, 0), (10, 10), (24, 20)]:
+			start, state = m.checkpoint(frame)
+			self.assertEqual(start, expected)
+			self.assertEqual(numpy.frombuffer(state, numpy.uint32)[0], expected)
+		m.close()
+
+	def test_seek_replays_recording(self):
+		"""
+		Seeking restores a savestate and replays the movie from there.
+		"""
+		recorded = self.record(25)
+		m = movie.Movie(self.path)
+
+		core = FakeCore()
+		m.seek(core, 17)
+		self.assertEqual(core.frame, 17)
+
+		player = movie.MoviePlayer(m, core, 17)
+		player.run()
+		self.assertEqual(core.seen[-1], recorded[17])
+		player.close()
+		m.close()
+
+	def test_empty_movie(self):
+		"""
+		A movie without frames opens, but has nowhere to seek to.
+		"""
+		self.record(0)
+		m = movie.Movie(self.path)
+		self.assertEqual((m.frames, len(m.block_offsets)), (0, 0))
+		self.assertRaises(ValueError, m.checkpoint, 0)
+		self.assertRaises(ValueError, m.seek, FakeCore(), 0)
+		m.close()
+
+	def test_bad_index(self):
+		"""
+		A block count that doesn't fit in the file is refused.
+		"""
+		self.record(5)
+		with open(self.path, 'r+b') as f:
+			f.seek(-movie.FOOTER_STRUCT.size, os.SEEK_END)
+			f.write(movie.FOOTER_STRUCT.pack(5, 1000, movie.FOOTER_MAGIC))
+		self.assertRaises(movie.CorruptFile, movie.Movie, self.path)
+
+	def test_unfinished_movie(self):
+		"""
+		Movies that were never closed are rejected.
+		"""
+		core = FakeCore()
+		recorder = movie.MovieRecorder(core, self.path, scripted_input(core))
+		recorder.run()
+		recorder._handle.close()
+
+		# The file is closed again once it has been rejected.
+		opened = []
+		def tracking_open(*args):
+			opened.append(open(*args))
+			return opened[-1]
+		movie.open = tracking_open
+		try:
+			self.assertRaises(movie.CorruptFile, movie.Movie, self.path)
+		finally:
+			del movie.open
+		self.assertTrue(opened[0].closed)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,138 @@
+"""
+Find out where the time of each frame goes: the core, or our callbacks.
+
+FrameProfiler has the Cython layer record, for every frame run, how long
+it took, how much of that was spent in the core itself and how much in
+each kind of callback, how often each callback was called, and how many
+bytes the wrapper copied. The records go into a fixed-size ring, and can
+be summarised with percentiles or exported as a Chrome trace, to look at
+in chrome://tracing or Perfetto.
+"""
+import json
+
+import numpy
+
+# The fields of each frame's record, in order. Times are in seconds;
+# "start" is counted from when profiling started.
+FIELDS = (
+		"start", "total", "core",
+		"environment_time", "environment_calls",
+		"video_time", "video_calls",
+		"audio_time", "audio_calls",
+		"input_poll_time", "input_polls",
+		"input_state_time", "input_queries",
+		"audio_frames", "bytes_copied",
+	)
+
+# The time spent in the core, and in each kind of callback, which add up to
+# the frame's total.
+PARTS = ("core", "environment_time", "video_time", "audio_time",
+		"input_poll_time", "input_state_time")
+
+
+class FrameProfiler(object):
+	"""
+	Profiles the frames run by an EmulatedSystem into a ring of "slots"
+	records.
+
+	Each record is a row of a float64 array with a column for each of
+	FIELDS. Only the last "slots" frames are kept.
+	"""
+	def __init__(self, core, slots=1024):
+		"""
+		Start profiling the given EmulatedSystem. Call close() to stop.
+		"""
+		self.profile = numpy.zeros((slots, len(FIELDS)), numpy.float64)
+		self.slots = slots
+		self._core = core
+		core.set_profile(self.profile)
+
+	@property
+	def count(self):
+		"""
+		The number of frames profiled so far.
+		"""
+		return self._core._lib.retro_get_profile_count()
+
+	def frames(self):
+		"""
+		Return a copy of the records in the ring, oldest first, as
+		a (frames, len(FIELDS)) array.
+		"""
+		count = self.count
+		if count <= self.slots:
+			return self.profile[:count].copy()
+		first = count % self.slots
+		return numpy.concatenate((self.profile[first:], self.profile[:first]))
+
+	def field(self, name, frames=None):
+		"""
+		Return the column called "name" of "frames", by default the records
+		in the ring.
+		"""
+		if frames is None:
+			frames = self.frames()
+		return frames[:, FIELDS.index(name)]
+
+	def summary(self, percentiles=(50, 90, 99)):
+		"""
+		Return a dict mapping each field but "start" to a dict of its "mean",
+		"max" and the given percentiles (as "p50" and so on) over the records
+		in the ring. Empty if no frames have been profiled.
+		"""
+		frames = self.frames()
+		if not len(frames):
+			return {}
+		points = numpy.percentile(frames, percentiles, axis=0)
+		means = frames.mean(axis=0)
+		maxima = frames.max(axis=0)
+		summary = {}
+		for i, name in enumerate(FIELDS):
+			if name == "start":
+				continue
+			stats = {"mean": means[i], "max": maxima[i]}
+			for p, values in zip(percentiles, points):
+				stats["p%g" % p] = values[i]
+			summary[name] = stats
+		return summary
+
+	def trace_events(self):
+		"""
+		Return the records in the ring as a list of Chrome trace events: a
+		complete event for each frame, with its record as arguments, and a
+		counter event breaking its time down into PARTS, in milliseconds.
+		"""
+		columns = [FIELDS.index(name) for name in PARTS]
+		events = []
+		for row in self.frames():
+			start = row[0] * 1e6
+			events.append({
+					"name": "frame", "ph": "X", "pid": 1, "tid": 1,
+					"ts": start, "dur": row[1] * 1e6,
+					"args": dict(zip(FIELDS[1:], row[1:].tolist())),
+				})
+			events.append({
+					"name": "frame time (ms)", "ph": "C", "pid": 1,
+					"ts": start,
+					"args": dict((name, row[c] * 1e3)
+							for name, c in zip(PARTS, columns)),
+				})
+		return events
+
+	def chrome_trace(self, filenameOrHandle):
+		"""
+		Write the records in the ring to "filenameOrHandle", a filename or a
+		file-handle opened in "w" mode, in the Chrome trace event format.
+		"""
+		trace = {"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}
+		if isinstance(filenameOrHandle, basestring):
+			with open(filenameOrHandle, "w") as handle:
+				json.dump(trace, handle)
+		else:
+			json.dump(trace, filenameOrHandle)
+
+	def close(self):
+		"""
+		Stop profiling.
+		"""
+		self._core.set_profile(None)
@@ -0,0 +1,202 @@
+"""
+Find where a game keeps a variable, such as a score or a health counter.
+
+A RamSearch takes snapshots of a game's memory as it runs, and narrows down
+a set of candidate addresses by how the values there behave: whether they
+changed, went up by one, equal a known value, and so on. Every filter is
+a single vectorized NumPy operation over all of the candidates.
+"""
+import numpy
+
+from retro.globals import MEMORY_SYSTEM_RAM
+
+
+class RamSearch(object):
+	"""
+	A set of candidate addresses in a game's memory, and recent snapshots of
+	that memory.
+
+	Call snapshot() after each frame (or whenever the variable you're looking
+	for should have changed), then call the filters to keep only the
+	candidates that behave like it. Filters compare the latest snapshot with
+	a given value, or with the snapshot before it when no value is given.
+	"""
+	def __init__(self, core, width=1, signed=False, big_endian=False,
+			aligned=True, history=2, mem_type=MEMORY_SYSTEM_RAM):
+		"""
+		Start a search in the given memory of the given EmulatedSystem, which
+		must have a game loaded.
+
+		"width" is the size of the variable in bytes: 1, 2 or 4. "signed" and
+		"big_endian" say how its bytes are read. If "aligned" is true, only
+		addresses that are a multiple of "width" are candidates.
+
+		The last "history" snapshots are kept, for values() and
+		filter_history(). At least two are always kept.
+		"""
+		if width not in (1, 2, 4):
+			raise ValueError("width must be 1, 2 or 4, not %r" % (width,))
+		self._core = core
+		self.mem_type = mem_type
+		self.width = width
+		self.aligned = aligned
+		self.dtype = numpy.dtype('%s%s%d' % ('>' if big_endian else '<',
+				'i' if signed else 'u', width))
+
+		memory = core.memory_view(mem_type)
+		self.size = 0 if memory is None else memory.nbytes
+		if self.size < width:
+			raise ValueError("Memory type %d has only %d bytes" % (mem_type,
+					self.size))
+		self._snapshots = numpy.zeros((max(history, 2), self.size), numpy.uint8)
+		# How many snapshots have been taken.
+		self.snapshots = 0
+		self.reset()
+
+	def reset(self):
+		"""
+		Make every address a candidate again. Snapshots are kept.
+		"""
+		step = self.width if self.aligned else 1
+		self.candidates = numpy.arange(0, self.size - self.width + 1, step,
+				dtype=numpy.intp)
+
+	def __len__(self):
+		return len(self.candidates)
+
+	def snapshot(self):
+		"""
+		Copy the memory as it is now into the next snapshot.
+		"""
+		row = self._snapshots[self.snapshots % len(self._snapshots)]
+		self._core.read_memory(self.mem_type, row)
+		self.snapshots += 1
+
+	def _gather(self, rows):
+		"""
+		Return the candidates' values in the given snapshot rows, as an array
+		of shape (len(rows), candidates).
+		"""
+		native = self.dtype.newbyteorder('=')
+		if self.aligned or self.width == 1:
+			# View each row as whole values, leaving out any bytes after the
+			# last one.
+			words = numpy.ndarray((len(rows), self.size // self.width),
+					self.dtype, rows, 0, (rows.strides[0], self.width))
+			return numpy.take(words, self.candidates // self.width,
+					axis=1).astype(native)
+
+		# Assemble unaligned values a byte at a time, most significant first.
+		order = range(self.width)
+		if self.dtype.byteorder == '<' or (self.dtype.byteorder == '='
+				and numpy.little_endian):
+			order.reverse()
+		values = numpy.zeros((len(rows), len(self.candidates)), numpy.uint32)
+		for byte in order:
+			values <<= 8
+			values |= numpy.take(rows, self.candidates + byte, axis=1)
+		return values.astype(native)
+
+	def _rows(self, frames):
+		"""
+		Return the last "frames" snapshots, oldest first.
+		"""
+		if frames > min(self.snapshots, len(self._snapshots)):
+			raise ValueError("Need %d snapshots, but only %d are kept"
+					% (frames, min(self.snapshots, len(self._snapshots))))
+		index = numpy.arange(self.snapshots - frames, self.snapshots)
+		return self._snapshots[index % len(self._snapshots)]
+
+	def values(self, frames=1):
+		"""
+		Return the candidates' values in the last "frames" snapshots, as an
+		array of shape (frames, candidates), oldest first.
+		"""
+		return self._gather(self._rows(frames))
+
+	def filter(self, predicate):
+		"""
+		Keep the candidates for which predicate(current, previous) is true.
+
+		"predicate" is given the candidates' values in the latest snapshot and
+		the one before it, as int64 arrays, and must return a boolean array.
+		Returns the number of candidates left.
+		"""
+		previous, current = self.values(2).astype(numpy.int64)
+		self.candidates = self.candidates[predicate(current, previous)]
+		return len(self.candidates)
+
+	def filter_history(self, predicate, frames=None):
+		"""
+		Keep the candidates for which predicate(values) is true.
+
+		"predicate" is given the candidates' values over the last "frames"
+		snapshots (by default, every snapshot kept) as an array of shape
+		(frames, candidates), oldest first, and must return a boolean array of
+		one value per candidate. Returns the number of candidates left.
+		"""
+		if frames is None:
+			frames = min(self.snapshots, len(self._snapshots))
+		self.candidates = self.candidates[predicate(self.values(frames))]
+		return len(self.candidates)
+
+	def _compare(self, op, value):
+		if value is None:
+			return self.filter(op)
+		current = self.values(1)[0]
+		self.candidates = self.candidates[op(current, value)]
+		return len(self.candidates)
+
+	def equal(self, value=None):
+		"""
+		Keep candidates equal to "value", or unchanged if no value is given.
+		"""
+		return self._compare(numpy.equal, value)
+
+	def not_equal(self, value=None):
+		"""
+		Keep candidates not equal to "value", or changed if no value is given.
+		"""
+		return self._compare(numpy.not_equal, value)
+
+	def greater(self, value=None):
+		"""
+		Keep candidates greater than "value", or than their previous value.
+		"""
+		return self._compare(numpy.greater, value)
+
+	def less(self, value=None):
+		"""
+		Keep candidates less than "value", or than their previous value.
+		"""
+		return self._compare(numpy.less, value)
+
+	def changed(self):
+		"""
+		Keep candidates whose value changed since the previous snapshot.
+		"""
+		return self.not_equal()
+
+	def unchanged(self):
+		"""
+		Keep candidates whose value is the same as in the previous snapshot.
+		"""
+		return self.equal()
+
+	def increased(self, by=None):
+		"""
+		Keep candidates that went up since the previous snapshot, or went up
+		by exactly "by" if it's given.
+		"""
+		if by is None:
+			return self.greater()
+		return self.filter(lambda current, previous: current - previous == by)
+
+	def decreased(self, by=None):
+		"""
+		Keep candidates that went down since the previous snapshot, or went
+		down by exactly "by" if it's given.
+		"""
+		if by is None:
+			return self.less()
+		return self.filter(lambda current, previous: previous - current == by)
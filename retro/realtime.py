@@ -0,0 +1,203 @@
+"""
+Run an EmulatedSystem in real time.
+
+Frames are scheduled on a fixed grid of deadlines, frame n being due at
+start + n / fps on a monotonic clock, so lateness in one frame never pushes
+back the frames after it and the frame rate doesn't drift. If emulation
+falls more than "max_late" frames behind (say, after the process was
+suspended), the grid is moved forward instead of running a burst of frames
+to catch up.
+
+FrameClock.tick() waits for the next deadline with time.sleep(). With
+asyncio (Python 3), a FrameClock is also an async iterator, and
+run_realtime() runs a core from the event loop, so other coroutines can
+handle the network or input between frames:
+
+	async for frame in run_realtime(core):
+		...
+"""
+import time
+
+try:
+	import asyncio
+except ImportError:
+	asyncio = None
+
+try:
+	_monotonic = time.monotonic
+except AttributeError:
+	_monotonic = time.time
+
+
+class FrameClock(object):
+	"""
+	Deadlines for frames at a fixed rate, and statistics on how well they
+	were met.
+
+	"jitter" below is how far after its deadline a frame actually started. A
+	frame is late if it started more than "tolerance" seconds after its
+	deadline.
+	"""
+	def __init__(self, fps, max_late=5, tolerance=0.002, clock=None,
+			sleep=time.sleep):
+		"""
+		"clock" returns the current time in seconds; it defaults to a
+		monotonic clock. When iterating with asyncio, deadlines are converted
+		to the event loop's clock, so any clock may be used.
+		"""
+		self.fps = float(fps)
+		self.period = 1.0 / self.fps
+		self.max_late = max_late
+		self.tolerance = tolerance
+		self._clock = clock
+		self._sleep = sleep
+		self._start = None
+		self.reset_stats()
+
+	def reset_stats(self):
+		self.frames = 0
+		self.late_frames = 0
+		self.resyncs = 0
+		self._jitter_total = 0.0
+		self._jitter_squares = 0.0
+		self.max_jitter = 0.0
+
+	def now(self):
+		"""
+		Return the current time on the clock.
+		"""
+		return (self._clock or _monotonic)()
+
+	def next_deadline(self):
+		"""
+		Return the time the next frame is due.
+		"""
+		if self._start is None:
+			self._start = self.now()
+			self._frame = 0
+		return self._start + self._frame * self.period
+
+	def frame_started(self, now=None):
+		"""
+		Note that the next frame has started, at "now" if given. Returns the
+		frame's number.
+		"""
+		if now is None:
+			now = self.now()
+		deadline = self.next_deadline()
+		late = now - deadline
+		if late > self.max_late * self.period:
+			# Too far behind to catch up; start a new grid from here.
+			self._start = now
+			self._frame = 0
+			self.resyncs += 1
+			late = 0.0
+
+		jitter = max(late, 0.0)
+		self._jitter_total += jitter
+		self._jitter_squares += jitter * jitter
+		self.max_jitter = max(self.max_jitter, jitter)
+		if late > self.tolerance:
+			self.late_frames += 1
+
+		self._frame += 1
+		self.frames += 1
+		return self.frames - 1
+
+	def tick(self):
+		"""
+		Sleep until the next frame is due, and return its number.
+		"""
+		delay = self.next_deadline() - self.now()
+		if delay > 0:
+			self._sleep(delay)
+		return self.frame_started()
+
+	def stats(self):
+		"""
+		Return a dict of statistics on the frames so far: their number, how
+		many were late, and the mean, standard deviation and maximum of the
+		jitter, in seconds.
+		"""
+		frames = self.frames
+		mean = self._jitter_total / frames if frames else 0.0
+		variance = self._jitter_squares / frames - mean * mean if frames else 0.0
+		return {
+				"frames": frames,
+				"late_frames": self.late_frames,
+				"late_ratio": float(self.late_frames) / frames if frames else 0.0,
+				"resyncs": self.resyncs,
+				"mean_jitter": mean,
+				"jitter_stddev": max(variance, 0.0) ** 0.5,
+				"max_jitter": self.max_jitter,
+			}
+
+	def _loop(self):
+		return asyncio.get_event_loop()
+
+	def __aiter__(self):
+		return self
+
+	def __anext__(self):
+		"""
+		Return a future for the number of the next frame, which completes
+		when it is due.
+		"""
+		return self._schedule(lambda: None)
+
+	def _schedule(self, work, limit=None):
+		"""
+		Return a future which, when the next frame is due, calls "work" and
+		completes with the frame's number, or ends the iteration once
+		"limit" frames have run.
+		"""
+		loop = self._loop()
+		future = loop.create_future()
+		if limit is not None and self.frames >= limit:
+			future.set_exception(StopAsyncIteration())
+			return future
+
+		def run():
+			if future.cancelled():
+				return
+			frame = self.frame_started()
+			try:
+				work()
+			except Exception as e:
+				future.set_exception(e)
+			else:
+				future.set_result(frame)
+
+		loop.call_at(loop.time() + (self.next_deadline() - self.now()), run)
+		return future
+
+
+class RealtimeRunner(object):
+	"""
+	An async iterator running an EmulatedSystem in real time; see
+	run_realtime().
+	"""
+	def __init__(self, core, frames=None, **clock_args):
+		self.core = core
+		self.limit = frames
+		self.clock = FrameClock(core.get_refresh_rate(), **clock_args)
+
+	def __aiter__(self):
+		return self
+
+	def __anext__(self):
+		return self.clock._schedule(self.core.run, self.limit)
+
+
+def run_realtime(core, frames=None, **clock_args):
+	"""
+	Return an async iterator running the given EmulatedSystem in real time,
+	at its game's frame rate, and yielding the number of each frame after it
+	has run. Stops after "frames" frames if given.
+
+	Each frame runs straight from an event loop callback at its deadline,
+	not when the iterating coroutine gets around to it, so other coroutines
+	add no latency to it. The FrameClock is available as the iterator's
+	"clock" attribute, for its statistics; "clock_args" are passed to it.
+	"""
+	return RealtimeRunner(core, frames, **clock_args)
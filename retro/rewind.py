@@ -0,0 +1,127 @@
+"""
+Rewind support for EmulatedSystem.
+
+Savestates are large, but consecutive ones differ in only a few bytes. The
+RewindBuffer keeps the most recent state whole and every earlier one as the
+XOR of it with the state after it, which is mostly zeroes and compresses
+extremely well.
+"""
+from collections import deque
+
+import numpy
+
+from retro.compression import get_codec
+
+
+def _xor(a, b, out):
+	"""
+	XOR two uint8 arrays into "out", eight bytes at a time when possible.
+	"""
+	if len(out) % 8 == 0:
+		a, b, out = a.view(numpy.uint64), b.view(numpy.uint64), out.view(numpy.uint64)
+	numpy.bitwise_xor(a, b, out)
+
+
+class RewindBuffer(object):
+	"""
+	A history of savestates for an EmulatedSystem, within a memory budget.
+
+	Call frame() after every run(). Every "interval" frames the state is
+	captured. step_back() goes back to an earlier capture. When the history
+	grows beyond "budget" bytes, the oldest captures are forgotten.
+	"""
+	def __init__(self, core, interval=1, budget=64 * 1024 * 1024,
+			codec='zlib', level=1):
+		"""
+		Start keeping history for the given EmulatedSystem, which must have
+		a game loaded.
+
+		"codec" is one of retro.compression.CODECS, and "level" the compression
+		level to use with it.
+		"""
+		self._core = core
+		self.interval = interval
+		self.budget = budget
+		self._compress, self._decompress = get_codec(codec, level)
+
+		size = core.serialize_size()
+		self._current = numpy.empty(size, numpy.uint8)
+		self._scratch = numpy.empty(size, numpy.uint8)
+		self._have_current = False
+
+		# Compressed deltas, oldest first. XORing the newest delta with
+		# the current state gives the capture before it, and so on.
+		self._deltas = deque()
+		self._delta_bytes = 0
+		self._frames = 0
+
+		# How many captures have been forgotten to stay within the budget.
+		self.evicted = 0
+
+	def __len__(self):
+		"""
+		The number of steps step_back() can go back.
+		"""
+		return len(self._deltas)
+
+	@property
+	def stored_bytes(self):
+		"""
+		The memory used by the history, including the current state.
+		"""
+		return self._delta_bytes + self._current.nbytes
+
+	def frame(self):
+		"""
+		Note that a frame has been run, capturing the state if it's due.
+		"""
+		self._frames += 1
+		if self._frames >= self.interval:
+			self.capture()
+
+	def capture(self):
+		"""
+		Capture the current state now.
+		"""
+		self._frames = 0
+		self._core.serialize_into(self._scratch)
+		if self._have_current:
+			_xor(self._current, self._scratch, self._current)
+			delta = self._compress(self._current)
+			self._deltas.append(delta)
+			self._delta_bytes += len(delta)
+		self._current, self._scratch = self._scratch, self._current
+		self._have_current = True
+
+		while self.stored_bytes > self.budget and self._deltas:
+			self._delta_bytes -= len(self._deltas.popleft())
+			self.evicted += 1
+
+	def step_back(self, steps=1):
+		"""
+		Go back the given number of captures, or as far as the history goes,
+		and restore the EmulatedSystem to that state. Each step is "interval"
+		frames.
+
+		The captures stepped over are forgotten. Returns the number of steps
+		taken.
+		"""
+		steps = min(steps, len(self._deltas))
+		for _ in range(steps):
+			delta = self._deltas.pop()
+			self._delta_bytes -= len(delta)
+			_xor(self._current, numpy.frombuffer(self._decompress(delta),
+					numpy.uint8), self._current)
+		if self._have_current:
+			self._core.unserialize(self._current)
+		self._frames = 0
+		return steps
+
+	def clear(self):
+		"""
+		Forget all history.
+		"""
+		self._deltas.clear()
+		self._delta_bytes = 0
+		self._have_current = False
+		self._frames = 0
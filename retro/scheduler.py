@@ -0,0 +1,175 @@
+"""
+Keep an EmulatedSystem in time on a host that can't always keep up.
+
+FrameScheduler runs a core at its game's frame rate, as
+realtime.FrameClock does, with two corrections on top:
+
+	- Dynamic rate control: the game's audio is resampled by a ratio within
+	  "max_delta" of 1, chosen from how full the audio sink's buffer is, so
+	  the buffer neither runs dry nor overflows when the host's audio clock
+	  and the game's sample rate disagree. A half percent is too little to
+	  hear as a change of pitch.
+
+	- Frameskip: while emulation is more than a frame behind its schedule,
+	  frames are run with their video skipped (see
+	  EmulatedSystem.set_video_skip()), at most "max_skip" in a row, so a
+	  frame is still shown every so often.
+"""
+import time
+
+import numpy
+
+from retro.realtime import FrameClock
+
+
+class RateControl(object):
+	"""
+	Chooses a resampling ratio from how full an audio buffer is.
+
+	The ratio is 1 when the buffer is "target" full, and moves linearly to
+	1 + max_delta as it empties (to produce more audio) and to 1 - max_delta
+	as it fills up.
+	"""
+	def __init__(self, max_delta=0.005, target=0.5):
+		self.max_delta = max_delta
+		self.target = target
+
+	def ratio(self, fill):
+		"""
+		Return the ratio of output to input samples for a buffer which is
+		"fill" full, between 0 and 1.
+		"""
+		fill = min(max(fill, 0.0), 1.0)
+		if fill < self.target:
+			error = (self.target - fill) / self.target
+		else:
+			error = (self.target - fill) / (1.0 - self.target)
+		return 1.0 + self.max_delta * error
+
+
+class Resampler(object):
+	"""
+	Resamples a stream of (frames, 2) int16 audio by a ratio which may change
+	from one call to the next, with linear interpolation.
+
+	The last frame and the fractional position between frames are carried
+	over between calls, so the stream has no seams.
+	"""
+	def __init__(self):
+		self._last = numpy.zeros((1, 2), numpy.float64)
+		# Position of the next output frame, where 0 is self._last and 1 is
+		# the first frame of the next input.
+		self._pos = 1.0
+
+	def resample(self, data, ratio):
+		"""
+		Return "data" resampled to "ratio" times as many frames, give or take
+		one.
+		"""
+		frames = len(data)
+		if not frames:
+			return data
+		source = numpy.concatenate((self._last, data))
+		step = 1.0 / ratio
+		count = max(int((frames - self._pos) // step) + 1, 0)
+		positions = self._pos + numpy.arange(count) * step
+		# A position of exactly "frames" is the last input frame, with a weight
+		# of 1.
+		indexes = numpy.minimum(positions.astype(numpy.intp), frames - 1)
+		weights = (positions - indexes)[:, None]
+		out = source[indexes] * (1 - weights) + source[indexes + 1] * weights
+
+		self._pos += count * step - frames
+		self._last = source[-1:]
+		return numpy.rint(out).astype(numpy.int16)
+
+
+class FrameScheduler(object):
+	"""
+	Runs an EmulatedSystem in real time, skipping video to catch up when it
+	falls behind, and keeping the audio sink's buffer level steady.
+
+	"audio_sink" is an audio.pygame_output.AudioSink, or anything else with
+	its write() method, "buffered" attribute and "ring" buffer; if given,
+	the scheduler takes over the core's audio batch callback to feed it.
+
+	"skipped_frames" counts the frames whose video was skipped, "frame_time"
+	is a moving average of the time run() took per frame, in seconds, and
+	"ratio" is the last audio resampling ratio used.
+	"""
+	def __init__(self, core, audio_sink=None, max_skip=3, max_delta=0.005,
+			clock=None, sleep=time.sleep):
+		self.core = core
+		self.clock = FrameClock(core.get_refresh_rate(), clock=clock,
+				sleep=sleep)
+		self.max_skip = max_skip
+
+		self.skipped_frames = 0
+		self.frame_time = 0.0
+		self._skipping = 0
+
+		self.audio_sink = audio_sink
+		self.rate_control = RateControl(max_delta)
+		self.resampler = Resampler()
+		self.ratio = 1.0
+		if audio_sink is not None:
+			core.set_audio_sample_batch_cb(self._batch)
+			core.set_audio_accumulate(True)
+
+	def _batch(self, data, frames):
+		sink = self.audio_sink
+		self.ratio = self.rate_control.ratio(
+				float(sink.buffered) / len(sink.ring))
+		sink.write(self.resampler.resample(data, self.ratio))
+		pump = getattr(sink, "pump", None)
+		if pump is not None:
+			pump()
+
+	def step(self):
+		"""
+		Wait until the next frame is due, if it isn't already, and run it.
+		Returns the frame's number.
+		"""
+		clock = self.clock
+		behind = clock.now() - clock.next_deadline()
+		skip = behind > clock.period and self._skipping < self.max_skip
+		if skip != bool(self._skipping):
+			self.core.set_video_skip(skip)
+		if skip:
+			self._skipping += 1
+			self.skipped_frames += 1
+		else:
+			self._skipping = 0
+
+		frame = clock.tick()
+		start = clock.now()
+		self.core.run()
+		elapsed = clock.now() - start
+		if frame:
+			self.frame_time += (elapsed - self.frame_time) * 0.1
+		else:
+			self.frame_time = elapsed
+		return frame
+
+	def run(self, frames=None):
+		"""
+		Run frames until "frames" of them have run, or forever.
+		"""
+		try:
+			while frames is None or self.clock.frames < frames:
+				self.step()
+		finally:
+			if self._skipping:
+				self._skipping = 0
+				self.core.set_video_skip(False)
+
+	def stats(self):
+		"""
+		Return the statistics of the FrameClock (see FrameClock.stats()),
+		along with "skipped_frames", "frame_time" and "ratio".
+		"""
+		stats = self.clock.stats()
+		stats["skipped_frames"] = self.skipped_frames
+		stats["frame_time"] = self.frame_time
+		stats["ratio"] = self.ratio
+		return stats
@@ -0,0 +1,241 @@
+"""
+A content-addressed, compressed store for savestates.
+
+States are filed under a hash of their contents, so storing a state that is
+already in the store costs nothing but the hash. Compressing and writing
+happen on a background thread, so put() returns as soon as the state has
+been copied, and an in-memory LRU cache sits in front of the disk.
+"""
+import hashlib
+import mmap
+import os
+import threading
+import tempfile
+from collections import OrderedDict
+
+try:
+	import queue
+except ImportError:
+	import Queue as queue
+
+import numpy
+
+from retro.compression import get_codec
+
+_STOP = object()
+
+
+class StateStore(object):
+	"""
+	Savestates stored in a directory, under the SHA-1 of their contents.
+
+	A directory should always be used with the same codec.
+	"""
+	def __init__(self, directory, codec='zlib', level=1, cache_size=64,
+			queue_size=64):
+		"""
+		Open the store in the given directory, creating it if necessary.
+
+		"codec" is one of retro.compression.CODECS, and "level" the compression
+		level to use with it. The most recently used "cache_size" states are
+		kept in memory. At most "queue_size" states wait to be written before
+		put() blocks.
+		"""
+		self.directory = directory
+		if not os.path.isdir(directory):
+			os.makedirs(directory)
+		self._compress, self._decompress = get_codec(codec, level)
+		self._raw = codec is None
+
+		self._cache = OrderedDict()
+		self._cache_size = cache_size
+		# States that have been put() but not written yet.
+		self._pending = {}
+		self._lock = threading.Lock()
+
+		self.puts = 0
+		self.dedups = 0
+		self.cache_hits = 0
+		self.disk_loads = 0
+		self.bytes_written = 0
+		self._error = None
+		# Keys of states the writer failed to write.
+		self._failed = []
+
+		self._queue = queue.Queue(queue_size)
+		self._writer = threading.Thread(target=self._write_loop)
+		self._writer.daemon = True
+		self._writer.start()
+
+	def _path(self, key):
+		return os.path.join(self.directory, key[:2], key)
+
+	def _remember(self, key, data):
+		"""
+		Put the given state at the front of the cache.
+		"""
+		self._cache[key] = data
+		if len(self._cache) > self._cache_size:
+			self._cache.popitem(last=False)
+
+	def _write_loop(self):
+		while True:
+			item = self._queue.get()
+			if item is _STOP:
+				self._queue.task_done()
+				return
+			key, data = item
+			try:
+				path = self._path(key)
+				if not os.path.exists(path):
+					self._write(path, self._compress(data))
+			except Exception as e:
+				with self._lock:
+					self._failed.append(key)
+					self._error = e
+			finally:
+				with self._lock:
+					del self._pending[key]
+				self._queue.task_done()
+
+	def _write(self, path, blob):
+		"""
+		Write the file in one go, so readers never see half of it.
+		"""
+		directory = os.path.dirname(path)
+		if not os.path.isdir(directory):
+			try:
+				os.makedirs(directory)
+			except OSError:
+				if not os.path.isdir(directory):
+					raise
+		handle, temp = tempfile.mkstemp(dir=directory)
+		try:
+			os.write(handle, blob)
+		finally:
+			os.close(handle)
+		os.rename(temp, path)
+		self.bytes_written += len(blob)
+
+	def _check_writer(self):
+		"""
+		Raise the last error the writer ran into, if any, forgetting the states
+		it failed to write so that they are written again when next put().
+		"""
+		with self._lock:
+			failed, self._failed = self._failed, []
+			error, self._error = self._error, None
+		for key in failed:
+			self._cache.pop(key, None)
+		if error is not None:
+			raise error
+
+	def __contains__(self, key):
+		with self._lock:
+			if key in self._pending:
+				return True
+		return key in self._cache or os.path.exists(self._path(key))
+
+	def put(self, state):
+		"""
+		Store the given state, which may be any buffer, and return its key.
+
+		The state is copied before put() returns, so the buffer may be reused
+		straight away. If writing an earlier state failed, the error is raised
+		here instead.
+		"""
+		self._check_writer()
+		self.puts += 1
+		key = hashlib.sha1(state).hexdigest()
+		if key in self._cache:
+			self._cache[key] = self._cache.pop(key)
+			self.dedups += 1
+			return key
+		if key in self:
+			self.dedups += 1
+			return key
+
+		data = numpy.frombuffer(state, numpy.uint8).tostring()
+		self._remember(key, data)
+		with self._lock:
+			self._pending[key] = data
+		self._queue.put((key, data))
+		return key
+
+	def get(self, key):
+		"""
+		Return the state with the given key, as a buffer for unserialize().
+
+		Raises KeyError if there is no such state.
+		"""
+		self._check_writer()
+		if key in self._cache:
+			self.cache_hits += 1
+			data = self._cache.pop(key)
+			self._cache[key] = data
+			return data
+		with self._lock:
+			data = self._pending.get(key)
+		if data is None:
+			data = self._load(key)
+		self._remember(key, data)
+		return data
+
+	def _load(self, key):
+		try:
+			handle = open(self._path(key), 'rb')
+		except IOError:
+			raise KeyError(key)
+		self.disk_loads += 1
+		with handle:
+			mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+		if self._raw:
+			# Hand out the mapping itself; it stays valid after the file is
+			# closed.
+			return numpy.frombuffer(mapped, numpy.uint8)
+		try:
+			return self._decompress(mapped)
+		finally:
+			mapped.close()
+
+	def load_into(self, core, key):
+		"""
+		Restore the given EmulatedSystem to the state with the given key.
+		"""
+		core.unserialize(self.get(key))
+
+	def stats(self):
+		"""
+		Return a dict of counters and ratios describing how the store has been
+		used.
+		"""
+		gets = self.cache_hits + self.disk_loads
+		return {
+				"puts": self.puts,
+				"dedups": self.dedups,
+				"dedup_ratio": float(self.dedups) / self.puts if self.puts else 0.0,
+				"cache_hits": self.cache_hits,
+				"disk_loads": self.disk_loads,
+				"hit_ratio": float(self.cache_hits) / gets if gets else 0.0,
+				"bytes_written": self.bytes_written,
+				"pending": len(self._pending),
+			}
+
+	def flush(self):
+		"""
+		Wait until every state put() so far has been written, raising the
+		error if one of them couldn't be.
+		"""
+		self._queue.join()
+		self._check_writer()
+
+	def close(self):
+		"""
+		Write any outstanding states and stop the writer thread.
+		"""
+		if self._writer is None:
+			return
+		self._queue.put(_STOP)
+		self._writer.join()
+		self._writer = None
+		self._check_writer()
@@ -0,0 +1,252 @@
+/*
+ * A tiny libretro core for testing the wrapper, see stubcore.py.
+ *
+ * Every frame it:
+ *  - asks for the "stub_option" variable, and for the string of all
+ *    variables, and stores them in RAM;
+ *  - polls input and stores the joypad buttons of port 0 and the mouse axes
+ *    of port 1 in RAM;
+ *  - produces 2 audio frames one by one and 10 in a batch, the left channel
+ *    holding the frame number and the right one a running index;
+ *  - draws a frame 8 pixels wide on even frames and 16 on odd ones, 4 rows
+ *    high, 128 bytes apart, with pixel (x, y) of frame n being
+ *    n * 256 + y * 16 + x, truncated to the pixel format. Every third frame
+ *    is duped, if the frontend allows it.
+ *
+ * The first byte of the game data is the pixel format to ask for while
+ * loading, or 0xff to keep the default.
+ */
+#include <string.h>
+#include <stdint.h>
+#include <stdbool.h>
+#include "libretro.h"
+
+#define ENVIRONMENT_SET_PIXEL_FORMAT 10
+
+/* Where things are kept in system RAM. */
+#define RAM_FRAME      0	/* uint32 frame counter */
+#define RAM_BUTTONS    4	/* uint16 joypad buttons of port 0 */
+#define RAM_MOUSE_X    6	/* int16 */
+#define RAM_MOUSE_Y    8	/* int16 */
+#define RAM_OPTION     10	/* first character of "stub_option", or 0 */
+#define RAM_OVERSCAN   11
+#define RAM_FORMAT_OK  12	/* whether the pixel format was accepted */
+#define RAM_VARIABLES  16	/* the string of all variables */
+#define RAM_SIZE       256
+
+#define WIDTH  16
+#define HEIGHT 4
+#define PITCH  128
+
+static retro_environment_t env_cb;
+static retro_video_refresh_t video_cb;
+static retro_audio_sample_t audio_cb;
+static retro_audio_sample_batch_t audio_batch_cb;
+static retro_input_poll_t poll_cb;
+static retro_input_state_t input_cb;
+
+static uint8_t ram[RAM_SIZE];
+static uint8_t sram[16];
+static uint8_t fb[HEIGHT * PITCH];
+static uint32_t frame;
+static int16_t audio_index;
+static unsigned pixel_format;
+static bool can_dupe;
+
+void retro_set_environment(retro_environment_t cb) { env_cb = cb; }
+void retro_set_video_refresh(retro_video_refresh_t cb) { video_cb = cb; }
+void retro_set_audio_sample(retro_audio_sample_t cb) { audio_cb = cb; }
+void retro_set_audio_sample_batch(retro_audio_sample_batch_t cb) { audio_batch_cb = cb; }
+void retro_set_input_poll(retro_input_poll_t cb) { poll_cb = cb; }
+void retro_set_input_state(retro_input_state_t cb) { input_cb = cb; }
+void retro_init(void) {}
+void retro_deinit(void) {}
+unsigned retro_api_version(void) { return RETRO_API_VERSION; }
+
+void retro_get_system_info(struct retro_system_info *info)
+{
+	info->library_name = "stub";
+	info->library_version = "1";
+	info->valid_extensions = "bin";
+	info->need_fullpath = false;
+	info->block_extract = false;
+}
+
+void retro_get_system_av_info(struct retro_system_av_info *info)
+{
+	info->geometry.base_width = WIDTH / 2;
+	info->geometry.base_height = HEIGHT;
+	info->geometry.max_width = WIDTH;
+	info->geometry.max_height = HEIGHT;
+	info->geometry.aspect_ratio = 2.0f;
+	info->timing.fps = 60.0;
+	info->timing.sample_rate = 720.0;
+}
+
+void retro_set_controller_port_device(unsigned port, unsigned device) {}
+
+void retro_reset(void)
+{
+	frame = 0;
+}
+
+static void read_variables(void)
+{
+	struct retro_variable option = { "stub_option", NULL };
+	struct retro_variable all = { NULL, NULL };
+	bool overscan = false;
+
+	ram[RAM_OPTION] = 0;
+	if (env_cb(RETRO_ENVIRONMENT_GET_VARIABLE, &option) && option.value)
+		ram[RAM_OPTION] = option.value[0];
+
+	memset(ram + RAM_VARIABLES, 0, RAM_SIZE - RAM_VARIABLES);
+	if (env_cb(RETRO_ENVIRONMENT_GET_VARIABLE, &all) && all.value)
+		strncpy((char *)ram + RAM_VARIABLES, all.value, RAM_SIZE - RAM_VARIABLES - 1);
+
+	env_cb(RETRO_ENVIRONMENT_GET_OVERSCAN, &overscan);
+	ram[RAM_OVERSCAN] = overscan;
+}
+
+static void read_input(void)
+{
+	uint16_t buttons = 0;
+	int16_t x, y;
+	unsigned i;
+
+	poll_cb();
+	for (i = 0; i < 16; i++)
+		if (input_cb(0, RETRO_DEVICE_JOYPAD, 0, i))
+			buttons |= 1 << i;
+	x = input_cb(1, RETRO_DEVICE_MOUSE, 0, RETRO_DEVICE_ID_MOUSE_X);
+	y = input_cb(1, RETRO_DEVICE_MOUSE, 0, RETRO_DEVICE_ID_MOUSE_Y);
+	memcpy(ram + RAM_BUTTONS, &buttons, 2);
+	memcpy(ram + RAM_MOUSE_X, &x, 2);
+	memcpy(ram + RAM_MOUSE_Y, &y, 2);
+}
+
+static void play_audio(void)
+{
+	int16_t batch[20];
+	unsigned i;
+
+	for (i = 0; i < 2; i++)
+		audio_cb((int16_t)frame, audio_index++);
+	for (i = 0; i < 10; i++) {
+		batch[2 * i] = (int16_t)frame;
+		batch[2 * i + 1] = audio_index++;
+	}
+	audio_batch_cb(batch, 10);
+}
+
+static void draw(void)
+{
+	unsigned width = frame % 2 ? WIDTH : WIDTH / 2;
+	unsigned x, y;
+	uint32_t pixel;
+
+	if (frame % 3 == 2 && can_dupe) {
+		video_cb(NULL, width, HEIGHT, PITCH);
+		return;
+	}
+	memset(fb, 0, sizeof(fb));
+	for (y = 0; y < HEIGHT; y++) {
+		for (x = 0; x < width; x++) {
+			pixel = frame * 256 + y * 16 + x;
+			if (pixel_format == 1)
+				memcpy(fb + y * PITCH + x * 4, &pixel, 4);
+			else
+				((uint16_t *)(fb + y * PITCH))[x] = (uint16_t)pixel;
+		}
+	}
+	video_cb(fb, width, HEIGHT, PITCH);
+}
+
+void retro_run(void)
+{
+	read_variables();
+	read_input();
+	play_audio();
+	draw();
+	frame++;
+	memcpy(ram + RAM_FRAME, &frame, 4);
+}
+
+size_t retro_serialize_size(void)
+{
+	return sizeof(frame) + sizeof(audio_index) + sizeof(ram);
+}
+
+bool retro_serialize(void *data, size_t size)
+{
+	if (size < retro_serialize_size())
+		return false;
+	memcpy(data, &frame, sizeof(frame));
+	memcpy((char *)data + 4, &audio_index, sizeof(audio_index));
+	memcpy((char *)data + 6, ram, sizeof(ram));
+	return true;
+}
+
+bool retro_unserialize(const void *data, size_t size)
+{
+	if (size < retro_serialize_size())
+		return false;
+	memcpy(&frame, data, sizeof(frame));
+	memcpy(&audio_index, (const char *)data + 4, sizeof(audio_index));
+	memcpy(ram, (const char *)data + 6, sizeof(ram));
+	return true;
+}
+
+void retro_cheat_reset(void) {}
+void retro_cheat_set(unsigned index, bool enabled, const char *code) {}
+
+bool retro_load_game(const struct retro_game_info *game)
+{
+	static const struct retro_variable variables[] = {
+		{ "stub_option", "Stub option; first|second" },
+		{ "stub_other", "Other option; x|y" },
+		{ NULL, NULL },
+	};
+	unsigned format;
+
+	pixel_format = 0;
+	if (game->size && ((const uint8_t *)game->data)[0] != 0xff) {
+		format = ((const uint8_t *)game->data)[0];
+		if (env_cb(ENVIRONMENT_SET_PIXEL_FORMAT, &format)) {
+			pixel_format = format;
+			ram[RAM_FORMAT_OK] = 1;
+		}
+	}
+	env_cb(RETRO_ENVIRONMENT_SET_VARIABLES, (void *)variables);
+	can_dupe = false;
+	env_cb(RETRO_ENVIRONMENT_GET_CAN_DUPE, &can_dupe);
+	frame = 0;
+	audio_index = 0;
+	return true;
+}
+
+bool retro_load_game_special(unsigned type, const struct retro_game_info *info, size_t num)
+{
+	return false;
+}
+
+void retro_unload_game(void) {}
+unsigned retro_get_region(void) { return RETRO_REGION_NTSC; }
+
+void *retro_get_memory_data(unsigned id)
+{
+	if (id == RETRO_MEMORY_SYSTEM_RAM)
+		return ram;
+	if (id == RETRO_MEMORY_SAVE_RAM)
+		return sram;
+	return NULL;
+}
+
+size_t retro_get_memory_size(unsigned id)
+{
+	if (id == RETRO_MEMORY_SYSTEM_RAM)
+		return sizeof(ram);
+	if (id == RETRO_MEMORY_SAVE_RAM)
+		return sizeof(sram);
+	return 0;
+}
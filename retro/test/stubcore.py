@@ -0,0 +1,103 @@
+"""
+A stub libretro core for testing the wrapper against, compiled from
+stubcore.c the first time it is needed. See stubcore.c for what it does.
+
+Tests using it are skipped if the _retro extension isn't built, or there is
+no C compiler.
+"""
+import atexit
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(_HERE, "stubcore.c")
+# For libretro.h.
+INCLUDE = os.path.join(_HERE, os.pardir, os.pardir, "Cython")
+
+# Offsets into system RAM, as in stubcore.c.
+RAM_FRAME     = 0
+RAM_BUTTONS   = 4
+RAM_MOUSE_X   = 6
+RAM_MOUSE_Y   = 8
+RAM_OPTION    = 10
+RAM_OVERSCAN  = 11
+RAM_FORMAT_OK = 12
+RAM_VARIABLES = 16
+RAM_SIZE      = 256
+
+WIDTH  = 16
+HEIGHT = 4
+PITCH  = 128
+
+# Audio frames produced per video frame.
+AUDIO_FRAMES = 12
+
+# Game data keeping the default pixel format.
+DEFAULT_FORMAT = 0xff
+
+_library = []
+
+
+def library():
+	"""
+	Return the path of the compiled stub core, compiling it if necessary.
+	Raises unittest.SkipTest if that can't be done.
+	"""
+	if _library:
+		if _library[0] is None:
+			raise unittest.SkipTest("the stub core couldn't be built")
+		return _library[0]
+
+	_library.append(None)
+	try:
+		import retro.core
+		from distutils import ccompiler
+	except ImportError as e:
+		raise unittest.SkipTest(str(e))
+	directory = tempfile.mkdtemp(prefix="retro-stubcore-")
+	atexit.register(shutil.rmtree, directory, True)
+	try:
+		compiler = ccompiler.new_compiler()
+		objects = compiler.compile([SOURCE], output_dir=directory,
+				include_dirs=[INCLUDE], extra_preargs=["-fPIC"])
+		path = os.path.join(directory, "libretro-stub.so")
+		compiler.link_shared_object(objects, path)
+	except Exception as e:
+		raise unittest.SkipTest("couldn't build the stub core: %s" % (e,))
+	_library[0] = path
+	return path
+
+
+def load(pixel_format=DEFAULT_FORMAT, allowed=(), can_dupe=True):
+	"""
+	Return a new EmulatedSystem running the stub core, with a game loaded
+	asking for the given pixel format, of which the "allowed" ones are, and
+	duping frames if "can_dupe" is true. Each one has a private copy of the
+	core, so close() it when done.
+	"""
+	from retro import core
+	system = core.EmulatedSystem(library(), private_copy=True)
+	system.set_pixel_formats(allowed)
+	system.set_can_dupe(can_dupe)
+	system.load_game_normal(data=chr(pixel_format) * 4, path="stub.bin")
+	return system
+
+
+def pixel(frame, x, y):
+	"""
+	The value the stub core draws at (x, y) in the given frame, before
+	truncating it to the pixel format.
+	"""
+	return frame * 256 + y * 16 + x
+
+
+def frame_count(system):
+	"""
+	The number of frames the stub core has run, according to its RAM.
+	"""
+	from retro.globals import MEMORY_SYSTEM_RAM
+	ram = system.read_memory(MEMORY_SYSTEM_RAM, offset=RAM_FRAME, size=4)
+	return struct.unpack("<I", ram.tostring())[0]
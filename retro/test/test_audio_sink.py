@@ -0,0 +1,158 @@
+#!/usr/bin/python
+"""
+Runs without a sound card, through SDL's dummy audio driver.
+"""
+import os
+import unittest
+
+import numpy
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+try:
+	import pygame.sndarray
+	from retro.audio import pygame_output
+except ImportError:
+	pygame_output = None
+
+
+class Timing(object):
+	sample_rate = 22050.0
+
+
+class AVInfo(object):
+	timing = Timing
+
+
+class FakeLib(object):
+	def retro_get_system_av_info(self):
+		return AVInfo
+
+
+class FakeCore(object):
+	_lib = FakeLib()
+
+	def __init__(self):
+		self.batch = None
+		self.accumulate = False
+		self.played = 0
+
+	def set_audio_sample_batch_cb(self, callback):
+		self.batch = callback
+
+	def set_audio_accumulate(self, enabled=True, flush_frames=0):
+		self.accumulate = enabled
+
+	def play(self, frames):
+		"""
+		Produce the next "frames" frames of a stream counting up.
+		"""
+		data = numpy.arange(self.played, self.played + frames,
+				dtype=numpy.int16).repeat(2).reshape(frames, 2)
+		self.played += frames
+		self.batch(data, frames)
+
+
+class FakeChannel(object):
+	"""
+	A mixer channel that plays a Sound until finish() is called.
+	"""
+	def __init__(self):
+		self.playing = None
+		self.queued = None
+
+	def get_busy(self):
+		return self.playing is not None
+
+	def get_queue(self):
+		return self.queued
+
+	def play(self, snd):
+		self.playing = snd
+
+	def queue(self, snd):
+		self.queued = snd
+
+	def finish(self):
+		self.playing, self.queued = self.queued, None
+
+	def stop(self):
+		self.playing = self.queued = None
+
+
+@unittest.skipIf(pygame_output is None, "needs pygame")
+class TestAudioSink(unittest.TestCase):
+
+	def setUp(self):
+		self.core = FakeCore()
+		self.chunks = []
+
+	def tearDown(self):
+		pygame.mixer.quit()
+
+	def sink(self, **kwargs):
+		return pygame_output.AudioSink(self.core, callback=self.callback,
+				chunk_frames=8, **kwargs)
+
+	def callback(self, snd):
+		self.chunks.append(pygame.sndarray.array(snd)[:, 0].tolist())
+
+	def test_ring(self):
+		"""
+		Audio comes out in chunks, in order, as the ring wraps around.
+		"""
+		sink = self.sink(ring_frames=20)
+		for frames in (5, 7, 13, 3, 12):
+			self.core.play(frames)
+		self.assertEqual(sum(self.chunks, []), list(range(40)))
+		self.assertEqual(sink.buffered, 0)
+		self.core.play(6)
+		self.assertEqual(len(self.chunks), 5)
+		self.assertEqual(sink.buffered, 6)
+		self.assertEqual(sink.overruns, 0)
+
+	def test_overrun(self):
+		"""
+		Frames that don't fit in the ring are dropped and counted.
+		"""
+		sink = self.sink(ring_frames=16)
+		sink.write(numpy.zeros((10, 2), numpy.int16))
+		sink.write(numpy.ones((10, 2), numpy.int16))
+		self.assertEqual(sink.buffered, 16)
+		self.assertEqual(sink.overruns, 4)
+		self.assertEqual(sink.ring[:, 0].tolist(), [0] * 10 + [1] * 6)
+
+	def test_underrun(self):
+		"""
+		The channel running dry counts as one underrun, however long it stays
+		dry.
+		"""
+		sink = self.sink()
+		sink.callback = None
+		sink.channel = channel = FakeChannel()
+		self.core.play(16)
+		self.assertTrue(channel.get_busy())
+		self.assertTrue(channel.get_queue() is not None)
+		self.assertEqual(sink.underruns, 0)
+
+		channel.finish()
+		channel.finish()
+		sink.pump()
+		sink.pump()
+		self.assertEqual(sink.underruns, 1)
+		self.core.play(8)
+		self.assertTrue(channel.get_busy())
+		channel.finish()
+		sink.pump()
+		self.assertEqual(sink.underruns, 2)
+
+	def test_close(self):
+		sink = self.sink()
+		self.assertTrue(self.core.accumulate)
+		sink.close()
+		self.assertTrue(self.core.batch is None)
+		self.assertFalse(self.core.accumulate)
+
+
+if __name__ == "__main__":
+	unittest.main()
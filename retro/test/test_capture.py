@@ -0,0 +1,96 @@
+#!/usr/bin/python
+import unittest
+
+import numpy
+
+from retro.globals import PIXEL_FORMAT_XRGB8888
+from retro.video import capture
+from retro.test import stubcore
+
+
+def expected(frame, width, dtype=numpy.uint16):
+	"""
+	Frame number "frame" of the stub core, "width" pixels wide.
+	"""
+	return numpy.array([[stubcore.pixel(frame, x, y) for x in range(width)]
+			for y in range(stubcore.HEIGHT)]).astype(dtype)
+
+
+class TestFrameCapture(unittest.TestCase):
+
+	def load(self, **kwargs):
+		self.system = stubcore.load(**kwargs)
+		self.addCleanup(self.system.close)
+
+	def check(self, frames, sizes, numbers, widths, dtype=numpy.uint16):
+		self.assertEqual(len(frames), len(numbers))
+		self.assertEqual(sizes.tolist(),
+				[[width, stubcore.HEIGHT] for width in widths])
+		for frame, number, width in zip(frames, numbers, widths):
+			self.assertTrue((frame[:, :width] == expected(number, width, dtype)).all())
+
+	def test_ring(self):
+		"""
+		Frames come out in order, duped ones as a copy of the one before,
+		and the ones overwritten before being read are counted.
+		"""
+		self.load()
+		frames = capture.FrameCapture(self.system, 4)
+		self.assertEqual(frames.frames.shape, (4, stubcore.HEIGHT, stubcore.WIDTH))
+		self.assertEqual(frames.frames.dtype, numpy.uint16)
+
+		self.system.run_frames(3)
+		self.assertEqual(frames.count, 3)
+		self.check(*frames.read(), numbers=[0, 1, 1], widths=[8, 16, 16])
+		self.assertEqual(len(frames.read()[0]), 0)
+
+		# Frames 3 to 8, of which 5 and 8 are dupes, and only the last four
+		# are still in the ring.
+		self.system.run_frames(6)
+		self.check(*frames.read(), numbers=[4, 6, 7, 7], widths=[8, 8, 16, 16])
+		self.assertEqual(frames.dropped, 2)
+		self.assertEqual(frames.read_count, 9)
+
+	def test_no_dupes(self):
+		self.load(can_dupe=False)
+		frames = capture.FrameCapture(self.system, 4)
+		self.system.run_frames(3)
+		self.check(*frames.read(), numbers=[0, 1, 2], widths=[8, 16, 8])
+
+	def test_xrgb8888(self):
+		self.load(pixel_format=PIXEL_FORMAT_XRGB8888,
+				allowed=[PIXEL_FORMAT_XRGB8888])
+		frames = capture.FrameCapture(self.system, 2)
+		self.assertEqual(frames.frames.dtype, numpy.uint32)
+		self.system.run_frames(2)
+		self.check(*frames.read(), numbers=[0, 1], widths=[8, 16],
+				dtype=numpy.uint32)
+
+	def test_clipped(self):
+		"""
+		Frames larger than the slots are clipped to them.
+		"""
+		self.load()
+		frames = capture.FrameCapture(self.system, 2,
+				numpy.zeros((2, 3, 4), numpy.uint16))
+		self.system.run_frames(2)
+		data, sizes = frames.read()
+		self.assertEqual(sizes.tolist(), [[4, 3], [4, 3]])
+		self.assertTrue((data[1] == expected(1, 4)[:3]).all())
+
+	def test_close(self):
+		self.load()
+		refreshed = []
+		self.system.set_video_refresh_cb(
+				lambda data, width, height, pitch: refreshed.append(width))
+		frames = capture.FrameCapture(self.system, 2)
+		self.system.run_frames(2)
+		self.assertEqual(refreshed, [])
+		frames.close()
+		self.system.run_frames(2)
+		self.assertEqual(refreshed, [8, 16])
+		self.assertEqual(frames.count, 2)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/python
+import unittest
+
+from retro.globals import MEMORY_SYSTEM_RAM
+from retro.test import stubcore
+
+
+class TestSpawnClones(unittest.TestCase):
+
+	def setUp(self):
+		self.system = stubcore.load()
+		self.handles = []
+
+	def tearDown(self):
+		for handle in self.handles:
+			handle.close()
+		self.system.close()
+
+	def frame_count(self, handle):
+		ram = handle.call("read_memory", MEMORY_SYSTEM_RAM, None,
+				stubcore.RAM_FRAME, 4)
+		return int(ram.view("<u4")[0])
+
+	def test_independent(self):
+		"""
+		Clones start from the parent's state, and run apart from it and each
+		other.
+		"""
+		self.system.run_frames(3)
+		self.handles = self.system.spawn_clones(2)
+		first, second = self.handles
+
+		first.run(5)
+		self.assertEqual(self.frame_count(first), 8)
+		self.assertEqual(self.frame_count(second), 3)
+		self.assertEqual(stubcore.frame_count(self.system), 3)
+
+		# Several requests in flight at once.
+		first.submit("run_frames", 2)
+		second.submit("run_frames", 4)
+		first.result()
+		second.result()
+		self.assertEqual(self.frame_count(first), 10)
+		self.assertEqual(self.frame_count(second), 7)
+
+	def test_frames_and_states(self):
+		self.handles = self.system.spawn_clones(1)
+		handle = self.handles[0]
+		self.assertEqual(handle.get_frame(), None)
+
+		handle.run(2)
+		data, width, height, pitch = handle.get_frame()
+		self.assertEqual((width, height), (stubcore.WIDTH, stubcore.HEIGHT))
+		self.assertEqual(int(data[1, 2]), stubcore.pixel(1, 2, 1))
+
+		state = handle.serialize()
+		handle.run(4)
+		handle.unserialize(state)
+		self.assertEqual(self.frame_count(handle), 2)
+
+	def test_errors(self):
+		self.handles = self.system.spawn_clones(1)
+		handle = self.handles[0]
+		self.assertRaises(AttributeError, handle.call, "no_such_method")
+		self.assertRaises(Exception, handle.call, "_require_game_loaded")
+		# The clone is still answering.
+		handle.run(1)
+		self.assertEqual(self.frame_count(handle), 1)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/python
+import unittest
+
+import numpy
+
+from retro.globals import (PIXEL_FORMAT_0RGB1555, PIXEL_FORMAT_XRGB8888,
+		PIXEL_FORMAT_RGB565)
+from retro.video import convert
+
+
+def padded_frame(pixels, dtype, padding=6):
+	"""
+	Lay the given pixel values out as a core would, with padding after every
+	row. Returns the buffer and its pitch.
+	"""
+	pixels = numpy.asarray(pixels, dtype)
+	height, width = pixels.shape
+	pitch = width * pixels.itemsize + padding
+	frame = numpy.zeros(height * pitch, numpy.uint8)
+	for y in range(height):
+		frame[y * pitch:y * pitch + width * pixels.itemsize] = \
+				pixels[y].view(numpy.uint8)
+	return frame.tostring(), pitch
+
+
+class TestConvert(unittest.TestCase):
+
+	def check(self, pixel_format, pixels, dtype, rgb):
+		data, pitch = padded_frame(pixels, dtype)
+		height, width = len(pixels), len(pixels[0])
+		rgb = numpy.array(rgb, numpy.uint8)
+
+		result = convert.convert(data, width, height, pitch, pixel_format)
+		self.assertTrue((result == rgb).all())
+
+		rgba = convert.output_buffer(width, height, convert.RGBA32)
+		convert.convert(data, width, height, pitch, pixel_format,
+				convert.RGBA32, rgba)
+		self.assertTrue((rgba[..., :3] == rgb).all())
+		self.assertTrue((rgba[..., 3] == 255).all())
+
+		gray = convert.convert(data, width, height, pitch, pixel_format,
+				convert.GRAY)
+		self.assertEqual(gray.shape, (height, width))
+		self.assertEqual(gray[0, 0], 255)
+
+	def test_0rgb1555(self):
+		self.check(PIXEL_FORMAT_0RGB1555,
+				[[0x7fff, 0x7c00], [0x03e0, 0x801f]], numpy.uint16,
+				[[[255, 255, 255], [255, 0, 0]], [[0, 255, 0], [0, 0, 255]]])
+
+	def test_rgb565(self):
+		self.check(PIXEL_FORMAT_RGB565,
+				[[0xffff, 0xf800], [0x07e0, 0x0010]], numpy.uint16,
+				[[[255, 255, 255], [255, 0, 0]], [[0, 255, 0], [0, 0, 132]]])
+
+	def test_xrgb8888(self):
+		self.check(PIXEL_FORMAT_XRGB8888,
+				[[0xffffff, 0x123456], [0x00ff00, 0x0000ff]], numpy.uint32,
+				[[[255, 255, 255], [0x12, 0x34, 0x56]], [[0, 255, 0], [0, 0, 255]]])
+
+	def test_array_strides(self):
+		"""
+		A two-dimensional array is read with its own row stride, whatever
+		pitch comes with it.
+		"""
+		pixels = numpy.arange(24, dtype=numpy.uint16).reshape(4, 6) * 0x421
+		expected = convert.convert(pixels.tostring(), 6, 4, 12)
+		packed = pixels.copy()
+		self.assertTrue((convert.convert(packed, 6, 4, 1024) == expected).all())
+		padded = numpy.zeros((4, 10), numpy.uint16)
+		padded[:, :6] = pixels
+		self.assertTrue((convert.convert(padded[:, :6], 6, 4, 12) == expected).all())
+
+	def test_frame_bytes(self):
+		"""
+		A frame's bytes run from its first pixel to its last, row padding
+		included.
+		"""
+		data, pitch = padded_frame([[1, 2], [3, 4]], numpy.uint32)
+		frame = convert.frame_bytes(data, 2, 2, pitch, PIXEL_FORMAT_XRGB8888)
+		self.assertEqual(frame.dtype, numpy.uint8)
+		self.assertEqual(frame.tostring(), data[:pitch + 8])
+
+		padded = numpy.zeros((4, 10), numpy.uint16)
+		frame = convert.frame_bytes(padded[1:, 2:5], 3, 3, 6)
+		self.assertEqual(len(frame), 20 * 2 + 6)
+		frame[-1] = 0xff
+		self.assertEqual(padded[3, 4], 0xff00 if numpy.little_endian else 0xff)
+		self.assertEqual(len(convert.frame_bytes(padded, 0, 0, 20)), 0)
+
+	def test_too_short(self):
+		"""
+		Frames whose rows don't fit in the buffer, or overlap, are refused
+		rather than read past its end.
+		"""
+		data, pitch = padded_frame([[1, 2], [3, 4]], numpy.uint16)
+		self.assertEqual(convert.raw_pixels(data[:pitch + 4], 2, 2, pitch)
+				.tolist(), [[1, 2], [3, 4]])
+		for function in (convert.raw_pixels, convert.frame_bytes,
+				convert.convert):
+			self.assertRaises(ValueError, function, data[:pitch + 3], 2, 2, pitch)
+			self.assertRaises(ValueError, function, data, 2, 3, pitch)
+			self.assertRaises(ValueError, function, data, 2, 2, 3)
+			self.assertRaises(ValueError, function, data[:pitch + 4], 2, 2,
+					pitch, PIXEL_FORMAT_XRGB8888)
+			pixels = numpy.zeros((4, 10), numpy.uint16)
+			self.assertRaises(ValueError, function, pixels[1:, 2:5], 3, 4, 0)
+			self.assertRaises(ValueError, function, pixels[:, 2:5], 9, 4, 0)
+
+	def test_empty(self):
+		"""
+		Frames without pixels convert to empty arrays, not errors.
+		"""
+		pixels = numpy.zeros((0, 0), numpy.uint16)
+		for output in convert.CHANNELS:
+			out = convert.output_buffer(0, 0, output)
+			self.assertTrue(convert.convert(pixels, 0, 0, 0, output=output,
+					out=out) is out)
+		if convert.lut_convert is not None:
+			table = convert.lookup_table(PIXEL_FORMAT_0RGB1555, convert.RGBA32)
+			out = numpy.empty(0, numpy.uint8)
+			self.assertTrue(convert.lut_convert(numpy.zeros((3, 0), numpy.uint16),
+					table, out) is out)
+			self.assertRaises(ValueError, convert.lut_convert, pixels, table,
+					numpy.empty(0, numpy.uint16))
+
+	def test_without_extension(self):
+		"""
+		The numpy fallback agrees with the C fast path.
+		"""
+		pixels = numpy.arange(0, 65536, 7, dtype=numpy.uint16)[:9000].reshape(90, 100)
+		data, pitch = padded_frame(pixels, numpy.uint16)
+		lut_convert = convert.lut_convert
+		for output in convert.CHANNELS:
+			expected = convert.convert(data, 100, 90, pitch, output=output)
+			convert.lut_convert = None
+			try:
+				result = convert.convert(data, 100, 90, pitch, output=output)
+			finally:
+				convert.lut_convert = lut_convert
+			self.assertTrue((result == expected).all())
+
+
+if __name__ == "__main__":
+	unittest.main()
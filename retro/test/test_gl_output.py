@@ -0,0 +1,88 @@
+#!/usr/bin/python
+"""
+Runs headlessly on Mesa, through EGL without a window system.
+"""
+import ctypes
+import os
+import unittest
+
+import numpy
+
+os.environ.setdefault('PYOPENGL_PLATFORM', 'egl')
+os.environ.setdefault('EGL_PLATFORM', 'surfaceless')
+
+try:
+	from OpenGL import EGL
+	from OpenGL.GL import *
+	from retro.video import gl_output
+except ImportError:
+	EGL = None
+
+from retro.globals import (PIXEL_FORMAT_0RGB1555, PIXEL_FORMAT_XRGB8888,
+		PIXEL_FORMAT_RGB565)
+
+
+def make_context():
+	"""
+	Make a tiny offscreen OpenGL context current, or return False.
+	"""
+	try:
+		display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+		major, minor = EGL.EGLint(), EGL.EGLint()
+		EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor))
+		attributes = (EGL.EGLint * 5)(EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+				EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT, EGL.EGL_NONE)
+		config = EGL.EGLConfig()
+		count = EGL.EGLint()
+		EGL.eglChooseConfig(display, attributes, ctypes.pointer(config), 1,
+				ctypes.pointer(count))
+		surface = EGL.eglCreatePbufferSurface(display, config,
+				(EGL.EGLint * 5)(EGL.EGL_WIDTH, 16, EGL.EGL_HEIGHT, 16,
+					EGL.EGL_NONE))
+		EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+		context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, None)
+		return bool(EGL.eglMakeCurrent(display, surface, surface, context))
+	except Exception:
+		return False
+
+
+class TestStreamingTexture(unittest.TestCase):
+
+	def setUp(self):
+		if EGL is None or not make_context():
+			self.skipTest("no offscreen OpenGL context available")
+
+	def check(self, pixel_format, dtype, mask, use_pbo):
+		texture = gl_output.StreamingTexture(512, 448, pixel_format, use_pbo)
+		pixels = numpy.random.randint(0, 2 ** 31, (224, 256)).astype(dtype)
+
+		# Lay the frame out as a core would, with rows 2048 bytes apart.
+		pitch = 2048
+		frame = numpy.zeros((224, pitch), numpy.uint8)
+		frame[:, :pixels[0].nbytes] = pixels.view(numpy.uint8)
+		data = frame.view(numpy.uint16)[:, :256]
+
+		texture.upload(data, 256, 224, pitch)
+		texture.upload(None, 256, 224, pitch)
+		self.assertEqual((texture.width, texture.height), (256, 224))
+		self.assertEqual((texture.texture_width, texture.texture_height),
+				(512, 448))
+
+		glBindTexture(GL_TEXTURE_2D, texture.texture)
+		result = numpy.frombuffer(glGetTexImage(GL_TEXTURE_2D, 0, texture.format,
+				texture.type, outputType=None), dtype).reshape(448, 512)
+		self.assertTrue(((result[:224, :256] & mask) == (pixels & mask)).all())
+		texture.close()
+
+	def test_upload(self):
+		self.check(PIXEL_FORMAT_0RGB1555, numpy.uint16, 0x7fff, False)
+		self.check(PIXEL_FORMAT_RGB565, numpy.uint16, 0xffff, False)
+		self.check(PIXEL_FORMAT_XRGB8888, numpy.uint32, 0xffffff, False)
+
+	def test_upload_pbo(self):
+		self.check(PIXEL_FORMAT_0RGB1555, numpy.uint16, 0x7fff, True)
+		self.check(PIXEL_FORMAT_XRGB8888, numpy.uint32, 0xffffff, True)
+
+
+if __name__ == "__main__":
+	unittest.main()
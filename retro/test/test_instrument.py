@@ -0,0 +1,166 @@
+#!/usr/bin/python
+import unittest
+import json
+import io
+
+import numpy
+
+from retro import instrument
+from retro.test import stubcore
+
+
+class FakeLib(object):
+	def __init__(self):
+		self.count = 0
+
+	def retro_get_profile_count(self):
+		return self.count
+
+
+class FakeCore(object):
+	"""
+	Records frames into the profile the way the Cython layer does: frame n
+	takes n milliseconds, a quarter of it in the video callback.
+	"""
+	def __init__(self):
+		self._lib = FakeLib()
+		self.profile = None
+
+	def set_profile(self, profile):
+		self.profile = profile
+
+	def run(self):
+		n = self._lib.count
+		row = self.profile[n % len(self.profile)]
+		row[:] = 0
+		row[instrument.FIELDS.index("start")] = n * 0.02
+		row[instrument.FIELDS.index("total")] = n * 0.001
+		row[instrument.FIELDS.index("core")] = n * 0.00075
+		row[instrument.FIELDS.index("video_time")] = n * 0.00025
+		row[instrument.FIELDS.index("video_calls")] = 1
+		self._lib.count += 1
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+	def test_ring(self):
+		core = FakeCore()
+		profiler = instrument.FrameProfiler(core, slots=4)
+		self.assertEqual(len(profiler.frames()), 0)
+		self.assertEqual(profiler.summary(), {})
+		for _ in range(6):
+			core.run()
+		self.assertEqual(profiler.count, 6)
+		self.assertEqual(profiler.field("total").tolist(),
+				[0.002, 0.003, 0.004, 0.005])
+		profiler.close()
+		self.assertTrue(core.profile is None)
+
+	def test_summary(self):
+		core = FakeCore()
+		profiler = instrument.FrameProfiler(core, slots=101)
+		for _ in range(101):
+			core.run()
+		summary = profiler.summary(percentiles=(50, 90))
+		self.assertFalse("start" in summary)
+		self.assertAlmostEqual(summary["total"]["p50"], 0.05)
+		self.assertAlmostEqual(summary["total"]["p90"], 0.09)
+		self.assertAlmostEqual(summary["total"]["max"], 0.1)
+		self.assertAlmostEqual(summary["core"]["mean"], 0.0375)
+		self.assertEqual(summary["video_calls"]["mean"], 1)
+
+	def test_chrome_trace(self):
+		core = FakeCore()
+		profiler = instrument.FrameProfiler(core)
+		for _ in range(3):
+			core.run()
+		handle = io.BytesIO() if str is bytes else io.StringIO()
+		profiler.chrome_trace(handle)
+		events = json.loads(handle.getvalue())["traceEvents"]
+
+		frames = [e for e in events if e["ph"] == "X"]
+		self.assertEqual([e["ts"] for e in frames], [0, 20000, 40000])
+		self.assertAlmostEqual(frames[2]["dur"], 2000)
+		self.assertEqual(frames[2]["args"]["video_calls"], 1)
+		counters = [e for e in events if e["ph"] == "C"]
+		self.assertAlmostEqual(counters[2]["args"]["video_time"], 0.5)
+
+
+
+class TestStubCore(unittest.TestCase):
+	"""
+	Profiles the stub core, so the accounting is done by the Cython layer.
+	"""
+
+	def setUp(self):
+		self.system = stubcore.load()
+
+	def tearDown(self):
+		self.system.close()
+
+	def test_accounting(self):
+		self.system.set_video_refresh_cb(lambda *args: None, copy=True)
+		self.system.set_audio_sample_batch_cb(lambda data, frames: None)
+		self.system.set_audio_accumulate(True)
+		profiler = instrument.FrameProfiler(self.system, slots=4)
+		self.system.run_frames(2)
+		self.system.run()
+		self.assertEqual(profiler.count, 3)
+
+		frames = profiler.frames()
+		field = lambda name: profiler.field(name, frames).tolist()
+		# Every frame asks for two variables and the overscan, produces
+		# audio twice one sample at a time and once in a batch, and reads 16
+		# buttons and 2 mouse axes.
+		self.assertEqual(field("environment_calls"), [3] * 3)
+		self.assertEqual(field("video_calls"), [1] * 3)
+		self.assertEqual(field("audio_calls"), [3] * 3)
+		self.assertEqual(field("input_polls"), [1] * 3)
+		self.assertEqual(field("input_queries"), [18] * 3)
+		self.assertEqual(field("audio_frames"), [stubcore.AUDIO_FRAMES] * 3)
+		# The copy of each frame but the dupe, and the accumulated audio.
+		audio = stubcore.AUDIO_FRAMES * 4
+		self.assertEqual(field("bytes_copied"),
+				[8 * 4 * 2 + audio, 16 * 4 * 2 + audio, audio])
+
+		starts = field("start")
+		self.assertTrue(0 <= starts[0] < starts[1] < starts[2])
+		parts = sum(frames[:, instrument.FIELDS.index(name)]
+				for name in instrument.PARTS)
+		self.assertTrue(numpy.allclose(parts, field("total")))
+		self.assertTrue((frames[:, 1:] >= 0).all())
+
+		profiler.close()
+		self.system.run_frames(2)
+		self.assertEqual(profiler.count, 3)
+
+	def test_validation(self):
+		for profile in [numpy.zeros((4, len(instrument.FIELDS) - 1)),
+				numpy.zeros((4, len(instrument.FIELDS)), numpy.float32),
+				numpy.zeros((0, len(instrument.FIELDS))),
+				numpy.zeros((len(instrument.FIELDS), 4)).T]:
+			self.assertRaises(ValueError, self.system.set_profile, profile)
+
+	def test_stop_mid_run(self):
+		"""
+		A callback may stop profiling while frames are being run.
+		"""
+		frames = []
+		def refresh(data, width, height, pitch):
+			frames.append(width)
+			if len(frames) == 2:
+				profiler.close()
+		self.system.set_video_refresh_cb(refresh)
+		profiler = instrument.FrameProfiler(self.system, slots=4)
+		self.system.run_frames(4)
+		self.assertEqual(len(frames), 4)
+		# The frame profiling stopped in isn't recorded.
+		self.assertEqual(profiler.count, 1)
+
+		profiler = instrument.FrameProfiler(self.system, slots=4)
+		self.system.run()
+		self.assertEqual(profiler.count, 1)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/python
+import unittest
+import mmap
+import struct
+import tempfile
+
+import numpy
+
+from retro import core
+from retro import exceptions as EX
+from retro.globals import MEMORY_SYSTEM_RAM, MEMORY_SAVE_RAM, MEMORY_VIDEO_RAM
+from retro.test import stubcore
+
+
+class TestMemory(unittest.TestCase):
+
+	def setUp(self):
+		self.system = stubcore.load()
+
+	def tearDown(self):
+		self.system.close()
+
+	def test_no_game(self):
+		system = core.EmulatedSystem(stubcore.library(), private_copy=True)
+		self.addCleanup(system.close)
+		self.assertRaises(EX.NoGameLoaded, system.memory_view, MEMORY_SYSTEM_RAM)
+		self.assertRaises(EX.NoGameLoaded, system.read_memory, MEMORY_SYSTEM_RAM)
+		self.assertRaises(EX.NoGameLoaded, system.write_memory,
+				MEMORY_SYSTEM_RAM, "x")
+
+	def test_memory_view(self):
+		"""
+		The view shows the core's memory as it changes, and writes to it.
+		"""
+		ram = self.system.memory_view(MEMORY_SYSTEM_RAM)
+		self.assertEqual(ram.dtype, numpy.uint8)
+		self.assertEqual(len(ram), stubcore.RAM_SIZE)
+		self.system.run_frames(2)
+		self.assertEqual(ram[stubcore.RAM_FRAME], 2)
+
+		ram[20:24] = 0xee
+		self.assertEqual(self.system.read_memory(MEMORY_SYSTEM_RAM,
+				offset=20, size=4).tolist(), [0xee] * 4)
+		self.assertEqual(len(self.system.memory_view(MEMORY_SAVE_RAM)), 16)
+		self.assertTrue(self.system.memory_view(MEMORY_VIDEO_RAM) is None)
+
+	def test_read_memory(self):
+		self.system.run_frames(3)
+		ram = self.system.read_memory(MEMORY_SYSTEM_RAM)
+		self.assertEqual(len(ram), stubcore.RAM_SIZE)
+		self.assertEqual(ram[stubcore.RAM_FRAME], 3)
+		# A copy, which doesn't change as the core runs.
+		self.system.run()
+		self.assertEqual(ram[stubcore.RAM_FRAME], 3)
+
+		out = bytearray(4)
+		self.assertTrue(self.system.read_memory(MEMORY_SYSTEM_RAM, out,
+				stubcore.RAM_FRAME) is out)
+		self.assertEqual(struct.unpack("<I", bytes(out))[0], 4)
+		self.assertRaises(ValueError, self.system.read_memory,
+				MEMORY_SYSTEM_RAM, out, size=2)
+		self.assertEqual(len(self.system.read_memory(MEMORY_SYSTEM_RAM,
+				offset=250)), 6)
+		self.assertRaises(IndexError, self.system.read_memory,
+				MEMORY_SYSTEM_RAM, offset=250, size=10)
+
+	def test_write_memory(self):
+		self.system.write_memory(MEMORY_SAVE_RAM, "save")
+		self.system.write_memory(MEMORY_SAVE_RAM, bytearray("xy"), 12)
+		self.system.write_memory(MEMORY_SAVE_RAM,
+				numpy.array([1, 2], numpy.uint8), 14)
+		self.assertEqual(self.system.get_save_data(),
+				"save" + "\0" * 8 + "xy\x01\x02")
+		self.assertRaises(IndexError, self.system.write_memory,
+				MEMORY_SAVE_RAM, "too long", 10)
+
+		# The core sees what was written, as its states show.
+		self.system.write_memory(MEMORY_SYSTEM_RAM, "ram", 100)
+		self.assertEqual(self.system.serialize()[106:109].tostring(), "ram")
+
+	def test_serialize_into(self):
+		self.system.run_frames(3)
+		size = self.system.serialize_size()
+		self.assertEqual(size, 4 + 2 + stubcore.RAM_SIZE)
+		expected = self.system.serialize()
+
+		state = bytearray(size)
+		self.system.serialize_into(state)
+		self.assertEqual(bytes(state), expected.tostring())
+		big = numpy.zeros(size + 10, numpy.uint8)
+		self.system.serialize_into(big)
+		self.assertTrue((big[:size] == expected).all())
+		self.assertTrue((big[size:] == 0).all())
+		self.assertRaises(ValueError, self.system.serialize_into,
+				bytearray(size - 1))
+
+		self.system.run_frames(2)
+		self.system.unserialize(state)
+		self.assertEqual(stubcore.frame_count(self.system), 3)
+
+	def test_mmap(self):
+		"""
+		States can be saved to and restored from a memory mapped file.
+		"""
+		size = self.system.serialize_size()
+		with tempfile.TemporaryFile() as f:
+			f.truncate(size + 4)
+			state = mmap.mmap(f.fileno(), size + 4)
+			try:
+				self.system.run_frames(3)
+				self.system.serialize_into(state)
+				self.assertEqual(state[:size], self.system.serialize().tostring())
+				self.system.run_frames(2)
+				self.system.unserialize(state)
+				self.assertEqual(stubcore.frame_count(self.system), 3)
+			finally:
+				state.close()
+
+
+if __name__ == "__main__":
+	unittest.main()
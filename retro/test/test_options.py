@@ -0,0 +1,122 @@
+#!/usr/bin/python
+import unittest
+
+from retro import core
+from retro.globals import (MEMORY_SYSTEM_RAM, PIXEL_FORMAT_0RGB1555,
+		PIXEL_FORMAT_RGB565)
+from retro.test import stubcore
+
+DECLARED = [
+		("stub_option", "Stub option; first|second", "first"),
+		("stub_other", "Other option; x|y", "x"),
+	]
+
+
+class TestOptions(unittest.TestCase):
+
+	def load(self, **kwargs):
+		self.system = stubcore.load(**kwargs)
+		self.addCleanup(self.system.close)
+		return self.system
+
+	def ram(self, offset, size=1):
+		return self.system.read_memory(MEMORY_SYSTEM_RAM, offset=offset,
+				size=size).tostring()
+
+	def variables(self):
+		"""
+		What the stub core last read as the option "stub_option", and as all
+		of the options.
+		"""
+		return (self.ram(stubcore.RAM_OPTION),
+				self.ram(stubcore.RAM_VARIABLES, 128).rstrip("\0"))
+
+	def test_defaults(self):
+		self.load()
+		self.assertEqual(self.system.get_variables(), DECLARED)
+		self.system.run()
+		self.assertEqual(self.variables(),
+				("f", "stub_option=first;stub_other=x"))
+
+	def test_set_variable(self):
+		self.load()
+		self.system.set_variable("stub_option", "second")
+		self.system.run()
+		self.assertEqual(self.variables(),
+				("s", "stub_option=second;stub_other=x"))
+		self.assertEqual(self.system.get_variables()[0],
+				("stub_option", "Stub option; first|second", "second"))
+
+		self.system.set_variable("stub_option", None)
+		self.system.run()
+		self.assertEqual(self.variables(),
+				("f", "stub_option=first;stub_other=x"))
+
+	def test_set_before_declared(self):
+		"""
+		Options selected before the core declares them keep their values, and
+		ones it never declares are listed without a description.
+		"""
+		self.system = core.EmulatedSystem(stubcore.library(), private_copy=True)
+		self.addCleanup(self.system.close)
+		self.system.set_variable("stub_other", "y")
+		self.system.set_variable("unknown", "1")
+		self.system.load_game_normal(data=chr(stubcore.DEFAULT_FORMAT) * 4,
+				path="stub.bin")
+		self.assertEqual(self.system.get_variables(), [
+				("stub_other", "Other option; x|y", "y"),
+				("unknown", None, "1"),
+				DECLARED[0],
+			])
+		self.system.run()
+		self.assertEqual(self.variables(),
+				("f", "stub_other=y;unknown=1;stub_option=first"))
+
+	def test_no_python(self):
+		"""
+		The commands answered by the wrapper never reach the environment
+		callback.
+		"""
+		commands = []
+		def environment(command, data):
+			commands.append(command)
+			return False
+		self.system = core.EmulatedSystem(stubcore.library(), private_copy=True)
+		self.addCleanup(self.system.close)
+		self.system.set_environment_cb(environment)
+		self.system.load_game_normal(data=chr(PIXEL_FORMAT_RGB565) * 4,
+				path="stub.bin")
+		self.system.run_frames(3)
+		self.assertEqual(commands, [])
+
+	def test_overscan(self):
+		self.load()
+		self.system.run()
+		self.assertEqual(self.ram(stubcore.RAM_OVERSCAN), "\0")
+		self.system.set_overscan(True)
+		self.system.run()
+		self.assertEqual(self.ram(stubcore.RAM_OVERSCAN), "\1")
+
+	def test_can_dupe(self):
+		for can_dupe in (True, False):
+			self.load(can_dupe=can_dupe)
+			frames = []
+			self.system.set_video_refresh_cb(
+					lambda data, width, height, pitch: frames.append(data is None))
+			self.system.run_frames(3)
+			self.assertEqual(frames, [False, False, can_dupe])
+
+	def test_pixel_format(self):
+		self.load(pixel_format=PIXEL_FORMAT_RGB565)
+		self.assertEqual(self.ram(stubcore.RAM_FORMAT_OK), "\0")
+		self.assertEqual(self.system.get_pixel_format(), PIXEL_FORMAT_0RGB1555)
+
+		self.load(pixel_format=PIXEL_FORMAT_RGB565, allowed=[PIXEL_FORMAT_RGB565])
+		self.assertEqual(self.ram(stubcore.RAM_FORMAT_OK), "\1")
+		self.assertEqual(self.system.get_pixel_format(), PIXEL_FORMAT_RGB565)
+
+		self.assertRaises(ValueError, self.system.set_pixel_formats, [7])
+
+
+if __name__ == "__main__":
+	unittest.main()
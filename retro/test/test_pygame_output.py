@@ -0,0 +1,99 @@
+#!/usr/bin/python
+import unittest
+
+import numpy
+
+try:
+	import pygame
+	from retro.video import pygame_output
+except ImportError:
+	pygame_output = None
+
+from retro.globals import (PIXEL_FORMAT_0RGB1555, PIXEL_FORMAT_XRGB8888,
+		PIXEL_FORMAT_RGB565)
+
+
+class Geometry(object):
+	base_width = 8
+	base_height = 4
+
+
+class AVInfo(object):
+	geometry = Geometry
+
+
+class FakeLib(object):
+	def retro_get_system_av_info(self):
+		return AVInfo
+
+
+class FakeCore(object):
+	_lib = FakeLib()
+
+	def __init__(self, pixel_format):
+		self.pixel_format = pixel_format
+
+	def get_pixel_format(self):
+		return self.pixel_format
+
+	def set_video_refresh_cb(self, callback):
+		self.refresh = callback
+
+	def draw(self, width, height, colour, dtype=numpy.uint16):
+		"""
+		Draw a frame of the given colour, in a buffer with padded rows.
+		"""
+		frame = numpy.zeros((height, width + 3), dtype)
+		frame[:, :width] = colour
+		self.refresh(frame[:, :width], width, height, frame.strides[0])
+
+
+@unittest.skipIf(pygame_output is None, "needs pygame")
+class TestPygameOutput(unittest.TestCase):
+
+	def setUp(self):
+		self.surfaces = []
+
+	def keep(self, surf):
+		self.surfaces.append((surf, surf.get_size(), surf.get_at((0, 0))[:3]))
+
+	def test_pixel_formats(self):
+		for pixel_format, colour, dtype in [
+				(PIXEL_FORMAT_0RGB1555, 0x7c00, numpy.uint16),
+				(PIXEL_FORMAT_RGB565, 0xf800, numpy.uint16),
+				(PIXEL_FORMAT_XRGB8888, 0xff0000, numpy.uint32)]:
+			core = FakeCore(pixel_format)
+			pygame_output.set_video_refresh_cb(core, self.keep)
+			core.draw(8, 4, colour, dtype)
+			self.assertEqual(self.surfaces[-1][1:], ((8, 4), (255, 0, 0)))
+
+		# Given explicitly, rather than asked of the core.
+		core = FakeCore(PIXEL_FORMAT_0RGB1555)
+		pygame_output.set_video_refresh_cb(core, self.keep,
+				pixel_format=PIXEL_FORMAT_RGB565)
+		core.draw(8, 4, 0x07e0)
+		self.assertEqual(self.surfaces[-1][1:], ((8, 4), (0, 255, 0)))
+
+	def test_dupes_and_scaling(self):
+		core = FakeCore(PIXEL_FORMAT_0RGB1555)
+		pygame_output.set_video_refresh_cb(core, self.keep)
+		core.refresh(None, 8, 4, 32)
+		self.assertEqual(self.surfaces, [])
+
+		core.draw(16, 4, 0x001f)
+		core.refresh(None, 16, 4, 48)
+		core.draw(8, 8, 0x7fff)
+		sizes = [size for _, size, _ in self.surfaces]
+		self.assertEqual(sizes, [(8, 4), (8, 4), (8, 4)])
+		self.assertTrue(self.surfaces[0][0] is self.surfaces[1][0])
+		self.assertEqual([colour for _, _, colour in self.surfaces],
+				[(0, 0, 255), (0, 0, 255), (255, 255, 255)])
+
+		core = FakeCore(PIXEL_FORMAT_0RGB1555)
+		pygame_output.set_video_refresh_cb(core, self.keep, scale=False)
+		core.draw(16, 8, 0x001f)
+		self.assertEqual(self.surfaces[-1][1], (16, 8))
+
+
+if __name__ == "__main__":
+	unittest.main()
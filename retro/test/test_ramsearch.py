@@ -0,0 +1,104 @@
+#!/usr/bin/python
+import unittest
+
+import numpy
+
+from retro import ramsearch
+
+
+class FakeCore(object):
+	"""
+	A console with a frame counter at 0x10 (little-endian, 16 bits), lives at
+	0x21 and a big-endian score at 0x40 (32 bits), among noisy memory.
+	"""
+	def __init__(self, size=4096):
+		self.ram = numpy.zeros(size, numpy.uint8)
+		self.frame = 0
+		self.lives = 3
+		self.score = 0
+		self.random = numpy.random.RandomState(1)
+
+	def run(self):
+		self.frame += 1
+		self.score += 250
+		if self.frame % 4 == 0:
+			self.lives -= 1
+		self.ram[0x100:] = self.random.randint(0, 256, len(self.ram) - 0x100)
+		self.ram[0x10:0x12] = numpy.array([self.frame], '<u2').view(numpy.uint8)
+		self.ram[0x21] = self.lives
+		self.ram[0x40:0x44] = numpy.array([self.score], '>u4').view(numpy.uint8)
+
+	def memory_view(self, mem_type):
+		return self.ram
+
+	def read_memory(self, mem_type, out=None, offset=0, size=None):
+		out[:] = self.ram[offset:offset + len(out)]
+		return out
+
+
+class TestRamSearch(unittest.TestCase):
+
+	def step(self, core, search, frames=1):
+		for _ in range(frames):
+			core.run()
+			search.snapshot()
+
+	def test_counter(self):
+		core = FakeCore()
+		search = ramsearch.RamSearch(core, width=2)
+		self.step(core, search, 2)
+		search.increased(by=1)
+		self.step(core, search, 2)
+		search.increased(by=1)
+		self.step(core, search)
+		search.equal(5)
+		self.assertEqual(list(search.candidates), [0x10])
+
+	def test_unaligned_byte(self):
+		core = FakeCore()
+		search = ramsearch.RamSearch(core, width=1, aligned=False)
+		self.step(core, search, 2)
+		search.unchanged()
+		search.equal(3)
+		self.step(core, search, 2)
+		search.decreased(by=1)
+		self.assertEqual(list(search.candidates), [0x21])
+
+	def test_big_endian_history(self):
+		core = FakeCore()
+		search = ramsearch.RamSearch(core, width=4, big_endian=True, history=8)
+		self.step(core, search, 8)
+		search.filter_history(
+				lambda values: (numpy.diff(values, axis=0) == 250).all(axis=0))
+		self.assertEqual(list(search.candidates), [0x40])
+		self.assertEqual(list(search.values(3)[:, 0]), [1500, 1750, 2000])
+
+	def test_odd_size(self):
+		"""
+		Memory whose size isn't a multiple of the width can be searched, up
+		to the last whole value.
+		"""
+		core = FakeCore(size=0x103)
+		search = ramsearch.RamSearch(core, width=2)
+		self.assertEqual(len(search), 0x81)
+		self.step(core, search, 2)
+		search.increased(by=1)
+		self.assertEqual(list(search.candidates), [0x10])
+
+		search = ramsearch.RamSearch(core, width=4, big_endian=True)
+		self.assertEqual(search.candidates[-1], 0x100 - 4)
+		self.step(core, search, 2)
+		search.increased(by=250)
+		self.assertEqual(list(search.candidates), [0x40])
+
+	def test_needs_snapshots(self):
+		core = FakeCore()
+		search = ramsearch.RamSearch(core)
+		search.snapshot()
+		self.assertRaises(ValueError, search.changed)
+		search.reset()
+		self.assertEqual(len(search), 4096)
+
+
+if __name__ == "__main__":
+	unittest.main()
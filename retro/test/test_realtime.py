@@ -0,0 +1,175 @@
+#!/usr/bin/python
+import unittest
+
+from retro import realtime
+
+
+class FakeTime(object):
+	"""
+	A clock that only moves when slept on, or when told to.
+	"""
+	def __init__(self):
+		self.now = 100.0
+
+	def time(self):
+		return self.now
+
+	def sleep(self, seconds):
+		self.now += seconds
+
+
+class FakeLoop(object):
+	"""
+	Just enough of an asyncio event loop to schedule frames on, with a clock
+	of its own that runs at the same rate as "time".
+	"""
+	def __init__(self, time):
+		self.clock = time
+		self.calls = []
+
+	def time(self):
+		return self.clock.now + 5000.0
+
+	def create_future(self):
+		return FakeFuture()
+
+	def call_at(self, when, callback):
+		self.calls.append((when, callback))
+
+	def run_next(self):
+		"""
+		Move the clock on to the first call scheduled and make it.
+		"""
+		when, callback = self.calls.pop(0)
+		self.clock.now += max(when - self.time(), 0.0)
+		callback()
+
+
+class FakeFuture(object):
+	def __init__(self):
+		self.result = self.exception = None
+
+	def cancelled(self):
+		return False
+
+	def set_result(self, result):
+		self.result = result
+
+	def set_exception(self, exception):
+		self.exception = exception
+
+
+class FakeCore(object):
+	def __init__(self):
+		self.frames = 0
+
+	def get_refresh_rate(self):
+		return 200.0
+
+	def run(self):
+		self.frames += 1
+
+
+class TestFrameClock(unittest.TestCase):
+
+	def test_no_drift(self):
+		"""
+		A late frame doesn't delay the ones after it.
+		"""
+		t = FakeTime()
+		clock = realtime.FrameClock(50, clock=t.time, sleep=t.sleep)
+		self.assertEqual(clock.tick(), 0)
+		t.now += 0.03
+		self.assertEqual(clock.tick(), 1)
+		for frame in range(2, 10):
+			self.assertEqual(clock.tick(), frame)
+		self.assertAlmostEqual(t.now, 100.0 + 9 * 0.02)
+
+		stats = clock.stats()
+		self.assertEqual(stats["frames"], 10)
+		self.assertEqual(stats["late_frames"], 1)
+		self.assertAlmostEqual(stats["max_jitter"], 0.01)
+
+	def test_resync(self):
+		"""
+		Falling far behind moves the schedule instead of bursting frames.
+		"""
+		t = FakeTime()
+		clock = realtime.FrameClock(50, clock=t.time, sleep=t.sleep)
+		clock.tick()
+		t.now += 10
+		clock.tick()
+		clock.tick()
+		self.assertEqual(clock.stats()["resyncs"], 1)
+		self.assertAlmostEqual(t.now, 110.02)
+
+	def test_schedule(self):
+		"""
+		Deadlines on the clock given are converted to the event loop's clock.
+		"""
+		t = FakeTime()
+		loop = FakeLoop(t)
+		clock = realtime.FrameClock(50, clock=t.time)
+		clock._loop = lambda: loop
+		core = FakeCore()
+
+		futures = [clock._schedule(core.run)]
+		self.assertAlmostEqual(loop.calls[0][0], 5100.0)
+		loop.run_next()
+		t.now += 0.005
+		futures.append(clock._schedule(core.run))
+		self.assertAlmostEqual(loop.calls[0][0], 5100.02)
+		loop.run_next()
+		self.assertAlmostEqual(t.now, 100.02)
+
+		self.assertEqual([future.result for future in futures], [0, 1])
+		self.assertEqual(core.frames, 2)
+		self.assertEqual(clock.stats()["late_frames"], 0)
+		self.assertTrue(clock.now() == t.now)
+
+		def fail():
+			raise ValueError("frame failed")
+		future = clock._schedule(fail)
+		loop.run_next()
+		self.assertTrue(isinstance(future.exception, ValueError))
+
+
+@unittest.skipIf(realtime.asyncio is None, "asyncio is not available")
+class TestRunRealtime(unittest.TestCase):
+
+	def test_run(self):
+		core = FakeCore()
+		runner = realtime.run_realtime(core, frames=10)
+		seen = []
+
+		loop = realtime.asyncio.new_event_loop()
+		done = loop.create_future()
+
+		# What "async for" does, without needing its syntax.
+		def step(future=None):
+			if future is not None:
+				try:
+					seen.append(future.result())
+				except StopAsyncIteration:
+					done.set_result(None)
+					return
+			runner.__anext__().add_done_callback(step)
+
+		realtime.asyncio.set_event_loop(loop)
+		try:
+			start = loop.time()
+			loop.call_soon(step)
+			loop.run_until_complete(done)
+			elapsed = loop.time() - start
+		finally:
+			realtime.asyncio.set_event_loop(None)
+			loop.close()
+
+		self.assertEqual(seen, list(range(10)))
+		self.assertEqual(core.frames, 10)
+		self.assertTrue(elapsed >= 9 / 200.0)
+		self.assertEqual(runner.clock.stats()["frames"], 10)
+
+
+if __name__ == "__main__":
+	unittest.main()
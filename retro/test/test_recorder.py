@@ -0,0 +1,97 @@
+#!/usr/bin/python
+import unittest
+import os
+import tempfile
+
+import numpy
+
+from retro.globals import PIXEL_FORMAT_0RGB1555
+from retro.video import recorder
+
+
+class Geometry(object):
+	max_width = 8
+	max_height = 4
+
+
+class Timing(object):
+	fps = 60.0988
+
+
+class AVInfo(object):
+	geometry = Geometry
+	timing = Timing
+
+
+class FakeLib(object):
+	def retro_get_system_av_info(self):
+		return AVInfo
+
+
+class FakeCore(object):
+	"""
+	Draws 0RGB1555 frames with rows 32 bytes apart.
+	"""
+	_lib = FakeLib()
+
+	def get_pixel_format(self):
+		return PIXEL_FORMAT_0RGB1555
+
+	def set_video_refresh_cb(self, callback):
+		self.refresh = callback
+
+	def draw(self, width, height, colour):
+		frame = numpy.zeros((height, 16), numpy.uint16)
+		frame[:, :width] = colour
+		self.refresh(frame[:, :width], width, height, 32)
+
+	def dupe(self):
+		self.refresh(None, 8, 4, 32)
+
+
+class TestVideoRecorder(unittest.TestCase):
+
+	def setUp(self):
+		handle, self.path = tempfile.mkstemp()
+		os.close(handle)
+
+	def tearDown(self):
+		os.remove(self.path)
+
+	def test_rgb(self):
+		"""
+		Frames are scaled to the output size, and dupes repeat the last frame.
+		"""
+		core = FakeCore()
+		rec = recorder.VideoRecorder(core, self.path, recorder.RGB24)
+		core.draw(8, 4, 0x7c00)
+		core.dupe()
+		core.draw(4, 2, 0x001f)
+		rec.close()
+		self.assertEqual((rec.frames, rec.dupes), (3, 1))
+		self.assertTrue(core.refresh is None)
+		rec.close()
+
+		frames = numpy.fromfile(self.path, numpy.uint8).reshape(3, 4, 8, 3)
+		self.assertTrue((frames[:2] == [255, 0, 0]).all())
+		self.assertTrue((frames[2] == [0, 0, 255]).all())
+
+	def test_y4m(self):
+		core = FakeCore()
+		rec = recorder.VideoRecorder(core, self.path)
+		core.draw(8, 4, 0x7fff)
+		core.dupe()
+		rec.close()
+
+		with open(self.path, 'rb') as handle:
+			data = handle.read()
+		header, rest = data.split("\n", 1)
+		self.assertEqual(header, "YUV4MPEG2 W8 H4 F60099:1000 Ip A1:1 C444")
+		self.assertEqual(rest.count("FRAME\n"), 2)
+		planes = numpy.frombuffer(rest[6:6 + 96], numpy.uint8).reshape(3, 4, 8)
+		self.assertTrue((planes[0] == 235).all())
+		self.assertTrue((planes[1:] == 128).all())
+
+
+if __name__ == "__main__":
+	unittest.main()
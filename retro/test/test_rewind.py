@@ -0,0 +1,106 @@
+#!/usr/bin/python
+import unittest
+
+import numpy
+
+from retro import rewind
+
+
+class FakeCore(object):
+	"""
+	A console whose state is a few bytes of RAM, one of which counts frames.
+	"""
+	def __init__(self, size=4096):
+		self.state = numpy.zeros(size, numpy.uint8)
+		self.state[100:200] = 7
+
+	def run(self):
+		self.state[0] += 1
+		self.state[self.state[0] * 3] ^= 0x5a
+
+	def serialize_size(self):
+		return len(self.state)
+
+	def serialize_into(self, buffer):
+		buffer[:] = self.state
+
+	def unserialize(self, state):
+		self.state[:] = numpy.frombuffer(state, numpy.uint8)
+
+
+class TestRewindBuffer(unittest.TestCase):
+
+	def run_frames(self, core, buf, frames):
+		history = []
+		for _ in range(frames):
+			core.run()
+			buf.frame()
+			history.append(core.state.copy())
+		return history
+
+	def check_codec(self, codec):
+		core = FakeCore()
+		buf = rewind.RewindBuffer(core, codec=codec)
+		history = self.run_frames(core, buf, 20)
+
+		self.assertEqual(len(buf), 19)
+		self.assertEqual(buf.step_back(1), 1)
+		self.assertTrue((core.state == history[-2]).all())
+		self.assertEqual(buf.step_back(5), 5)
+		self.assertTrue((core.state == history[-7]).all())
+
+		# Running on from a rewound state records a new history.
+		history = history[:-6] + self.run_frames(core, buf, 3)
+		self.assertEqual(buf.step_back(2), 2)
+		self.assertTrue((core.state == history[-3]).all())
+
+	def test_zlib(self):
+		"""
+		States can be restored from zlib-compressed deltas.
+		"""
+		self.check_codec('zlib')
+
+	def test_uncompressed(self):
+		"""
+		States can be restored from uncompressed deltas.
+		"""
+		self.check_codec(None)
+
+	def test_interval(self):
+		"""
+		Only every "interval" frames is captured.
+		"""
+		core = FakeCore()
+		buf = rewind.RewindBuffer(core, interval=4)
+		history = self.run_frames(core, buf, 12)
+
+		self.assertEqual(len(buf), 2)
+		buf.step_back(1)
+		self.assertTrue((core.state == history[7]).all())
+
+	def test_budget(self):
+		"""
+		The oldest captures are evicted to stay within the budget.
+		"""
+		core = FakeCore(size=8000)
+		buf = rewind.RewindBuffer(core, budget=8000 + 200, codec=None)
+		self.run_frames(core, buf, 5)
+
+		self.assertEqual(len(buf), 0)
+		self.assertEqual(buf.evicted, 4)
+		self.assertTrue(buf.stored_bytes <= 8000 + 200)
+
+	def test_step_back_too_far(self):
+		"""
+		Stepping back further than the history goes stops at the oldest state.
+		"""
+		core = FakeCore()
+		buf = rewind.RewindBuffer(core)
+		history = self.run_frames(core, buf, 3)
+
+		self.assertEqual(buf.step_back(10), 2)
+		self.assertTrue((core.state == history[0]).all())
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/python
+import unittest
+
+import numpy
+
+from retro.globals import MEMORY_SYSTEM_RAM
+from retro.input import latched
+from retro.test import stubcore
+
+
+class TestRunFrames(unittest.TestCase):
+
+	def setUp(self):
+		self.system = stubcore.load()
+		self.batches = []
+
+	def tearDown(self):
+		self.system.close()
+
+	def keep(self, data, frames):
+		self.assertEqual(data.shape, (frames, 2))
+		self.batches.append(numpy.array(data))
+
+	def expected_audio(self, first, frames):
+		"""
+		The audio the stub core produces in the given frames.
+		"""
+		audio = numpy.zeros((frames * stubcore.AUDIO_FRAMES, 2), numpy.int16)
+		audio[:, 0] = numpy.arange(first, first + frames).repeat(
+				stubcore.AUDIO_FRAMES)
+		audio[:, 1] = numpy.arange(first * stubcore.AUDIO_FRAMES,
+				(first + frames) * stubcore.AUDIO_FRAMES)
+		return audio
+
+	def read_input(self):
+		ram = self.system.read_memory(MEMORY_SYSTEM_RAM,
+				offset=stubcore.RAM_BUTTONS, size=6)
+		return ram.view("<i2").tolist()
+
+	def test_frame_count(self):
+		self.system.run_frames(5)
+		self.assertEqual(stubcore.frame_count(self.system), 5)
+		self.system.run_frames(0)
+		self.system.run()
+		self.assertEqual(stubcore.frame_count(self.system), 6)
+
+	def test_audio(self):
+		"""
+		Without flush_frames, accumulated audio is handed over once, after
+		the last frame.
+		"""
+		self.system.set_audio_sample_batch_cb(self.keep)
+		self.system.set_audio_accumulate(True)
+		self.system.run_frames(4)
+		self.assertEqual(len(self.batches), 1)
+		self.assertTrue((self.batches[0] == self.expected_audio(0, 4)).all())
+
+	def test_audio_flush_frames(self):
+		self.system.set_audio_sample_batch_cb(self.keep)
+		self.system.set_audio_accumulate(True, flush_frames=stubcore.AUDIO_FRAMES)
+		self.system.run_frames(4)
+		self.assertTrue(len(self.batches) >= 4)
+		self.assertTrue((numpy.concatenate(self.batches) ==
+				self.expected_audio(0, 4)).all())
+
+	def test_audio_drain(self):
+		self.system.set_audio_accumulate(True)
+		self.system.run_frames(2)
+		self.system.run_frames(1)
+		self.assertTrue((self.system.drain_audio() ==
+				self.expected_audio(0, 3)).all())
+		self.assertEqual(len(self.system.drain_audio()), 0)
+
+	def test_input_schedule(self):
+		"""
+		Each frame reads the next frame of an advancing input table, and
+		everything reads as 0 once it runs out.
+		"""
+		table = latched.new_table(3)
+		for n in range(3):
+			table[n, 0, 0, latched.INPUT_BUTTONS] = latched.button_mask(n, 15)
+			table[n, 1, 0, latched.INPUT_X] = 10 * n
+			table[n, 1, 0, latched.INPUT_Y] = -n
+		self.system.set_input_table(table, advance=True)
+
+		self.system.run_frames(2)
+		self.assertEqual(self.read_input(), [-0x7ffe, 10, -1])
+		self.system.run_frames(1)
+		self.assertEqual(self.read_input(), [-0x7ffc, 20, -2])
+		self.system.run_frames(2)
+		self.assertEqual(self.read_input(), [0, 0, 0])
+		self.assertEqual(stubcore.frame_count(self.system), 5)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/python
+import unittest
+
+import numpy
+
+from retro import scheduler
+
+
+class FakeTime(object):
+	def __init__(self):
+		self.now = 100.0
+
+	def time(self):
+		return self.now
+
+	def sleep(self, seconds):
+		self.now += seconds
+
+
+class FakeCore(object):
+	"""
+	A core at 50fps whose frames take "cost" seconds of fake time each.
+	"""
+	def __init__(self, t, cost):
+		self.t = t
+		self.cost = cost
+		self.skip = False
+		self.skips = []
+		self.batch = None
+
+	def get_refresh_rate(self):
+		return 50.0
+
+	def set_video_skip(self, skip):
+		self.skip = skip
+
+	def set_audio_sample_batch_cb(self, callback):
+		self.batch = callback
+
+	def set_audio_accumulate(self, enabled=True, flush_frames=0):
+		pass
+
+	def run(self):
+		self.skips.append(self.skip)
+		self.t.now += self.cost
+
+
+class FakeSink(object):
+	def __init__(self, size, buffered):
+		self.ring = numpy.zeros((size, 2), numpy.int16)
+		self.buffered = buffered
+		self.written = []
+
+	def write(self, data):
+		self.written.append(data)
+
+
+class TestRateControl(unittest.TestCase):
+
+	def test_ratio(self):
+		rate = scheduler.RateControl(max_delta=0.005)
+		self.assertEqual(rate.ratio(0.5), 1.0)
+		self.assertAlmostEqual(rate.ratio(0.0), 1.005)
+		self.assertAlmostEqual(rate.ratio(1.0), 0.995)
+		self.assertAlmostEqual(rate.ratio(0.25), 1.0025)
+		self.assertAlmostEqual(rate.ratio(2.0), 0.995)
+
+
+class TestResampler(unittest.TestCase):
+
+	def test_unity(self):
+		resampler = scheduler.Resampler()
+		data = numpy.arange(200, dtype=numpy.int16).reshape(100, 2)
+		self.assertTrue((resampler.resample(data, 1.0) == data).all())
+
+	def test_stream(self):
+		"""
+		Resampling in pieces gives the same stream as in one go.
+		"""
+		data = (numpy.arange(2000).reshape(1000, 2) % 317).astype(numpy.int16)
+		whole = scheduler.Resampler().resample(data, 1.005)
+		resampler = scheduler.Resampler()
+		pieces = numpy.concatenate([
+				resampler.resample(data[i:i + 73], 1.005)
+				for i in range(0, 1000, 73)
+			])
+		self.assertEqual(len(whole), 1004)
+		self.assertEqual(len(pieces), len(whole))
+		self.assertTrue((abs(pieces.astype(int) - whole) <= 1).all())
+
+
+class TestFrameScheduler(unittest.TestCase):
+
+	def test_keeping_up(self):
+		t = FakeTime()
+		core = FakeCore(t, 0.005)
+		sched = scheduler.FrameScheduler(core, clock=t.time, sleep=t.sleep)
+		sched.run(20)
+		self.assertEqual(core.skips, [False] * 20)
+		self.assertEqual(sched.stats()["skipped_frames"], 0)
+		self.assertAlmostEqual(sched.frame_time, 0.005)
+
+	def test_falling_behind(self):
+		"""
+		Video is skipped while behind, but never more than max_skip frames in
+		a row.
+		"""
+		t = FakeTime()
+		core = FakeCore(t, 0.035)
+		sched = scheduler.FrameScheduler(core, max_skip=2, clock=t.time,
+				sleep=t.sleep)
+		sched.run(9)
+		self.assertEqual(core.skips[:3], [False, False, True])
+		for i in range(len(core.skips) - 2):
+			self.assertFalse(all(core.skips[i:i + 3]))
+		self.assertTrue(sched.skipped_frames > 0)
+		self.assertFalse(core.skip)
+
+	def test_audio(self):
+		t = FakeTime()
+		core = FakeCore(t, 0.0)
+		sink = FakeSink(1000, 0)
+		sched = scheduler.FrameScheduler(core, sink, clock=t.time,
+				sleep=t.sleep)
+		core.batch(numpy.zeros((800, 2), numpy.int16), 800)
+		self.assertAlmostEqual(sched.ratio, 1.005)
+		self.assertEqual(len(sink.written[0]), 803)
+
+		sink.buffered = 1000
+		core.batch(numpy.zeros((800, 2), numpy.int16), 800)
+		self.assertAlmostEqual(sched.ratio, 0.995)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/python
+import unittest
+import hashlib
+import os
+import shutil
+import tempfile
+
+import numpy
+
+from retro import statestore
+
+
+def state(n, size=1000):
+	return (numpy.arange(size) * n % 251).astype(numpy.uint8)
+
+
+def contents(data):
+	return numpy.frombuffer(data, numpy.uint8).tostring()
+
+
+class TestStateStore(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp(prefix="retro-statestore-")
+
+	def tearDown(self):
+		shutil.rmtree(self.directory, True)
+
+	def open(self, **kwargs):
+		store = statestore.StateStore(self.directory, **kwargs)
+		self.addCleanup(store.close)
+		return store
+
+	def test_dedup(self):
+		store = self.open()
+		key = store.put(state(1))
+		self.assertEqual(key, hashlib.sha1(state(1)).hexdigest())
+		self.assertEqual(store.put(bytearray(state(1).tostring())), key)
+		self.assertNotEqual(store.put(state(2)), key)
+		self.assertEqual(store.puts, 3)
+		self.assertEqual(store.dedups, 1)
+
+		# Still deduplicated once it has left the cache, from the disk.
+		store.flush()
+		store._cache.clear()
+		self.assertEqual(store.put(state(1)), key)
+		self.assertEqual(store.dedups, 2)
+
+	def test_write(self):
+		store = self.open()
+		key = store.put(state(1))
+		self.assertTrue(key in store)
+		store.flush()
+		self.assertTrue(os.path.exists(os.path.join(self.directory, key[:2], key)))
+		self.assertEqual(store.stats()["pending"], 0)
+		self.assertTrue(0 < store.bytes_written < 1000)
+
+		reopened = self.open()
+		self.assertTrue(key in reopened)
+		self.assertEqual(contents(reopened.get(key)), state(1).tostring())
+		self.assertFalse("0" * 40 in reopened)
+		self.assertRaises(KeyError, reopened.get, "0" * 40)
+
+	def test_lru(self):
+		store = self.open(cache_size=2)
+		keys = [store.put(state(n)) for n in (1, 2, 3)]
+		store.flush()
+		self.assertEqual(list(store._cache), keys[1:])
+
+		store.get(keys[1])
+		self.assertEqual((store.cache_hits, store.disk_loads), (1, 0))
+		self.assertEqual(contents(store.get(keys[0])), state(1).tostring())
+		self.assertEqual((store.cache_hits, store.disk_loads), (1, 1))
+		# keys[2] was the least recently used.
+		self.assertEqual(list(store._cache), [keys[1], keys[0]])
+
+	def test_mmap(self):
+		for codec in (None, 'zlib'):
+			store = self.open(codec=codec, cache_size=0)
+			key = store.put(state(5))
+			store.flush()
+			data = store.get(key)
+			self.assertEqual(contents(data), state(5).tostring())
+			self.assertEqual(store.disk_loads, 1)
+			if codec is None:
+				self.assertTrue(isinstance(data, numpy.ndarray))
+				self.assertEqual(store.bytes_written, 1000)
+			store.close()
+			shutil.rmtree(self.directory)
+
+	def test_stats(self):
+		store = self.open()
+		self.assertEqual(store.stats()["dedup_ratio"], 0.0)
+		self.assertEqual(store.stats()["hit_ratio"], 0.0)
+		key = store.put(state(1))
+		store.put(state(1))
+		store.put(state(2))
+		store.put(state(1))
+		store.get(key)
+		store.flush()
+		stats = store.stats()
+		self.assertEqual(stats["puts"], 4)
+		self.assertEqual(stats["dedups"], 2)
+		self.assertEqual(stats["dedup_ratio"], 0.5)
+		self.assertEqual(stats["cache_hits"], 1)
+		self.assertEqual(stats["disk_loads"], 0)
+		self.assertEqual(stats["hit_ratio"], 1.0)
+		self.assertEqual(stats["bytes_written"], store.bytes_written)
+		self.assertEqual(stats["pending"], 0)
+
+	def test_failed_write(self):
+		store = self.open()
+		write = store._write
+		def fail(path, blob):
+			raise IOError("disk full")
+		store._write = fail
+		key = store.put(state(1))
+		self.assertRaises(IOError, store.flush)
+		self.assertEqual(store.stats()["pending"], 0)
+		self.assertFalse(key in store)
+
+		# Putting it again writes it, rather than deduplicating.
+		store._write = write
+		self.assertEqual(store.put(state(1)), key)
+		self.assertEqual(store.dedups, 0)
+		store.flush()
+		self.assertTrue(os.path.exists(os.path.join(self.directory, key[:2], key)))
+
+	def test_failed_write_put(self):
+		store = self.open()
+		def fail(path, blob):
+			raise IOError("disk full")
+		store._write = fail
+		store.put(state(1))
+		store._queue.join()
+		self.assertRaises(IOError, store.put, state(2))
+
+
+if __name__ == "__main__":
+	unittest.main()
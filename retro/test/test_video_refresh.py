@@ -0,0 +1,60 @@
+#!/usr/bin/python
+import unittest
+
+import numpy
+
+from retro.video import convert
+from retro.test import stubcore
+
+
+class TestVideoRefresh(unittest.TestCase):
+
+	def setUp(self):
+		self.system = stubcore.load()
+		self.frames = []
+
+	def tearDown(self):
+		self.system.close()
+
+	def keep(self, data, width, height, pitch):
+		if data is None:
+			self.frames.append(None)
+			return
+		rgb = convert.convert(data, width, height, pitch)
+		self.frames.append((numpy.array(data), rgb, width, height, pitch))
+
+	def check_frames(self, pitch):
+		self.system.run_frames(3)
+		self.assertEqual(self.frames[2], None)
+		for n in range(2):
+			data, rgb, width, height, frame_pitch = self.frames[n]
+			self.assertEqual((width, height), (8 + 8 * n, stubcore.HEIGHT))
+			self.assertEqual(frame_pitch, pitch or width * 2)
+			self.assertEqual(data.shape, (height, width))
+			expected = numpy.array([[stubcore.pixel(n, x, y)
+					for x in range(width)] for y in range(height)], numpy.uint16)
+			self.assertTrue((data == expected).all())
+			self.assertTrue((rgb == convert.convert(expected.tostring(),
+					width, height, width * 2)).all())
+
+	def test_view(self):
+		self.system.set_video_refresh_cb(self.keep)
+		self.check_frames(stubcore.PITCH)
+
+	def test_copy(self):
+		"""
+		A copied frame comes with the pitch of the copy, so consumers
+		honouring the pitch don't read past its end.
+		"""
+		self.system.set_video_refresh_cb(self.keep, copy=True)
+		self.check_frames(None)
+		# The bottom-right pixel, which is past the end of the copy with the
+		# core's pitch.
+		data, rgb, width, height, pitch = self.frames[1]
+		self.assertTrue(data.flags.c_contiguous)
+		self.assertTrue((rgb[-1, -1] == convert.convert(
+				data[-1:, -1:].tostring(), 1, 1, 2)[0, 0]).all())
+
+
+if __name__ == "__main__":
+	unittest.main()
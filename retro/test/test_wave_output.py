@@ -0,0 +1,99 @@
+#!/usr/bin/python
+import unittest
+import io
+import wave
+
+import numpy
+
+from retro.audio import wave_output
+
+
+class Timing(object):
+	sample_rate = 32040.4
+
+
+class AVInfo(object):
+	timing = Timing
+
+
+class FakeLib(object):
+	def retro_get_system_av_info(self):
+		return AVInfo
+
+
+class FakeCore(object):
+	_lib = FakeLib()
+
+	def __init__(self):
+		self.batch = None
+		self.accumulate = False
+
+	def set_audio_sample_batch_cb(self, callback):
+		self.batch = callback
+
+	def set_audio_accumulate(self, enabled=True, flush_frames=0):
+		self.accumulate = enabled
+
+	def play(self, start, frames):
+		data = numpy.arange(start * 2, (start + frames) * 2, dtype=numpy.int16)
+		self.batch(data.reshape(frames, 2), frames)
+
+
+class TestWaveSink(unittest.TestCase):
+
+	def record(self, core, handle, chunks, **kwargs):
+		sink = wave_output.WaveSink(core, handle, **kwargs)
+		start = 0
+		for frames in chunks:
+			core.play(start, frames)
+			start += frames
+		return sink
+
+	def read(self, handle):
+		reader = wave.open(io.BytesIO(handle.getvalue()), "rb")
+		self.assertEqual(reader.getnchannels(), 2)
+		self.assertEqual(reader.getsampwidth(), 2)
+		self.assertEqual(reader.getframerate(), 32040)
+		frames = reader.getnframes()
+		data = numpy.frombuffer(reader.readframes(frames), '<i2')
+		return frames, data.reshape(-1, 2)
+
+	def test_blocks(self):
+		"""
+		Audio spanning several blocks, and more than the pool holds, is
+		written in order.
+		"""
+		core = FakeCore()
+		handle = io.BytesIO()
+		sink = self.record(core, handle, [3, 10, 1, 7, 0, 9],
+				block_frames=4, blocks=2)
+		self.assertEqual(sink.frames, 30)
+		sink.close()
+		frames, data = self.read(handle)
+		self.assertEqual(frames, 30)
+		self.assertEqual(data.ravel().tolist(), list(range(60)))
+
+	def test_partial_block(self):
+		core = FakeCore()
+		handle = io.BytesIO()
+		sink = self.record(core, handle, [5], block_frames=64)
+		sink.close()
+		self.assertEqual(self.read(handle)[0], 5)
+
+	def test_close(self):
+		"""
+		close() stops recording, and only works once.
+		"""
+		core = FakeCore()
+		handle = io.BytesIO()
+		sink = self.record(core, handle, [6], block_frames=4)
+		self.assertTrue(core.accumulate)
+		sink.close()
+		self.assertTrue(core.batch is None)
+		self.assertFalse(core.accumulate)
+		sink.close()
+		self.assertEqual(self.read(handle)[0], 6)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,93 @@
+"""
+Keep every video frame in a ring buffer, without a Python video callback.
+"""
+import numpy
+
+from retro.globals import PIXEL_FORMAT_XRGB8888
+
+
+class FrameCapture(object):
+	"""
+	Captures the frames produced by an EmulatedSystem into a ring of slots.
+
+	The frames are copied into the ring by the Cython layer as the core
+	produces them, so capturing costs no Python code per frame. Call read()
+	after run() to collect the frames captured since the last read().
+
+	Duped frames are stored as a copy of the previous frame, so every slot
+	always holds a complete frame.
+	"""
+	def __init__(self, core, slots, frames=None):
+		"""
+		Start capturing the frames of the given EmulatedSystem.
+
+		"slots" is the number of frames the ring can hold. If you call read()
+		less often than every "slots" frames, the oldest frames are lost.
+
+		"frames" may be a preallocated C-contiguous uint16 array of shape
+		(slots, max_height, max_width), uint32 for PIXEL_FORMAT_XRGB8888. If not given, one is allocated using
+		the maximum geometry of the loaded game, so a game must be loaded.
+
+		Capturing replaces the video refresh callback until close() is called.
+		"""
+		if frames is None:
+			geometry = core._lib.retro_get_system_av_info().geometry
+			xrgb8888 = core.get_pixel_format() == PIXEL_FORMAT_XRGB8888
+			frames = numpy.zeros(
+					(slots, geometry.max_height, geometry.max_width),
+					numpy.uint32 if xrgb8888 else numpy.uint16,
+				)
+		self.frames = frames
+		self.sizes = numpy.zeros((len(frames), 2), numpy.uint32)
+		self.slots = len(frames)
+
+		# How many frames read() has handed out, and how many were
+		# overwritten before they could be.
+		self.read_count = 0
+		self.dropped = 0
+
+		self._core = core
+		core.set_video_capture(self.frames, self.sizes)
+
+	@property
+	def count(self):
+		"""
+		The number of frames captured so far.
+		"""
+		return self._core._lib.retro_get_video_capture_count()
+
+	def read(self):
+		"""
+		Return the frames captured since the last call, oldest first.
+
+		Returns a tuple of two arrays: a (frames, max_height, max_width) array,
+		of the ring's type, with each frame in the top-left corner of its slot,
+		and
+		a (frames, 2) uint32 array of the width and height of each frame.
+
+		When the frames are contiguous in the ring these are views onto it,
+		valid until the frames are overwritten, otherwise they are copies.
+		"""
+		count = self.count
+		start = self.read_count
+		if count - start > self.slots:
+			self.dropped += count - start - self.slots
+			start = count - self.slots
+		self.read_count = count
+
+		first = start % self.slots
+		last = first + (count - start)
+		if last <= self.slots:
+			return self.frames[first:last], self.sizes[first:last]
+
+		last -= self.slots
+		return (
+				numpy.concatenate((self.frames[first:], self.frames[:last])),
+				numpy.concatenate((self.sizes[first:], self.sizes[:last])),
+			)
+
+	def close(self):
+		"""
+		Stop capturing, and go back to calling the video refresh callback.
+		"""
+		self._core.set_video_capture(None, None)
@@ -0,0 +1,229 @@
+"""
+Convert raw video frames to RGB, RGBA or grayscale numpy arrays.
+
+Frames come from the core in one of the PIXEL_FORMAT_* formats, with rows
+"pitch" bytes apart. 16-bit formats are converted by looking every pixel up
+in a precomputed table of all 65536 possible values, in C when the _retro
+extension is available, so converting a frame costs one table lookup per
+pixel whatever the output.
+
+Outputs are uint8 arrays of shape (height, width, 3) for RGB24, (height,
+width, 4) for RGBA32 and (height, width) for GRAY.
+"""
+import numpy
+
+from retro.globals import (PIXEL_FORMAT_0RGB1555, PIXEL_FORMAT_XRGB8888,
+		PIXEL_FORMAT_RGB565)
+
+try:
+	from _retro import lut_convert
+except ImportError:
+	lut_convert = None
+
+RGB24 = 'rgb24'
+RGBA32 = 'rgba32'
+GRAY = 'gray'
+
+CHANNELS = {RGB24: 3, RGBA32: 4, GRAY: 1}
+
+# ITU-R BT.601 luma weights, out of 256.
+GRAY_WEIGHTS = (77, 150, 29)
+
+_tables = {}
+
+
+def _expand(value, bits):
+	"""
+	Scale channel values of the given number of bits up to 8 bits.
+	"""
+	return (value << (8 - bits)) | (value >> (2 * bits - 8))
+
+
+def _gray(r, g, b):
+	wr, wg, wb = GRAY_WEIGHTS
+	gray = r.astype(numpy.uint16) * wr
+	gray += g.astype(numpy.uint16) * wg
+	gray += b.astype(numpy.uint16) * wb
+	return gray >> 8
+
+
+def lookup_table(pixel_format, output):
+	"""
+	Return the table converting every value of a 16-bit pixel format to the
+	given output, as a uint8 array of shape (65536, channels).
+
+	Tables are built on first use and shared afterwards.
+	"""
+	key = (pixel_format, output)
+	table = _tables.get(key)
+	if table is not None:
+		return table
+
+	pixels = numpy.arange(65536, dtype=numpy.uint32)
+	if pixel_format == PIXEL_FORMAT_0RGB1555:
+		r = _expand((pixels >> 10) & 0x1f, 5)
+		g = _expand((pixels >> 5) & 0x1f, 5)
+		b = _expand(pixels & 0x1f, 5)
+	elif pixel_format == PIXEL_FORMAT_RGB565:
+		r = _expand(pixels >> 11, 5)
+		g = _expand((pixels >> 5) & 0x3f, 6)
+		b = _expand(pixels & 0x1f, 5)
+	else:
+		raise ValueError("No lookup table for pixel format %r" % (pixel_format,))
+
+	table = numpy.empty((65536, CHANNELS[output]), numpy.uint8)
+	if output == GRAY:
+		table[:, 0] = _gray(r, g, b)
+	else:
+		table[:, 0] = r
+		table[:, 1] = g
+		table[:, 2] = b
+		if output == RGBA32:
+			table[:, 3] = 255
+	_tables[key] = table
+	return table
+
+
+def raw_pixels(data, width, height, pitch, pixel_format=PIXEL_FORMAT_0RGB1555):
+	"""
+	Return the pixels of a frame as passed to the video refresh callback, as
+	a (height, width) array of uint16, or uint32 for PIXEL_FORMAT_XRGB8888.
+
+	"data" may also be any object supporting the buffer protocol, holding
+	"height" rows "pitch" bytes apart. The array is a view onto it. If
+	"data" is a two-dimensional array, such as the one the callback is given,
+	its own row stride is used instead of "pitch".
+
+	Raises ValueError if the rows overlap, or if "data" is too short to hold
+	them.
+	"""
+	if not isinstance(data, numpy.ndarray):
+		data = numpy.frombuffer(data, numpy.uint8)
+	elif data.ndim == 2:
+		pitch = data.strides[0]
+	dtype = numpy.dtype(numpy.uint32 if pixel_format == PIXEL_FORMAT_XRGB8888
+			else numpy.uint16)
+	if height and width:
+		row = width * dtype.itemsize
+		if pitch < row:
+			raise ValueError("Rows of %d bytes can't be %d bytes apart"
+					% (row, pitch))
+		size = pitch * (height - 1) + row
+		if _extent(data) < size:
+			raise ValueError("A %dx%d frame with a pitch of %d needs %d bytes, "
+					"not %d" % (width, height, pitch, size, _extent(data)))
+	return _reinterpret(data, dtype, (height, width), (pitch, dtype.itemsize))
+
+
+def frame_bytes(data, width, height, pitch, pixel_format=PIXEL_FORMAT_0RGB1555):
+	"""
+	Return the memory of a frame as passed to the video refresh callback, from
+	its first pixel to its last, as a one-dimensional uint8 array: "height"
+	rows "pitch" bytes apart, padding included, with the last one ending after
+	its "width" pixels.
+
+	The array is a view onto "data", so copying it copies the whole frame in
+	one go. "data" is interpreted as by raw_pixels().
+	"""
+	pixels = raw_pixels(data, width, height, pitch, pixel_format)
+	size = 0
+	if height and width:
+		size = pixels.strides[0] * (height - 1) + width * pixels.itemsize
+	return _reinterpret(pixels, numpy.uint8, (size,), (1,))
+
+
+def _reinterpret(data, dtype, shape, strides):
+	"""
+	Return a view of the memory of "data" with the given dtype, shape and
+	strides. Unlike ndarray.view(), this works for strided rows.
+	"""
+	dtype = numpy.dtype(dtype)
+	interface = dict(data.__array_interface__, shape=shape, strides=strides,
+			typestr=dtype.str, descr=[('', dtype.str)])
+	return numpy.asarray(_ArrayInterface(interface, data))
+
+
+def _extent(data):
+	"""
+	Return the number of bytes from the first element of an array to the end
+	of its last.
+	"""
+	if data.size == 0:
+		return 0
+	return data.itemsize + sum((n - 1) * stride
+			for n, stride in zip(data.shape, data.strides))
+
+
+class _ArrayInterface(object):
+	"""
+	Exposes an __array_interface__, keeping the array it describes alive.
+	"""
+	def __init__(self, interface, base):
+		self.__array_interface__ = interface
+		self.base = base
+
+
+def output_buffer(width, height, output=RGB24):
+	"""
+	Return a new array to pass as the "out" parameter of convert().
+	"""
+	if output == GRAY:
+		return numpy.empty((height, width), numpy.uint8)
+	return numpy.empty((height, width, CHANNELS[output]), numpy.uint8)
+
+
+def convert(data, width, height, pitch, pixel_format=PIXEL_FORMAT_0RGB1555,
+		output=RGB24, out=None):
+	"""
+	Convert a frame as passed to the video refresh callback to the given
+	output, one of RGB24, RGBA32 or GRAY, and return it.
+
+	If "out" is given, it must be a C-contiguous uint8 array of the shape
+	returned by output_buffer(), and the frame is written into it instead
+	of a new array. Reusing it saves an allocation per frame.
+	"""
+	if output not in CHANNELS:
+		raise ValueError("Unknown output %r" % (output,))
+	if out is None:
+		out = output_buffer(width, height, output)
+	pixels = raw_pixels(data, width, height, pitch, pixel_format)
+
+	if pixel_format == PIXEL_FORMAT_XRGB8888:
+		return _convert_xrgb8888(pixels, output, out)
+
+	if lut_convert is not None:
+		# RGBA entries are faster to copy than RGB ones, so RGB24 is the
+		# first three bytes of each.
+		table = lookup_table(pixel_format,
+				RGBA32 if output == RGB24 else output)
+		return lut_convert(pixels, table, out)
+	table = lookup_table(pixel_format, output)
+	if output == RGBA32:
+		numpy.take(table.view(numpy.uint32)[:, 0], pixels,
+				out=out.view(numpy.uint32)[..., 0])
+	elif output == GRAY:
+		numpy.take(table[:, 0], pixels, out=out)
+	else:
+		out[...] = table[pixels]
+	return out
+
+
+def _convert_xrgb8888(pixels, output, out):
+	# Each pixel is a native-endian 32-bit value, so its bytes are B, G, R, X
+	# on little-endian hosts.
+	channels = _reinterpret(pixels, numpy.uint8, pixels.shape + (4,),
+			pixels.strides + (1,))
+	if numpy.little_endian:
+		r, g, b = channels[..., 2], channels[..., 1], channels[..., 0]
+	else:
+		r, g, b = channels[..., 1], channels[..., 2], channels[..., 3]
+
+	if output == GRAY:
+		out[...] = _gray(r, g, b)
+		return out
+	out[..., 0] = r
+	out[..., 1] = g
+	out[..., 2] = b
+	if output == RGBA32:
+		out[..., 3] = 255
+	return out
@@ -2,16 +2,110 @@
 PyOpenGL output for libretro video.
 """
 from OpenGL.GL import *
-from OpenGL.raw.GL import glTexImage2D
+from OpenGL.GL import shaders
 import ctypes
 from xml.etree import ElementTree as ET
 
+from retro.globals import (PIXEL_FORMAT_0RGB1555, PIXEL_FORMAT_XRGB8888,
+		PIXEL_FORMAT_RGB565)
+
 SHADER_TYPES = {
-		"vertex": OpenGL.GL.GL_VERTEX_SHADER,
-		"fragment": OpenGL.GL.GL_FRAGMENT_SHADER,
+		"vertex": GL_VERTEX_SHADER,
+		"fragment": GL_FRAGMENT_SHADER,
+	}
+
+# The format, type and bytes per pixel to upload each pixel format with.
+PIXEL_FORMATS = {
+		PIXEL_FORMAT_0RGB1555: (GL_BGRA, GL_UNSIGNED_SHORT_1_5_5_5_REV, 2),
+		PIXEL_FORMAT_RGB565: (GL_RGB, GL_UNSIGNED_SHORT_5_6_5, 2),
+		PIXEL_FORMAT_XRGB8888: (GL_BGRA, GL_UNSIGNED_INT_8_8_8_8_REV, 4),
 	}
 
-def set_video_refresh_cb(core, callback):
+
+class StreamingTexture(object):
+	"""
+	A texture big enough for the largest frame a game produces, which every
+	frame is uploaded into in place.
+
+	Frames are read straight from the core's buffer, rows and all, so
+	nothing is copied in Python. With "use_pbo", each frame is instead
+	copied into one of two pixel buffer objects in turn and uploaded from
+	there, so the driver can transfer one while the next is filled.
+
+	Requires a current OpenGL context.
+	"""
+	def __init__(self, max_width, max_height,
+			pixel_format=PIXEL_FORMAT_0RGB1555, use_pbo=False):
+		self.format, self.type, self.bytes_per_pixel = PIXEL_FORMATS[pixel_format]
+		self.texture = glGenTextures(1)
+		self.width = 0
+		self.height = 0
+		self._allocate(max_width, max_height)
+
+		self._pbos = list(glGenBuffers(2)) if use_pbo else []
+		self._next_pbo = 0
+
+	def _allocate(self, width, height):
+		"""
+		(Re)allocate the texture storage.
+		"""
+		self.texture_width = width
+		self.texture_height = height
+		glBindTexture(GL_TEXTURE_2D, self.texture)
+		glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+		glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+		glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, self.format,
+				self.type, None)
+
+	def upload(self, data, width, height, pitch):
+		"""
+		Upload a frame as passed to the video refresh callback.
+
+		If "data" is None, the frame is a dupe and the texture is left as it is.
+		"""
+		if data is None:
+			return
+		if width > self.texture_width or height > self.texture_height:
+			self._allocate(max(width, self.texture_width),
+					max(height, self.texture_height))
+		self.width = width
+		self.height = height
+
+		address = data.__array_interface__['data'][0]
+		glBindTexture(GL_TEXTURE_2D, self.texture)
+		glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+		glPixelStorei(GL_UNPACK_ROW_LENGTH, pitch // self.bytes_per_pixel)
+		if self._pbos:
+			size = pitch * (height - 1) + width * self.bytes_per_pixel
+			pbo = self._pbos[self._next_pbo]
+			self._next_pbo = 1 - self._next_pbo
+			glBindBuffer(GL_PIXEL_UNPACK_BUFFER, pbo)
+			# Orphan the old storage rather than wait for the driver to be
+			# done with it.
+			glBufferData(GL_PIXEL_UNPACK_BUFFER, size, None, GL_STREAM_DRAW)
+			mapped = glMapBufferRange(GL_PIXEL_UNPACK_BUFFER, 0, size,
+					GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT)
+			ctypes.memmove(mapped, address, size)
+			glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+			glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, width, height, self.format,
+					self.type, ctypes.c_void_p(0))
+			glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+		else:
+			glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, width, height, self.format,
+					self.type, ctypes.c_void_p(address))
+		glPixelStorei(GL_UNPACK_ROW_LENGTH, 0)
+
+	def close(self):
+		"""
+		Delete the texture and buffers.
+		"""
+		glDeleteTextures([self.texture])
+		if self._pbos:
+			glDeleteBuffers(len(self._pbos), self._pbos)
+			self._pbos = []
+
+
+def set_video_refresh_cb(core, callback, use_pbo=False, pixel_format=None):
 	"""
 	Sets the callback that will handle updated video frames.
 
@@ -30,30 +124,27 @@ def set_video_refresh_cb(core, callback):
 
 		"textureH" is an integer, the height of the allocated texture in
 		pixels.
-	"""
-	# Allocate and configure our texture.
-	texture = glGenTextures(1)
-	glBindTexture(GL_TEXTURE_2D, texture)
 
-	def wrapper(data, width, height, hires, interlace, overscan, pitch):
-		# Extract the pixel data we want into a framebuffer.
-		frame_buf = ctypes.create_string_buffer(width * height * 2)
-		for y in xrange(height):
-			ctypes.memmove(
-					ctypes.addressof(frame_buf)     + (y * width * 2),
-					ctypes.addressof(data.contents) + (y * pitch * 2),
-					width * 2,
-				)
+	The frame is in the top-left corner of the texture, which is allocated
+	once at the game's maximum geometry. A game must be loaded, and an
+	OpenGL context current. "use_pbo" uploads through pixel buffer objects;
+	see StreamingTexture. "pixel_format" defaults to the one the core uses.
 
-		# Load our texture
-		glBindTexture(GL_TEXTURE_2D, texture)
-
-		glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_BGRA,
-				GL_UNSIGNED_SHORT_1_5_5_5_REV, frame_buf)
+	Returns the StreamingTexture frames are uploaded into.
+	"""
+	geometry = core._lib.retro_get_system_av_info().geometry
+	if pixel_format is None:
+		pixel_format = core.get_pixel_format()
+	texture = StreamingTexture(geometry.max_width, geometry.max_height,
+			pixel_format, use_pbo)
 
-		callback(texture, width, height, width, height)
+	def wrapper(data, width, height, pitch):
+		texture.upload(data, width, height, pitch)
+		callback(texture.texture, texture.width, texture.height,
+				texture.texture_width, texture.texture_height)
 
 	core.set_video_refresh_cb(wrapper)
+	return texture
 
 
 def load_shader_elem(filename):
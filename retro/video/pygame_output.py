@@ -1,9 +1,11 @@
 """
 Pygame output for libretro Video.
 """
-import pygame, ctypes
+import pygame, pygame.surfarray
 
-def set_video_refresh_cb(core, callback):
+from retro.video import convert
+
+def set_video_refresh_cb(core, callback, scale=True, pixel_format=None):
 	"""
 	Sets the callback that will handle updated video frames.
 
@@ -11,43 +13,77 @@ def set_video_refresh_cb(core, callback):
 	function should accept only one parameter:
 
 		"surf" is an instance of pygame.Surface containing the frame data.
+
+	If "scale" is true, hi-res frames (at least twice the game's base width)
+	are halved in width and interlaced frames (at least twice its base height)
+	are halved in height, so every frame has the same proportions. A game must
+	be loaded to tell which frames those are. "pixel_format" defaults to the
+	one the core uses.
+
+	The surfaces are reused for every frame of the same size, so "surf" is
+	only valid until the next frame; copy it if you need to keep it. When the
+	core repeats a frame, the previous surface is passed again.
 	"""
+	if scale:
+		geometry = core._lib.retro_get_system_av_info().geometry
+		base_width, base_height = geometry.base_width, geometry.base_height
+	if pixel_format is None:
+		pixel_format = core.get_pixel_format()
+
+	# Frame surfaces, with the RGB arrays frames are converted into, by
+	# (width, height), and scaled surfaces by (width, height, scaled width,
+	# scaled height).
+	surfaces = {}
+	scaled = {}
+	last = [None]
 
-	def wrapper(data, width, height, hires, interlace, overscan, pitch):
-		#print data, width, height, hires, interlace, overscan, pitch
-		#from sys import exit
-		#exit()
-		convsurf = pygame.Surface(
-			(pitch//2, height), depth=15, masks=(0x7c00, 0x03e0, 0x001f, 0)
-		)
-		surf = convsurf.subsurface((0,0,width,height))
-
-		# this try-except block works around a bug in pygame 1.9.1 on 64-bit hosts.
-		# http://archives.seul.org/pygame/users/Apr-2011/msg00069.html
-		# https://bitbucket.org/pygame/pygame/issue/109/bufferproxy-indexerror-exception-thrown
+	def frame_surface(width, height):
+		key = (width, height)
+		entry = surfaces.get(key)
+		if entry is None:
+			entry = (
+				pygame.Surface((width, height), depth=32),
+				convert.output_buffer(width, height),
+			)
+			surfaces[key] = entry
+		return entry
+
+	def scale_surface(surf, width, height, size):
+		key = (width, height) + size
+		target = scaled.get(key)
+		if target is None:
+			target = pygame.Surface(size, depth=32)
+			scaled[key] = target
 		try:
-			convsurf.get_buffer().write(ctypes.string_at(data,pitch*height), 0)
-		except IndexError:
-			return
+			pygame.transform.smoothscale(surf, size, target)
+		except ValueError:
+			pygame.transform.scale(surf, size, target)
+		return target
 
-		tryScale = False
+	def wrapper(data, width, height, pitch):
+		if data is None:
+			if last[0] is not None:
+				callback(last[0])
+			return
 
-		if hires:
-			width /= 2
-		#	tryScale = True
+		surf, rgb = frame_surface(width, height)
+		convert.convert(data, width, height, pitch, pixel_format, out=rgb)
 
-		if interlace:
-			height /= 2
-		#	tryScale = True
+		# Write the frame into the surface in place; the surface array is
+		# indexed by (x, y).
+		pixels = pygame.surfarray.pixels3d(surf)
+		pixels[...] = rgb.swapaxes(0, 1)
+		del pixels
 
-		if tryScale:
-			try:
-				surf = pygame.transform.smoothscale(surf.convert(),
-						(width,height))
-			except:
-				surf = pygame.transform.scale(surf,
-						(width,height))
+		if scale:
+			size = (
+				width//2 if width >= 2*base_width else width,
+				height//2 if height >= 2*base_height else height,
+			)
+			if size != (width, height):
+				surf = scale_surface(surf, width, height, size)
 
+		last[0] = surf
 		callback(surf)
 
 	core.set_video_refresh_cb(wrapper)
@@ -0,0 +1,201 @@
+"""
+Record the video of an EmulatedSystem to a file or an encoder.
+
+Frames are written as YUV4MPEG2 (Y4M), which most encoders and players read
+directly, or as raw RGB24 frames of a fixed size. To encode as you record,
+pass an encoder command line reading Y4M from its standard input, such as
+FFMPEG_COMMAND + ["output.mp4"].
+"""
+import subprocess
+import threading
+from fractions import Fraction
+
+try:
+	import queue
+except ImportError:
+	import Queue as queue
+
+import numpy
+
+from retro.video import convert
+
+Y4M = 'y4m'
+RGB24 = 'rgb24'
+
+FFMPEG_COMMAND = ['ffmpeg', '-loglevel', 'error', '-y', '-i', '-']
+
+_STOP = object()
+_REPEAT = object()
+
+
+def rgb_to_yuv(rgb, out):
+	"""
+	Convert a (height, width, 3) uint8 RGB array to planar studio-range
+	BT.601 YUV, stored in "out", a (3, height, width) uint8 array.
+	"""
+	r, g, b = [rgb[..., c].astype(numpy.int32) for c in range(3)]
+	out[0] = (66 * r + 129 * g + 25 * b + 128 >> 8) + 16
+	out[1] = (-38 * r - 74 * g + 112 * b + 128 >> 8) + 128
+	out[2] = (112 * r - 94 * g - 18 * b + 128 >> 8) + 128
+	return out
+
+
+class VideoRecorder(object):
+	"""
+	Records every video frame of an EmulatedSystem, including duped ones.
+
+	Each frame is copied out of the core's buffer in one go, and everything
+	else (conversion, scaling and writing) happens on a background thread.
+	At most "queue_size" frames wait to be written; if the writer falls
+	further behind, emulation waits for it.
+
+	Frames are scaled to "width" by "height" pixels, by default the game's
+	maximum geometry, with nearest-neighbour sampling. Y4M output is
+	4:4:4, so no colour resolution is lost.
+
+	Call close() to write the remaining frames and finish the output.
+	"""
+	def __init__(self, core, filenameOrHandle=None, format=Y4M, command=None,
+			width=None, height=None, queue_size=32, pixel_format=None):
+		"""
+		Start recording the given EmulatedSystem, which must have a game
+		loaded.
+
+		The frames are written to "filenameOrHandle", a filename or
+		a file-handle opened in "wb" mode, or to the standard input of the
+		encoder started with the command line "command".
+
+		"pixel_format" defaults to the one the core uses.
+		"""
+		av_info = core._lib.retro_get_system_av_info()
+		if width is None:
+			width = av_info.geometry.max_width
+		if height is None:
+			height = av_info.geometry.max_height
+		self.width = width
+		self.height = height
+		self.format = format
+		if pixel_format is None:
+			pixel_format = core.get_pixel_format()
+		self.pixel_format = pixel_format
+		self.fps = Fraction(int(round(av_info.timing.fps * 1000)), 1000)
+
+		self._process = None
+		if command is not None:
+			self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+			self._handle = self._process.stdin
+		elif isinstance(filenameOrHandle, basestring):
+			self._handle = open(filenameOrHandle, 'wb')
+		else:
+			self._handle = filenameOrHandle
+
+		if format == Y4M:
+			self._handle.write("YUV4MPEG2 W%d H%d F%d:%d Ip A1:1 C444\n" % (
+					width, height, self.fps.numerator, self.fps.denominator))
+		elif format != RGB24:
+			raise ValueError("Unknown format %r" % (format,))
+
+		self._free = queue.Queue()
+		for _ in range(queue_size):
+			self._free.put(numpy.empty(0, numpy.uint8))
+		self._full = queue.Queue(queue_size)
+
+		# Written by the writer thread only.
+		self._rgb = numpy.zeros((height, width, 3), numpy.uint8)
+		self._yuv = numpy.zeros((3, height, width), numpy.uint8)
+		self._scale_indexes = {}
+		self._converted = {}
+
+		self.frames = 0
+		self.dupes = 0
+		self._error = None
+		self._writer = threading.Thread(target=self._write_loop)
+		self._writer.daemon = True
+		self._writer.start()
+
+		self._core = core
+		core.set_video_refresh_cb(self._refresh)
+
+	def _refresh(self, data, width, height, pitch):
+		self._check_writer()
+		self.frames += 1
+		if data is None:
+			self.dupes += 1
+			self._full.put(_REPEAT)
+			return
+
+		# The whole frame, rows and padding, as it is in the core's buffer.
+		frame = convert.frame_bytes(data, width, height, pitch,
+				self.pixel_format)
+		slot = self._free.get()
+		if len(slot) < len(frame):
+			slot = numpy.empty(pitch * height, numpy.uint8)
+		slot[:len(frame)] = frame
+		self._full.put((slot, width, height, pitch))
+
+	def _scale(self, width, height):
+		"""
+		Return the rows and columns of a frame of the given size to sample for
+		each output pixel.
+		"""
+		indexes = self._scale_indexes.get((width, height))
+		if indexes is None:
+			rows = numpy.arange(self.height) * height // self.height
+			columns = numpy.arange(self.width) * width // self.width
+			indexes = (rows[:, None], columns[None, :])
+			self._scale_indexes[(width, height)] = indexes
+		return indexes
+
+	def _write_frame(self, slot, width, height, pitch):
+		rgb = self._converted.get((width, height))
+		if rgb is None:
+			rgb = convert.output_buffer(width, height)
+			self._converted[(width, height)] = rgb
+		convert.convert(slot, width, height, pitch, self.pixel_format, out=rgb)
+		if (width, height) != (self.width, self.height):
+			rows, columns = self._scale(width, height)
+			self._rgb[...] = rgb[rows, columns]
+		else:
+			self._rgb[...] = rgb
+
+	def _output(self):
+		if self.format == Y4M:
+			self._handle.write("FRAME\n")
+			self._handle.write(rgb_to_yuv(self._rgb, self._yuv).data)
+		else:
+			self._handle.write(self._rgb.data)
+
+	def _write_loop(self):
+		while True:
+			item = self._full.get()
+			if item is _STOP:
+				return
+			try:
+				if item is not _REPEAT:
+					self._write_frame(*item)
+				self._output()
+			except Exception as e:
+				self._error = e
+			if item is not _REPEAT:
+				self._free.put(item[0])
+
+	def _check_writer(self):
+		if self._error is not None:
+			error, self._error = self._error, None
+			raise error
+
+	def close(self):
+		"""
+		Stop recording, write the remaining frames and close the output,
+		waiting for the encoder to finish if there is one.
+		"""
+		if self._writer is None:
+			return
+		self._core.set_video_refresh_cb(None)
+		self._full.put(_STOP)
+		self._writer.join()
+		self._writer = None
+		self._handle.close()
+		if self._process is not None:
+			self._process.wait()
+		self._check_writer()